@@ -8,7 +8,51 @@ GAME_VERSION = "3.2.1"
 # Screen settings
 SCREEN_WIDTH = 1600
 SCREEN_HEIGHT = 900
-FPS = 60
+FPS = 60  # Fixed simulation tick rate
+
+# Rendering
+RENDER_FPS_CAP = FPS * 2  # Max rendered frames per second; 0 = uncapped (busy-spins a core, for profiling only)
+VSYNC = False  # Sync presentation to the display refresh (uses a SCALED window)
+MAX_FRAME_TIME = 250  # ms of backlog simulated after a stall; anything older is dropped
+TIME_SCALE = 1.0  # Game time speed relative to real time (e.g. 10 or 100 to fast-forward)
+PROFILER_HISTORY = 240  # Frames in the profiler overlay graph (toggle with F3)
+TRACE_FILE = None  # Path to write a Chrome trace-event JSON of every frame to (open in ui.perfetto.dev)
+
+# Frame-time statistics (summary of every game, written at game over)
+FRAME_BUDGET_MS = 1000 / FPS  # Frames slower than this count as over budget
+FRAME_STATS_FILE = 'frame_stats.jsonl'  # History file the summaries are appended to, None to disable
+SHOW_FRAME_STATS = False  # Also show the summary on the game-over screen
+
+# Randomness
+# Seed for the gameplay/cosmetic/asset random streams; None picks a new one each launch.
+# With ASSET_CACHE_DIR set, the sprite art drawn from the asset stream is cached, so unseeded
+# launches keep the art of the first one (each fixed seed gets its own cache file)
+RNG_SEED = None
+
+# Input Recording (replay with: python -m src.sim.replay <file>)
+RECORD_INPUT = False  # Save the input of every game to RECORDINGS_DIR
+RECORDINGS_DIR = 'recordings'
+
+# Background
+# Star count multiplier for the parallax starfield (1.0 = 300 stars at 1600x900)
+STAR_DENSITY = 1.0
+
+# Object Pools (idle killed sprites kept for reuse)
+BULLET_POOL_SIZE = 256
+ENEMY_PROJECTILE_POOL_SIZE = 256
+
+# Collisions
+COLLISION_CELL_SIZE = 64  # Spatial hash cell size in pixels (>= most sprite sizes)
+
+# Rendering caches
+ROTATION_CACHE_SIZE = 256  # Rotated surfaces kept before LRU eviction
+ROTATION_ANGLE_STEP = 2  # Degrees per rotation cache bucket
+MISSILE_EXPLOSION_SCALE = 4  # Missile shockwave is drawn at 1/4 resolution and scaled up
+TEXT_CACHE_BYTES = 8 * 1024 * 1024  # Pixel memory of rendered text kept before LRU eviction
+# Generated sprites are kept between launches in the user cache directory ($XDG_CACHE_HOME or ~/.cache);
+# $SPACE_TRAVEL_ASSET_CACHE overrides it, and an empty value or None disables the cache
+_user_cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+ASSET_CACHE_DIR = os.environ.get('SPACE_TRAVEL_ASSET_CACHE', os.path.join(_user_cache_dir, 'space_travel')) or None
 
 # Colors
 WHITE = (255, 255, 255)
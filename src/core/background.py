@@ -1,49 +1,33 @@
 import pygame
-import random
 import math
 from src.config import *
-from src.utils.graphics import GraphicsGenerator
+from src.core.starfield import Starfield
+from src.utils.rotation_cache import rotation_cache
+from src.core.clock import system_clock
+from src.core.rng import streams
+from src.utils.helpers import convert_surface
 
 class Background:
-    def __init__(self):
-        self.stars = []
+    def __init__(self, clock=None, rng=None):
+        self.clock = clock or system_clock
+        self.rng = rng or streams.cosmetic
         self.layers = 3
         
-        # Initialize stars with twinkling effect
-        for i in range(self.layers):
-            num_stars = 50 * (i + 1)
-            speed = (i + 1) * 0.5
-            layer_stars = []
-            for _ in range(num_stars):
-                x = random.randint(0, SCREEN_WIDTH)
-                y = random.randint(0, SCREEN_HEIGHT)
-                size = random.randint(1, 3)
-                brightness = random.randint(150, 255)
-                # Create star surface once
-                img = GraphicsGenerator.draw_star(size, brightness)
-                layer_stars.append({
-                    'x': x, 
-                    'y': y, 
-                    'speed': speed, 
-                    'img': img,
-                    'brightness': brightness,
-                    'size': size,
-                    'twinkle_timer': random.randint(0, 100),
-                    'twinkle_speed': random.uniform(0.02, 0.08)
-                })
-            self.stars.append(layer_stars)
+        # Twinkling parallax stars, updated and drawn in bulk
+        self.stars = Starfield(self.layers, STAR_DENSITY, self.rng)
             
         # Nebula/Dust (simple transparent shapes) - positioned relative to screen size
         self.nebulas = []
         for _ in range(3):
-            w = random.randint(int(SCREEN_WIDTH * 0.125), int(SCREEN_WIDTH * 0.25))
-            h = random.randint(int(SCREEN_HEIGHT * 0.22), int(SCREEN_HEIGHT * 0.44))
+            w = self.rng.randint(int(SCREEN_WIDTH * 0.125), int(SCREEN_WIDTH * 0.25))
+            h = self.rng.randint(int(SCREEN_HEIGHT * 0.22), int(SCREEN_HEIGHT * 0.44))
             surf = pygame.Surface((w, h), pygame.SRCALPHA)
-            color = (random.randint(0, 50), random.randint(0, 50), random.randint(50, 100), 30)
+            color = (self.rng.randint(0, 50), self.rng.randint(0, 50), self.rng.randint(50, 100), 30)
             pygame.draw.ellipse(surf, color, (0, 0, w, h))
+            surf = convert_surface(surf)
             self.nebulas.append({
-                'x': random.randint(0, SCREEN_WIDTH), 
-                'y': random.randint(0, SCREEN_HEIGHT), 
+                'x': self.rng.randint(0, SCREEN_WIDTH), 
+                'y': self.rng.randint(0, SCREEN_HEIGHT), 
                 'img': surf, 
                 'speed': 0.2
             })
@@ -51,25 +35,25 @@ class Background:
         # Meteors - dynamic effects
         self.meteors = []
         self.meteor_spawn_timer = 0
-        self.meteor_spawn_interval = random.randint(3000, 6000)  # Spawn every 3-6 seconds
+        self.meteor_spawn_interval = self.rng.randint(3000, 6000)  # Spawn every 3-6 seconds
 
     def spawn_meteor(self):
         """Spawn a meteor at a random position"""
         # Start from top or right side
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             # From top
-            x = random.randint(int(SCREEN_WIDTH * 0.2), int(SCREEN_WIDTH * 0.8))
+            x = self.rng.randint(int(SCREEN_WIDTH * 0.2), int(SCREEN_WIDTH * 0.8))
             y = -20
         else:
             # From right side
             x = SCREEN_WIDTH + 20
-            y = random.randint(0, int(SCREEN_HEIGHT * 0.5))
+            y = self.rng.randint(0, int(SCREEN_HEIGHT * 0.5))
         
         # Meteor properties
-        length = random.randint(30, 80)
-        width = random.randint(3, 8)
-        speed_x = random.uniform(-2, -8)
-        speed_y = random.uniform(2, 6)
+        length = self.rng.randint(30, 80)
+        width = self.rng.randint(3, 8)
+        speed_x = self.rng.uniform(-2, -8)
+        speed_y = self.rng.uniform(2, 6)
         
         # Create meteor surface
         meteor_surf = pygame.Surface((length, width), pygame.SRCALPHA)
@@ -87,6 +71,7 @@ class Background:
             else:
                 color = (255, 150, 50, alpha)   # Orange tail
             pygame.draw.line(meteor_surf, color, (i, width // 2), (i, width // 2))
+        meteor_surf = convert_surface(meteor_surf)
         
         self.meteors.append({
             'x': x,
@@ -99,33 +84,23 @@ class Background:
         })
 
     def update(self):
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         
         # Update stars with twinkling
-        for layer in self.stars:
-            for star in layer:
-                star['y'] += star['speed']
-                if star['y'] > SCREEN_HEIGHT:
-                    star['y'] = 0
-                    star['x'] = random.randint(0, SCREEN_WIDTH)
-                
-                # Twinkling effect
-                star['twinkle_timer'] += star['twinkle_speed']
-                twinkle_brightness = int(star['brightness'] * (0.7 + 0.3 * math.sin(star['twinkle_timer'])))
-                star['img'] = GraphicsGenerator.draw_star(star['size'], twinkle_brightness)
+        self.stars.update()
                     
         # Update nebulas
         for nebula in self.nebulas:
             nebula['y'] += nebula['speed']
             if nebula['y'] > SCREEN_HEIGHT:
                 nebula['y'] = -nebula['img'].get_height()
-                nebula['x'] = random.randint(0, SCREEN_WIDTH)
+                nebula['x'] = self.rng.randint(0, SCREEN_WIDTH)
         
         # Spawn meteors
         if current_time - self.meteor_spawn_timer > self.meteor_spawn_interval:
             self.spawn_meteor()
             self.meteor_spawn_timer = current_time
-            self.meteor_spawn_interval = random.randint(3000, 6000)
+            self.meteor_spawn_interval = self.rng.randint(3000, 6000)
         
         # Update meteors
         meteors_to_remove = []
@@ -149,13 +124,11 @@ class Background:
             screen.blit(nebula['img'], (int(nebula['x']), int(nebula['y'])))
             
         # Draw stars
-        for layer in self.stars:
-            for star in layer:
-                screen.blit(star['img'], (int(star['x']), int(star['y'])))
+        self.stars.draw(screen)
         
         # Draw meteors
         for meteor in self.meteors:
-            # Rotate and draw
-            rotated = pygame.transform.rotate(meteor['img'], meteor['angle'])
+            # Rotate (cached, the angle never changes) and draw
+            rotated = rotation_cache.get(meteor['img'], meteor['angle'])
             rect = rotated.get_rect(center=(int(meteor['x']), int(meteor['y'])))
             screen.blit(rotated, rect)
@@ -0,0 +1,68 @@
+import pygame
+
+class GameClock:
+    """
+    Time source for gameplay timers (shot delays, spawn timers, invincibility,
+    meteor and blink timers).
+
+    Without a `time_source` this is a manual clock: game time only advances
+    when step() is called, once per simulation tick, by whoever drives the
+    loop (Game.run or a headless runner). With a `time_source` such as
+    pygame.time.get_ticks the clock follows real time instead.
+
+    While paused game time stands still, so timers need no bookkeeping
+    around a pause. `time_scale` is how fast Game.run feeds ticks relative
+    to real time (e.g. 10 or 100 to fast-forward).
+    """
+
+    def __init__(self, time_source=None, time_scale=1.0, start=0.0):
+        self.time_source = time_source
+        self.time_scale = time_scale
+        self.paused = False
+        self.tick_count = 0
+        self._time = start
+        self._pause_start = 0
+        self._paused_total = 0
+
+    @property
+    def manual(self):
+        return self.time_source is None
+
+    @property
+    def time(self):
+        """Exact manual game time in (fractional) milliseconds."""
+        return self._time
+
+    def get_ticks(self):
+        """Milliseconds of game time, like pygame.time.get_ticks()."""
+        if self.time_source is None:
+            # Epsilon absorbs float drift from summing 1000/FPS steps
+            return int(self._time + 1e-6)
+        if self.paused:
+            return self._pause_start - self._paused_total
+        return self.time_source() - self._paused_total
+
+    def step(self, ms):
+        """Count one simulation tick; a manual clock also advances by `ms` milliseconds."""
+        if self.paused:
+            return
+        if self.time_source is None:
+            self._time += ms
+        self.tick_count += 1
+
+    def pause(self):
+        if self.paused:
+            return
+        self.paused = True
+        if self.time_source is not None:
+            self._pause_start = self.time_source()
+
+    def resume(self):
+        if not self.paused:
+            return
+        self.paused = False
+        if self.time_source is not None:
+            self._paused_total += self.time_source() - self._pause_start
+
+# Real-time clock for entities created without one (e.g. standalone in tests)
+system_clock = GameClock(pygame.time.get_ticks)
@@ -0,0 +1,43 @@
+from src.config import *
+
+def below_screen(sprite):
+    """Exit rule for entities that drift down past the bottom edge."""
+    return sprite.rect.top > SCREEN_HEIGHT
+
+class Culler:
+    """
+    Off-screen culling stage for the scene's sprite groups.
+
+    Each tracked group has a name and an optional exit rule. cull() removes
+    every sprite whose rule fires in a single pass and reports how many
+    were removed per type; live_counts() reports the current group sizes so
+    entity growth over a long session can be watched.
+    """
+
+    def __init__(self):
+        self.tracked = []  # (name, group, exit_rule or None)
+        self.total_culled = {}
+
+    def track(self, name, group, exit_rule=None):
+        self.tracked.append((name, group, exit_rule))
+        self.total_culled.setdefault(name, 0)
+
+    def cull(self):
+        """Kill every sprite past its exit; returns {name: count} for this pass."""
+        culled = {}
+        for name, group, exit_rule in self.tracked:
+            if exit_rule is None:
+                continue
+            gone = [sprite for sprite in group if exit_rule(sprite)]
+            if gone:
+                for sprite in gone:
+                    sprite.kill()
+                culled[name] = len(gone)
+                self.total_culled[name] += len(gone)
+        return culled
+
+    def live_counts(self):
+        return {name: len(group) for name, group, _ in self.tracked}
+
+    def stats(self):
+        return {'live': self.live_counts(), 'culled': dict(self.total_culled)}
@@ -0,0 +1,64 @@
+import json
+import math
+import time
+from array import array
+
+def percentiles(values, fractions):
+    """Nearest-rank percentiles of `values` for each fraction (0..1)."""
+    ordered = sorted(values)
+    return [ordered[max(0, math.ceil(fraction * len(ordered)) - 1)] for fraction in fractions]
+
+def summarize(values, budget_ms):
+    p50, p95, p99 = percentiles(values, (0.5, 0.95, 0.99))
+    return {
+        'frames': len(values),
+        'p50': round(p50, 3),
+        'p95': round(p95, 3),
+        'p99': round(p99, 3),
+        'max': round(max(values), 3),
+        'over_budget': sum(1 for ms in values if ms > budget_ms)
+    }
+
+class FrameStats:
+    """
+    Frame times of one game, filed under the level they were played at.
+    Kept as compact float arrays, so even hours of uncapped frames stay
+    small.
+    """
+
+    def __init__(self, budget_ms):
+        self.budget_ms = budget_ms
+        self.levels = {}
+
+    def record(self, frame_ms, level):
+        times = self.levels.get(level)
+        if times is None:
+            times = self.levels[level] = array('d')
+        times.append(frame_ms)
+
+    @property
+    def frames(self):
+        return sum(len(times) for times in self.levels.values())
+
+    def report(self, **info):
+        """
+        Percentiles, max and over-budget count for the whole game and per
+        level, plus whatever `info` (score, seed, ...) to file alongside.
+        """
+        every = array('d')
+        for times in self.levels.values():
+            every.extend(times)
+        report = {'time': time.strftime('%Y-%m-%dT%H:%M:%S'), **info, 'budget_ms': round(self.budget_ms, 3)}
+        report.update(summarize(every, self.budget_ms))
+        report['levels'] = {str(level): summarize(times, self.budget_ms)
+                            for level, times in sorted(self.levels.items())}
+        return report
+
+def append_history(path, report):
+    """Add a report as one line of the JSONL history file."""
+    with open(path, 'a') as f:
+        f.write(json.dumps(report) + '\n')
+
+def load_history(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
@@ -1,27 +1,60 @@
 import pygame
 import sys
+import os
+import time
 from src.config import *
 from src.utils.asset_manager import AssetManager
 from src.core.state_manager import StateManager
+from src.core.clock import GameClock
+from src.core.rng import streams
+from src.core.profiler import FrameProfiler, null_timer
+from src.core.trace import Tracer, null_tracer
 from src.database.db_manager import DBManager
 from src.scenes.welcome_scene import WelcomeScene
+from src.scenes.game_scene import GameScene
+from src.sim.recording import InputRecorder
+from src.ui.profiler_overlay import ProfilerOverlay
 
 class Game:
     def __init__(self):
         pygame.init()
         pygame.mixer.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        if VSYNC:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED, vsync=1)
+        else:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Space Travel | Naro Chan Dev")
         
-        self.clock = pygame.time.Clock()
+        self.frame_clock = pygame.time.Clock()
+        # Game time, advanced once per simulation tick
+        self.clock = GameClock(time_scale=TIME_SCALE)
+        self.tick_ms = 1000 / FPS
         self.running = True
         
+        # Seeded random streams; asset generation draws from them too
+        self.rng = streams
+        self.rng.reseed(RNG_SEED)
+        
         self.asset_manager = AssetManager()
+        self.asset_manager.convert_assets()
         pygame.display.set_icon(self.asset_manager.get_asset('spaceship_img'))
         
         self.db_manager = DBManager()
         self.state_manager = StateManager(self)
         
+        # Frame timeline trace (TRACE_FILE)
+        self.tracer = Tracer(TRACE_FILE) if TRACE_FILE else null_tracer
+        self.state_manager.trace = self.tracer
+        
+        # Input recording of the current GameScene (RECORD_INPUT)
+        self.recorder = None
+        self.recorded_scene = None
+        
+        # Frame profiler overlay (F3); scenes only time their phases while it is shown
+        self.profiler = FrameProfiler(PROFILER_HISTORY)
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
+        self.show_profiler = False
+        
         # Start music
         self.asset_manager.play_music()
         
@@ -29,19 +62,116 @@ class Game:
         self.state_manager.change_scene(WelcomeScene(self))
 
     def run(self):
+        """
+        Fixed-timestep loop: the simulation advances in steps of 1/FPS
+        seconds while rendering runs as fast as RENDER_FPS_CAP/VSYNC allow.
+        When a frame takes too long, the missed ticks are run back to back
+        and renders are skipped instead. Real time is multiplied by the
+        clock's time_scale, so a scale of 10 runs ten ticks per 1/FPS.
+        """
+        accumulator = 0.0
+        previous_time = time.perf_counter()
+        
+        tracer = self.tracer
         while self.running:
+            now = time.perf_counter()
+            frame_ms = (now - previous_time) * 1000
+            accumulator += min(frame_ms, MAX_FRAME_TIME) * self.clock.time_scale
+            previous_time = now
+            if self.show_profiler:
+                self.profiler.end_frame(frame_ms)
+            if isinstance(self.state_manager.current_scene, GameScene):
+                self.state_manager.current_scene.frame_stats.record(frame_ms, self.state_manager.current_scene.level)
+            tracer.push('frame', 'frame')
+            
             events = pygame.event.get()
             for event in events:
                 if event.type == pygame.QUIT:
+                    self.stop_recording()
+                    self.tracer.close()
                     self.running = False
                     self.db_manager.close_connection()
                     pygame.quit()
                     sys.exit()
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.toggle_profiler()
+            
+            phases = self.profiler if self.show_profiler else null_timer
+            if tracer.enabled:
+                # Phases become trace spans too, still feeding the overlay
+                tracer.timer = phases
+                phases = tracer
+            
+            if RECORD_INPUT:
+                self.update_recording()
+            if self.recorder:
+                self.recorder.record_events(events)
             
             if self.state_manager.current_scene:
-                self.state_manager.current_scene.process_input(events)
-                self.state_manager.current_scene.update()
-                self.state_manager.current_scene.render(self.screen)
+                scene = self.state_manager.current_scene
+                scene.phases = phases
+                tracer.push(f'{type(scene).__name__}.process_input')
+                scene.process_input(events)
+                tracer.pop()
             
+            # A game started by this input is recorded from its first tick
+            if RECORD_INPUT:
+                self.update_recording()
+            
+            # Simulate every tick that is due
+            while accumulator >= self.tick_ms:
+                self.clock.step(self.tick_ms)
+                if self.recorder:
+                    self.recorder.record_keys(pygame.key.get_pressed())
+                if self.state_manager.current_scene:
+                    scene = self.state_manager.current_scene
+                    scene.phases = phases
+                    tracer.push(f'{type(scene).__name__}.update')
+                    scene.update()
+                    tracer.pop()
+                if self.recorder:
+                    self.recorder.end_tick()
+                accumulator -= self.tick_ms
+            
+            if self.state_manager.current_scene:
+                scene = self.state_manager.current_scene
+                # Fraction of the way to the next tick, for smooth motion between ticks
+                scene.interpolation = accumulator / self.tick_ms
+                scene.phases = phases
+                tracer.push(f'{type(scene).__name__}.render')
+                scene.render(self.screen)
+                tracer.pop()
+            
+            if self.show_profiler:
+                phases.mark('overlay')
+                self.profiler_overlay.draw(self.screen, self.state_manager.current_scene)
+            
+            phases.mark('display')
             pygame.display.update()
-            self.clock.tick(FPS)
+            phases.end()
+            self.frame_clock.tick(RENDER_FPS_CAP)
+            tracer.pop()
+
+    def toggle_profiler(self):
+        self.show_profiler = not self.show_profiler
+        # Start the graph fresh rather than from frames timed before it was hidden
+        self.profiler.clear()
+
+    def update_recording(self):
+        """Start recording when a GameScene begins and save it when the scene ends."""
+        scene = self.state_manager.current_scene
+        if scene is self.recorded_scene:
+            return
+        self.stop_recording()
+        if isinstance(scene, GameScene):
+            self.recorder = InputRecorder(scene.seed, scene.start_time)
+            self.recorded_scene = scene
+
+    def stop_recording(self):
+        if self.recorder is None:
+            return
+        os.makedirs(RECORDINGS_DIR, exist_ok=True)
+        name = time.strftime('%Y%m%d-%H%M%S') + f'-{self.recorder.recording.seed}.stir'
+        self.recorder.recording.save(os.path.join(RECORDINGS_DIR, name))
+        self.recorder = None
+        self.recorded_scene = None
@@ -0,0 +1,54 @@
+class SpritePool:
+    """
+    Free list of killed sprites that can be handed out again.
+
+    `factory` builds a new sprite from the acquire() arguments on a miss;
+    on a hit a recycled instance is re-initialised with its reset() method
+    instead. Pooled sprites return themselves here when killed (see
+    Entity.kill). At most `max_size` idle sprites are kept.
+    """
+
+    def __init__(self, factory, max_size):
+        self.factory = factory
+        self.max_size = max_size
+        self._free = []
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self._free)
+
+    def acquire(self, *args):
+        if self._free:
+            sprite = self._free.pop()
+            sprite.in_pool = False
+            sprite.reset(*args)
+            self.hits += 1
+        else:
+            sprite = self.factory(*args)
+            sprite.pool = self
+            sprite.in_pool = False
+            self.misses += 1
+        return sprite
+
+    def release(self, sprite):
+        if sprite.in_pool:
+            return  # Already returned, e.g. killed twice
+        if len(self._free) >= self.max_size:
+            # Pool is full; let this one be garbage collected
+            sprite.pool = None
+            self.dropped += 1
+            return
+        sprite.in_pool = True
+        self._free.append(sprite)
+
+    def stats(self):
+        acquired = self.hits + self.misses
+        return {
+            'free': len(self._free),
+            'hits': self.hits,
+            'misses': self.misses,
+            'dropped': self.dropped,
+            'hit_rate': self.hits / acquired if acquired else 0.0
+        }
@@ -0,0 +1,83 @@
+import time
+from collections import deque
+
+class PhaseTimer:
+    """
+    Wall-clock time per named phase of a frame (spawning, collisions, ...).
+
+    Code marks where each phase begins with mark(name); the time until the
+    next mark (or end()) is added to that phase. One perf_counter() call
+    per boundary keeps it cheap enough to leave on for whole runs.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.totals = {}
+        self.counts = {}
+        self._phase = None
+        self._start = 0.0
+
+    def mark(self, name):
+        now = time.perf_counter()
+        if self._phase is not None:
+            self.totals[self._phase] = self.totals.get(self._phase, 0.0) + now - self._start
+            self.counts[self._phase] = self.counts.get(self._phase, 0) + 1
+        self._phase = name
+        self._start = now
+
+    def end(self):
+        self.mark(None)
+
+    def reset(self):
+        self.totals.clear()
+        self.counts.clear()
+        self._phase = None
+
+    def average_ms(self):
+        """Mean milliseconds per occurrence of each phase."""
+        return {name: self.totals[name] * 1000 / self.counts[name] for name in self.totals}
+
+class FrameProfiler(PhaseTimer):
+    """
+    PhaseTimer that keeps a rolling window of whole frames: each
+    end_frame() files the frame time and the milliseconds every phase took
+    during that frame, then starts the next frame from zero.
+    """
+
+    def __init__(self, history=240):
+        super().__init__()
+        self.frame_times = deque(maxlen=history)
+        self.frame_phases = deque(maxlen=history)
+
+    def end_frame(self, frame_ms):
+        self.end()
+        self.frame_times.append(frame_ms)
+        self.frame_phases.append({name: total * 1000 for name, total in self.totals.items()})
+        self.reset()
+
+    def recent_ms(self):
+        """Mean milliseconds per frame of each phase over the window (0 in frames it did not run)."""
+        totals = {}
+        for phases in self.frame_phases:
+            for name, ms in phases.items():
+                totals[name] = totals.get(name, 0.0) + ms
+        return {name: total / len(self.frame_phases) for name, total in totals.items()}
+
+    def clear(self):
+        self.reset()
+        self.frame_times.clear()
+        self.frame_phases.clear()
+
+class NullPhaseTimer:
+    """Stand-in used when nothing is profiling; every call is a no-op."""
+
+    enabled = False
+
+    def mark(self, name):
+        pass
+
+    def end(self):
+        pass
+
+null_timer = NullPhaseTimer()
@@ -0,0 +1,38 @@
+import random
+
+class RandomStreams:
+    """
+    Independent, seedable random streams for each subsystem.
+
+    `gameplay` drives spawning, positions and boss stats, `cosmetic` drives
+    the background and other visuals, and `assets` drives procedural asset
+    generation. Each stream is seeded from the master seed and its name, so
+    drawing more or fewer cosmetic numbers never shifts gameplay. With the
+    same seed and the same inputs, a game plays out identically.
+    """
+
+    NAMES = ('gameplay', 'cosmetic', 'assets')
+
+    def __init__(self, seed=None):
+        self.gameplay = random.Random()
+        self.cosmetic = random.Random()
+        self.assets = random.Random()
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """
+        Restart every stream from `seed` (a fresh random seed if None). The
+        stream objects are reseeded in place, so references stay valid.
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        for name in self.NAMES:
+            getattr(self, name).seed(f"{seed}:{name}")
+
+    def new_seed(self):
+        """Seed for the next game, drawn from the gameplay stream."""
+        return self.gameplay.getrandbits(32)
+
+# Shared streams, reseeded by Game (RNG_SEED) or a headless run
+streams = RandomStreams()
@@ -0,0 +1,96 @@
+from src.config import *
+
+class SpatialHash:
+    """
+    Uniform-grid broadphase for sprite collisions.
+
+    Sprites are bucketed by the grid cells their rects overlap, tagged with
+    the group they were inserted from. Queries only test sprites sharing a
+    cell with the query rect and return hits in insertion order, so the
+    results match pygame.sprite.spritecollide() / groupcollide() over the
+    same groups.
+    """
+
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        # group -> {(cell_x, cell_y): ([order, ...], [sprite, ...], [rect, ...])}
+        self.cells = {}
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        self.cells.clear()
+        self._count = 0
+
+    def _cell_range(self, rect):
+        size = self.cell_size
+        return (rect.left // size, (rect.right - 1) // size,
+                rect.top // size, (rect.bottom - 1) // size)
+
+    def insert(self, sprite, group=None):
+        order = self._count
+        self._count += 1
+        rect = sprite.rect
+        cells = self.cells.get(group)
+        if cells is None:
+            cells = self.cells[group] = {}
+        x0, x1, y0, y1 = self._cell_range(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = ([order], [sprite], [rect])
+                else:
+                    bucket[0].append(order)
+                    bucket[1].append(sprite)
+                    bucket[2].append(rect)
+
+    def rebuild(self, *groups):
+        """Re-index every sprite of `groups`; call once per frame after movement."""
+        self.clear()
+        for group in groups:
+            for sprite in group:
+                self.insert(sprite, group)
+
+    def query(self, rect, group=None):
+        """Live sprites indexed from `group` overlapping `rect`, in insertion order."""
+        cells = self.cells.get(group)
+        if not cells:
+            return []
+        found = {}
+        x0, x1, y0, y1 = self._cell_range(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                orders, sprites, _ = bucket
+                # Narrowphase rect tests run in C over the whole cell
+                for i in rect.collidelistall(bucket[2]):
+                    order = orders[i]
+                    if order not in found and sprites[i].alive():
+                        found[order] = sprites[i]
+        if len(found) > 1:
+            return [found[order] for order in sorted(found)]
+        return list(found.values())
+
+    def spritecollide(self, sprite, group, dokill):
+        """Grid-backed equivalent of pygame.sprite.spritecollide(sprite, group, dokill)."""
+        hits = self.query(sprite.rect, group)
+        if dokill:
+            for hit in hits:
+                hit.kill()
+        return hits
+
+    def groupcollide(self, groupa, groupb, dokilla, dokillb):
+        """Grid-backed equivalent of pygame.sprite.groupcollide(); `groupb` must be indexed."""
+        crashed = {}
+        for sprite in groupa.sprites():
+            hits = self.spritecollide(sprite, groupb, dokillb)
+            if hits:
+                crashed[sprite] = hits
+                if dokilla:
+                    sprite.kill()
+        return crashed
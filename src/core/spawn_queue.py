@@ -0,0 +1,25 @@
+class SpawnQueue:
+    """
+    Sprites spawned by entities during a frame, waiting to join the scene.
+
+    Entities push what they create (e.g. enemy projectiles) instead of
+    keeping it to themselves; the scene drains the queue once per frame and
+    adds each sprite to its groups exactly once.
+    """
+
+    def __init__(self):
+        self._pending = []
+        self.total_spawned = 0
+
+    def __len__(self):
+        return len(self._pending)
+
+    def push(self, sprite):
+        self._pending.append(sprite)
+        self.total_spawned += 1
+
+    def drain(self):
+        """Return everything pushed since the last drain and empty the queue."""
+        pending = self._pending
+        self._pending = []
+        return pending
@@ -0,0 +1,115 @@
+import numpy as np
+from src.config import *
+from src.utils.graphics import GraphicsGenerator
+from src.core.rng import streams
+from src.utils.helpers import convert_surface
+
+class TwinkleCache:
+    """
+    Star sprites pre-rendered for every (size, quantized brightness) pair.
+
+    The table is built on first use and shared by every Background, so the
+    twinkle animation only swaps which cached surface a star points at.
+    """
+    LEVELS = 32
+    SIZES = (1, 2, 3)
+    _sprites = None
+    _table = None
+
+    @classmethod
+    def build(cls):
+        cls._sprites = {}
+        for size in cls.SIZES:
+            for level in range(cls.LEVELS):
+                brightness = round(level * 255 / (cls.LEVELS - 1))
+                cls._sprites[(size, level)] = convert_surface(GraphicsGenerator.draw_star(size, brightness))
+        # Flat view indexed by (size - 1) * LEVELS + level for vectorized lookups
+        cls._table = [cls._sprites[(size, level)] for size in cls.SIZES for level in range(cls.LEVELS)]
+
+    @classmethod
+    def quantize(cls, brightness):
+        """Map a 0-255 brightness to its cache level."""
+        return max(0, min(cls.LEVELS - 1, brightness * (cls.LEVELS - 1) // 255))
+
+    @classmethod
+    def get(cls, size, brightness):
+        if cls._sprites is None:
+            cls.build()
+        return cls._sprites[(size, cls.quantize(brightness))]
+
+    @classmethod
+    def table(cls):
+        if cls._table is None:
+            cls.build()
+        return cls._table
+
+
+class StarLayer:
+    """One parallax layer of stars stored as parallel NumPy arrays."""
+
+    def __init__(self, count, speed, np_rng):
+        self.count = count
+        self.speed = speed
+        self.x = np_rng.integers(0, SCREEN_WIDTH + 1, count).astype(np.float32)
+        self.y = np_rng.integers(0, SCREEN_HEIGHT + 1, count).astype(np.float32)
+        self.size = np_rng.integers(1, 4, count)
+        self.brightness = np_rng.integers(150, 256, count).astype(np.float32)
+        self.phase = np_rng.integers(0, 101, count).astype(np.float32)
+        self.twinkle_speed = np_rng.uniform(0.02, 0.08, count).astype(np.float32)
+        # Index into TwinkleCache.table() for each star
+        self.sprite_index = np.zeros(count, dtype=np.intp)
+        self._size_offset = (self.size - 1) * TwinkleCache.LEVELS
+
+
+class Starfield:
+    """
+    Multi-layer parallax starfield advanced with vectorized NumPy math.
+
+    Every layer keeps positions, speeds and twinkle phases in arrays and is
+    submitted to the screen with a single batched blit call.
+    """
+
+    def __init__(self, layers=3, density=1.0, rng=None):
+        self.np_rng = np.random.default_rng((rng or streams.cosmetic).getrandbits(64))
+        self.layers = []
+        for i in range(layers):
+            count = round(50 * (i + 1) * density)
+            speed = (i + 1) * 0.5
+            self.layers.append(StarLayer(count, speed, self.np_rng))
+        self.update_sprites()
+
+    def __len__(self):
+        return sum(layer.count for layer in self.layers)
+
+    def update(self):
+        for layer in self.layers:
+            layer.y += layer.speed
+
+            # Wrap stars that left the bottom back to the top at a new column
+            wrapped = layer.y > SCREEN_HEIGHT
+            if wrapped.any():
+                layer.y[wrapped] = 0
+                layer.x[wrapped] = self.np_rng.integers(0, SCREEN_WIDTH + 1, int(wrapped.sum()))
+
+            layer.phase += layer.twinkle_speed
+        self.update_sprites()
+
+    def update_sprites(self):
+        """Pick the twinkle cache sprite for every star's current brightness."""
+        top = TwinkleCache.LEVELS - 1
+        for layer in self.layers:
+            brightness = (layer.brightness * (0.7 + 0.3 * np.sin(layer.phase))).astype(np.int32)
+            levels = np.clip(brightness * top // 255, 0, top)
+            np.add(layer._size_offset, levels, out=layer.sprite_index)
+
+    def draw(self, screen):
+        table = TwinkleCache.table()
+        # pygame-ce exposes the faster fblits(); plain pygame has blits()
+        fblits = getattr(screen, 'fblits', None)
+        for layer in self.layers:
+            sprites = [table[i] for i in layer.sprite_index.tolist()]
+            positions = zip(layer.x.astype(np.int32).tolist(), layer.y.astype(np.int32).tolist())
+            if fblits is not None:
+                fblits(zip(sprites, positions))
+            else:
+                screen.blits(zip(sprites, positions), doreturn=False)
@@ -1,7 +1,13 @@
+from src.core.trace import null_tracer
+
 class StateManager:
     def __init__(self, game):
         self.game = game
         self.current_scene = None
+        # Trace-event recorder handed to every scene (Game sets it when TRACE_FILE is on)
+        self.trace = null_tracer
 
     def change_scene(self, new_scene):
+        self.trace.instant('scene_change', {'scene': type(new_scene).__name__})
+        new_scene.trace = self.trace
         self.current_scene = new_scene
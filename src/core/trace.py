@@ -0,0 +1,139 @@
+"""
+Chrome trace-event recording of frame timelines.
+
+Tracer writes the JSON array flavour of the trace-event format, which
+chrome://tracing and ui.perfetto.dev open directly: begin/end ('B'/'E')
+spans for frames, scene methods and the phases scenes mark (nested in
+that order), and instant ('i') events for things like spawns and scene
+changes.
+
+Events are appended to an in-memory list as plain tuples; every
+`flush_every` events the list is handed to a background thread that
+formats and writes it, so the frame being measured only pays for the
+appends.
+"""
+
+import json
+import queue
+import threading
+import time
+
+class Tracer:
+    """
+    Trace-event writer. Also usable as a scene's phase timer: mark(name)
+    and end() turn into nested 'phase' spans and are passed on to `timer`
+    (e.g. the profiler overlay's FrameProfiler).
+    """
+
+    enabled = True
+
+    def __init__(self, path, flush_every=4096):
+        self.path = path
+        self.flush_every = flush_every
+        self.timer = None
+        self.events = []
+        self._phase = None
+        self._depth = 0
+        self._origin = time.perf_counter()
+        self._queue = queue.Queue()
+        self._file = open(path, 'w')
+        self._file.write('[')
+        self._first = True
+        self._writer = threading.Thread(target=self._write_loop, name='trace-writer', daemon=True)
+        self._writer.start()
+        self.events.append(('M', 'thread_name', 0, {'name': 'main'}, None))
+
+    def _now(self):
+        # Trace timestamps are microseconds
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def push(self, name, cat='scene'):
+        """Open a span; spans close innermost first with pop()."""
+        self.events.append(('B', name, self._now(), None, cat))
+        self._depth += 1
+
+    def pop(self):
+        self._depth -= 1
+        self.events.append(('E', None, self._now(), None, None))
+        if len(self.events) >= self.flush_every:
+            self.flush()
+
+    def instant(self, name, args=None, cat='event'):
+        self.events.append(('i', name, self._now(), args, cat))
+
+    def mark(self, name):
+        now = self._now()
+        if self._phase is not None:
+            self.events.append(('E', self._phase, now, None, 'phase'))
+        if name is not None:
+            self.events.append(('B', name, now, None, 'phase'))
+        self._phase = name
+        if self.timer is not None:
+            self.timer.mark(name)
+
+    def end(self):
+        self.mark(None)
+
+    def flush(self):
+        """Hand the buffered events to the writer thread."""
+        if self.events:
+            self._queue.put(self.events)
+            self.events = []
+
+    def close(self):
+        """Write out everything buffered and finish the file."""
+        if self._file is None:
+            return
+        # Close whatever is still open, e.g. the frame that handled QUIT
+        self.mark(None)
+        while self._depth > 0:
+            self.pop()
+        self.flush()
+        self._queue.put(None)
+        self._writer.join()
+        self._file.write('\n]\n')
+        self._file.close()
+        self._file = None
+
+    def _write_loop(self):
+        while True:
+            events = self._queue.get()
+            if events is None:
+                return
+            lines = []
+            for phase, name, ts, args, cat in events:
+                event = {'ph': phase, 'ts': round(ts, 1), 'pid': 1, 'tid': 0}
+                if name is not None:
+                    event['name'] = name
+                if cat is not None:
+                    event['cat'] = cat
+                if args is not None:
+                    event['args'] = args
+                if phase == 'i':
+                    event['s'] = 't'
+                lines.append(json.dumps(event, separators=(',', ':')))
+            separator = '\n' if self._first else ',\n'
+            self._first = False
+            self._file.write(separator + ',\n'.join(lines))
+
+class NullTracer:
+    """Stand-in used when nothing is tracing; every call is a no-op."""
+
+    enabled = False
+
+    def push(self, name, cat='scene'):
+        pass
+
+    def pop(self):
+        pass
+
+    def instant(self, name, args=None, cat='event'):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+null_tracer = NullTracer()
@@ -1,11 +1,13 @@
 import pygame
-import random
 from src.entities.entity import Entity
 from src.entities.enemy_projectile import EnemyProjectile
+from src.core.clock import system_clock
+from src.core.rng import streams
+from src.utils.helpers import convert_surface
 from src.config import *
 
 class Boss(Entity):
-    def __init__(self, x, y, image, projectile_image, difficulty_tier='MEDIUM'):
+    def __init__(self, x, y, image, projectile_image, difficulty_tier='MEDIUM', spawn_queue=None, projectile_pool=None, clock=None, rng=None):
         super().__init__(x, y, image)
         
         # Store difficulty tier and get its properties
@@ -14,7 +16,7 @@ class Boss(Entity):
         
         # Set health based on difficulty tier
         health_min, health_max = tier_config['health_range']
-        self.health = random.randint(health_min, health_max)
+        self.health = (rng or streams.gameplay).randint(health_min, health_max)
         self.max_health = self.health
         
         # Set projectile count based on difficulty tier
@@ -27,9 +29,13 @@ class Boss(Entity):
         self.projectile_image = projectile_image
         self.speed = 2
         self.direction = 1 # 1 for right, -1 for left
-        self.last_shot_time = pygame.time.get_ticks()
+        self.clock = clock or system_clock
+        self.last_shot_time = self.clock.get_ticks()
         self.shoot_delay = 1500 # ms
+        # Projectiles fired by this boss; the scene moves them after draining spawn_queue
         self.projectiles = pygame.sprite.Group()
+        self.spawn_queue = spawn_queue
+        self.projectile_pool = projectile_pool
         
         # Create colored version of the boss image
         self.original_image = image.copy()
@@ -48,6 +54,7 @@ class Boss(Entity):
         # Add colored border
         border_width = 3
         pygame.draw.rect(self.image, self.border_color, self.image.get_rect(), border_width)
+        self.image = convert_surface(self.image)
 
     def update(self):
         # Movement
@@ -58,12 +65,10 @@ class Boss(Entity):
             self.direction *= -1
             
         # Shooting
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         if current_time - self.last_shot_time > self.shoot_delay:
             self.shoot()
             self.last_shot_time = current_time
-            
-        self.projectiles.update()
 
     def shoot(self):
         """Shoot projectiles based on difficulty tier"""
@@ -74,8 +79,15 @@ class Boss(Entity):
         for i in range(self.projectile_count):
             x_pos = self.rect.left + projectile_spacing * (i + 1)
             y_pos = self.rect.centery
-            projectile = EnemyProjectile(x_pos, y_pos, self.projectile_image)
+            projectile = self.create_projectile(x_pos, y_pos)
             self.projectiles.add(projectile)
+            if self.spawn_queue is not None:
+                self.spawn_queue.push(projectile)
+
+    def create_projectile(self, x, y):
+        if self.projectile_pool is not None:
+            return self.projectile_pool.acquire(x, y, self.projectile_image)
+        return EnemyProjectile(x, y, self.projectile_image)
 
     def take_damage(self, amount=1):
         self.health -= amount
@@ -8,6 +8,11 @@ class Bullet(Entity):
         self.vx = vx
         self.vy = vy
 
+    def reset(self, x, y, image, vx=0, vy=-10):
+        self.place(x, y, image)
+        self.vx = vx
+        self.vy = vy
+
     def update(self):
         self.rect.x += self.vx
         self.rect.y += self.vy
@@ -7,6 +7,10 @@ class EnemyProjectile(Entity):
         super().__init__(x, y, image)
         self.speed = BOSS_PROJECTILE_SPEED
 
+    def reset(self, x, y, image):
+        self.place(x, y, image)
+        self.speed = BOSS_PROJECTILE_SPEED
+
     def update(self):
         self.rect.y += self.speed
         if self.rect.y > SCREEN_HEIGHT:
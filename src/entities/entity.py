@@ -1,12 +1,47 @@
 import pygame
 
 class Entity(pygame.sprite.Sprite):
+    pool = None # SpritePool this entity returns to when killed
+    in_pool = False
+
     def __init__(self, x, y, image):
         super().__init__()
         self.image = image
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
+        # Center at the start of the current tick, for render interpolation
+        self.prev_center = self.rect.center
+
+    def place(self, x, y, image):
+        """Move a recycled entity to a new position, reusing its rect."""
+        if image is not self.image:
+            self.image = image
+            self.rect.size = image.get_size()
+        self.rect.x = x
+        self.rect.y = y
+        self.prev_center = self.rect.center
+
+    def snapshot(self):
+        """Remember the current center before the tick moves the entity."""
+        self.prev_center = self.rect.center
+
+    def interpolated_pos(self, alpha):
+        """
+        Top-left draw position for a center `alpha` of the way from the
+        previous tick's center to the current one. Centers, not corners, so
+        sprites rebuilt around their center at a new size (rotating
+        missiles, growing explosions, ship level-ups) don't jump.
+        """
+        prev_x, prev_y = self.prev_center
+        center_x, center_y = self.rect.center
+        return (int(prev_x + (center_x - prev_x) * alpha) - self.rect.width // 2,
+                int(prev_y + (center_y - prev_y) * alpha) - self.rect.height // 2)
+
+    def kill(self):
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
 
     def update(self):
         pass
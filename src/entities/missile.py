@@ -1,6 +1,6 @@
-import pygame
 import math
 from src.entities.entity import Entity
+from src.utils.rotation_cache import rotation_cache
 from src.config import *
 
 class Missile(Entity):
@@ -11,8 +11,8 @@ class Missile(Entity):
         self.trail_timer = 0
         # Optional: distance threshold to consider "reached center"
         self.explosion_distance = 20
-        # Store original image for rotation
-        self.original_image = image.copy()
+        # Store original image for rotation (shared so rotations are cached across missiles)
+        self.original_image = image
         self.angle = 0  # Current rotation angle
 
     def get_viewport_center(self, camera_offset_x=0, camera_offset_y=0):
@@ -64,7 +64,7 @@ class Missile(Entity):
                 
                 # Rotate the missile to face the direction it's traveling
                 old_center = self.rect.center
-                self.image = pygame.transform.rotate(self.original_image, self.angle)
+                self.image = rotation_cache.get(self.original_image, self.angle)
                 self.rect = self.image.get_rect()
                 self.rect.center = old_center
                 
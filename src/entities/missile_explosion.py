@@ -0,0 +1,38 @@
+import pygame
+from src.entities.entity import Entity
+from src.utils.graphics import GraphicsGenerator
+from src.config import *
+
+class MissileExplosion(Entity):
+    """
+    Fullscreen shockwave played when a missile detonates.
+
+    Frames are drawn on demand at 1/MISSILE_EXPLOSION_SCALE resolution and
+    scaled up into a single reused screen-sized surface, so nothing is
+    pre-rendered at startup and only one frame is resident while it plays.
+    """
+    FRAME_COUNT = 15
+
+    def __init__(self, x, y, scale=MISSILE_EXPLOSION_SCALE):
+        self.scale = scale
+        self.wave_surface = pygame.Surface((SCREEN_WIDTH // scale, SCREEN_HEIGHT // scale), pygame.SRCALPHA)
+        super().__init__(x, y, pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA))
+        self.animation_speed = 0.5 # Frames per update tick, matching Explosion
+        self.current_frame = 0
+        self.frame_index = None
+        self.render_frame(0)
+
+        # Center the explosion
+        self.rect.center = (x, y)
+
+    def render_frame(self, frame):
+        GraphicsGenerator.draw_ring_wave(self.wave_surface, frame, self.FRAME_COUNT, self.scale)
+        pygame.transform.smoothscale(self.wave_surface, self.image.get_size(), self.image)
+        self.frame_index = frame
+
+    def update(self):
+        self.current_frame += self.animation_speed
+        if self.current_frame >= self.FRAME_COUNT:
+            self.kill()
+        elif int(self.current_frame) != self.frame_index:
+            self.render_frame(int(self.current_frame))
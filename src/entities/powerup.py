@@ -1,11 +1,12 @@
 import pygame
-import random
 from src.entities.entity import Entity
+from src.core.rng import streams
 from src.config import *
 
 class PowerUp(Entity):
-    def __init__(self, image, type):
-        x = random.randint(0, SCREEN_WIDTH - POWERUP_WIDTH)
+    def __init__(self, image, type, rng=None):
+        rng = rng or streams.gameplay
+        x = rng.randint(0, SCREEN_WIDTH - POWERUP_WIDTH)
         y = -POWERUP_HEIGHT
         super().__init__(x, y, image)
         self.type = type
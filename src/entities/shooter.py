@@ -1,34 +1,44 @@
 import pygame
 from src.entities.entity import Entity
 from src.entities.enemy_projectile import EnemyProjectile
+from src.core.clock import system_clock
 from src.config import *
 
 class Shooter(Entity):
-    def __init__(self, x, y, image, projectile_image):
+    def __init__(self, x, y, image, projectile_image, spawn_queue=None, projectile_pool=None, clock=None):
         super().__init__(x, y, image)
         self.projectile_image = projectile_image
         self.speed = SHOOTER_SPEED
         self.health = SHOOTER_HEALTH
-        self.last_shot_time = pygame.time.get_ticks()
+        self.clock = clock or system_clock
+        self.last_shot_time = self.clock.get_ticks()
         self.shoot_delay = SHOOTER_FIRE_RATE
+        # Projectiles fired by this shooter; the scene moves them after draining spawn_queue
         self.projectiles = pygame.sprite.Group()
+        self.spawn_queue = spawn_queue
+        self.projectile_pool = projectile_pool
         
     def update(self):
         # Move down slowly
         self.rect.y += self.speed
         
         # Shoot
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         if current_time - self.last_shot_time > self.shoot_delay:
             self.shoot()
             self.last_shot_time = current_time
             
-        self.projectiles.update()
-            
     def shoot(self):
         # Shoot straight down
-        projectile = EnemyProjectile(self.rect.centerx, self.rect.bottom, self.projectile_image)
+        projectile = self.create_projectile(self.rect.centerx, self.rect.bottom)
         self.projectiles.add(projectile)
+        if self.spawn_queue is not None:
+            self.spawn_queue.push(projectile)
+        
+    def create_projectile(self, x, y):
+        if self.projectile_pool is not None:
+            return self.projectile_pool.acquire(x, y, self.projectile_image)
+        return EnemyProjectile(x, y, self.projectile_image)
         
     def take_damage(self, amount=1):
         self.health -= amount
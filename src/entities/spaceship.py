@@ -1,10 +1,14 @@
 import pygame
 from src.entities.entity import Entity
+from src.core.clock import system_clock
 from src.config import *
 
 class Spaceship(Entity):
-    def __init__(self, x, y, image, sound):
+    def __init__(self, x, y, image, sound, clock=None):
         super().__init__(x, y, image)
+        self.clock = clock or system_clock
+        # Input provider with get_pressed(); None reads the keyboard
+        self.controls = None
         self.fire_sound = sound
         self.bullets = pygame.sprite.Group()
         self.available_bullets = INITIAL_BULLETS
@@ -46,7 +50,7 @@ class Spaceship(Entity):
             self.rect.center = center
 
     def update(self):
-        keys = pygame.key.get_pressed()
+        keys = self.controls.get_pressed() if self.controls is not None else pygame.key.get_pressed()
         
         # Horizontal movement
         if keys[pygame.K_LEFT]:
@@ -74,7 +78,7 @@ class Spaceship(Entity):
         
         # Handle invincibility timer and blinking
         if self.is_invincible:
-            current_time = pygame.time.get_ticks()
+            current_time = self.clock.get_ticks()
             elapsed = current_time - self.invincibility_start_time
             
             # Check if invincibility period has expired
@@ -171,6 +175,6 @@ class Spaceship(Entity):
         
         # Activate invincibility
         self.is_invincible = True
-        self.invincibility_start_time = pygame.time.get_ticks()
+        self.invincibility_start_time = self.clock.get_ticks()
         return True  # Damage can be applied
 
@@ -2,19 +2,22 @@ import pygame
 import sys
 from src.scenes.scene import Scene
 from src.ui.components import Button
+from src.utils.text_cache import text_cache
+from src.utils.fonts import get_font
 from src.core.background import Background
 from src.config import *
 
 class GameOverScene(Scene):
-    def __init__(self, game, score):
+    def __init__(self, game, score, frame_report=None):
         super().__init__(game)
         self.score = score
+        self.frame_report = frame_report
         self.assets = self.game.asset_manager.assets
-        self.font = pygame.font.SysFont(None, int(SCREEN_HEIGHT * 0.061))  # ~55px at 900p
-        self.small_font = pygame.font.SysFont(None, int(SCREEN_HEIGHT * 0.044))  # ~40px at 900p
+        self.font = get_font(int(SCREEN_HEIGHT * 0.061))  # ~55px at 900p
+        self.small_font = get_font(int(SCREEN_HEIGHT * 0.044))  # ~40px at 900p
         
         # Background
-        self.background = Background()
+        self.background = Background(self.game.clock, self.game.rng.cosmetic)
         
         # Button positioned at bottom with padding
         button_width = int(SCREEN_WIDTH * 0.125)
@@ -39,6 +42,11 @@ class GameOverScene(Scene):
         self.initials = ""
         if len(self.top_scores) < 5 or (len(self.top_scores) > 0 and self.score > self.top_scores[-1]['high_score']):
             self.getting_initials = True
+        
+        # Frame-time summary of the game, rendered once
+        self.frame_stats_lines = []
+        if SHOW_FRAME_STATS and frame_report:
+            self.frame_stats_lines = self._render_frame_stats(frame_report)
 
     def process_input(self, events):
         for event in events:
@@ -75,36 +83,36 @@ class GameOverScene(Scene):
 
     def _render_initials_input(self, screen):
         # Position at ~11% from top
-        instruction_text = self.font.render("Enter Your Initials:", True, WHITE)
+        instruction_text = text_cache.render(self.font, "Enter Your Initials:", True, WHITE)
         instruction_y = int(SCREEN_HEIGHT * 0.111)
         screen.blit(instruction_text, (SCREEN_WIDTH // 2 - instruction_text.get_width() // 2, instruction_y))
 
         # Initials at ~22% from top
-        initials_text = self.font.render(self.initials, True, WHITE)
+        initials_text = text_cache.render(self.font, self.initials, True, WHITE)
         initials_y = int(SCREEN_HEIGHT * 0.222)
         screen.blit(initials_text, (SCREEN_WIDTH // 2 - initials_text.get_width() // 2, initials_y))
 
         # Instructions at ~33% from top
         if len(self.initials) == 3:
-            submit_text = self.small_font.render("Press Enter to Submit", True, WHITE)
+            submit_text = text_cache.render(self.small_font, "Press Enter to Submit", True, WHITE)
         else:
-            submit_text = self.small_font.render("Enter 3 Letters", True, WHITE)
+            submit_text = text_cache.render(self.small_font, "Enter 3 Letters", True, WHITE)
         submit_y = int(SCREEN_HEIGHT * 0.333)
         screen.blit(submit_text, (SCREEN_WIDTH // 2 - submit_text.get_width() // 2, submit_y))
 
     def _render_game_over(self, screen):
         # Game Over title at ~5.6% from top
-        title_text = self.font.render("Game Over!", True, RED)
+        title_text = text_cache.render(self.font, "Game Over!", True, RED)
         title_y = int(SCREEN_HEIGHT * 0.056)
         screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, title_y))
 
         # Score at ~16.7% from top
-        score_text = self.font.render(f"Your Score: {self.score}", True, WHITE)
+        score_text = text_cache.render(self.font, f"Your Score: {self.score}", True, WHITE)
         score_y = int(SCREEN_HEIGHT * 0.167)
         screen.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, score_y))
 
         # Top scores title at ~27.8% from top
-        top_scores_title = self.small_font.render("Top 5 High Scores", True, YELLOW)
+        top_scores_title = text_cache.render(self.small_font, "Top 5 High Scores", True, YELLOW)
         top_scores_y = int(SCREEN_HEIGHT * 0.278)
         screen.blit(top_scores_title, (SCREEN_WIDTH // 2 - top_scores_title.get_width() // 2, top_scores_y))
 
@@ -116,10 +124,25 @@ class GameOverScene(Scene):
             for i, entry in enumerate(self.top_scores):
                 initials = entry.get('initials', 'N/A')
                 high_score = entry.get('high_score', 0)
-                score_line = self.small_font.render(f"{i+1}. {initials} - {high_score}", True, WHITE)
+                score_line = text_cache.render(self.small_font, f"{i+1}. {initials} - {high_score}", True, WHITE)
                 screen.blit(score_line, (SCREEN_WIDTH // 2 - score_line.get_width() // 2, leaderboard_start_y + i * line_spacing))
         else:
-            unavailable_text = self.small_font.render("Leaderboard unavailable", True, WHITE)
+            unavailable_text = text_cache.render(self.small_font, "Leaderboard unavailable", True, WHITE)
             screen.blit(unavailable_text, (SCREEN_WIDTH // 2 - unavailable_text.get_width() // 2, leaderboard_start_y + line_spacing))
 
         self.replay_button.draw(screen)
+        
+        # Frame-time summary in the bottom left corner
+        margin = int(SCREEN_WIDTH * 0.0125)
+        y = SCREEN_HEIGHT - margin - sum(line.get_height() for line in self.frame_stats_lines)
+        for line in self.frame_stats_lines:
+            screen.blit(line, (margin, y))
+            y += line.get_height()
+
+    def _render_frame_stats(self, report):
+        font = get_font(int(SCREEN_HEIGHT * 0.027))  # ~24px at 900p
+        rows = [(f"Frame times, {report['frames']} frames (ms)", YELLOW)]
+        for name, stats in [('All', report)] + [(f"L{level}", stats) for level, stats in report['levels'].items()]:
+            rows.append((f"{name}  p50 {stats['p50']:.1f}  p95 {stats['p95']:.1f}  p99 {stats['p99']:.1f}  "
+                         f"max {stats['max']:.1f}  over {stats['over_budget']}", WHITE))
+        return [font.render(text, True, color) for text, color in rows]
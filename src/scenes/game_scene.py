@@ -1,5 +1,4 @@
 import pygame
-import random
 from src.scenes.scene import Scene
 from src.scenes.game_over_scene import GameOverScene
 from src.entities.spaceship import Spaceship
@@ -10,15 +9,31 @@ from src.entities.boss import Boss
 from src.entities.chaser import Chaser
 from src.entities.shooter import Shooter
 from src.entities.missile import Missile
-from src.entities.explosion import Explosion
+from src.entities.missile_explosion import MissileExplosion
 from src.ui.hud import HUD
 from src.core.background import Background
+from src.core.spatial_hash import SpatialHash
+from src.core.culling import Culler, below_screen
+from src.core.spawn_queue import SpawnQueue
+from src.core.pool import SpritePool
+from src.core.frame_stats import FrameStats, append_history
+from src.utils.text_cache import text_cache
+from src.utils.fonts import get_font
+from src.entities.enemy_projectile import EnemyProjectile
 from src.config import *
 
 class GameScene(Scene):
-    def __init__(self, game):
+    def __init__(self, game, seed=None):
         super().__init__(game)
+        
+        # Every game restarts the random streams from a known seed, so it can be replayed
+        self.seed = seed if seed is not None else self.game.rng.new_seed()
+        self.game.rng.reseed(self.seed)
+        
         self.assets = self.game.asset_manager.assets
+        self.clock = self.game.clock
+        self.start_time = self.clock.time
+        self.rng = self.game.rng.gameplay
         self.hud = HUD(self.game.asset_manager)
         
         # Game State
@@ -31,14 +46,15 @@ class GameScene(Scene):
         self.next_boss_score = BOSS_SPAWN_SCORE_INITIAL
         
         # Background
-        self.background = Background()
+        self.background = Background(self.clock, self.game.rng.cosmetic)
         
         # Entities
         self.spaceship = Spaceship(
             SCREEN_WIDTH // 2, 
             SCREEN_HEIGHT - SPACESHIP_HEIGHT - 10, 
             self.assets['spaceship_img'],
-            self.assets['fire_sound']
+            self.assets['fire_sound'],
+            clock=self.clock
         )
         self.spaceship.set_assets(self.assets)
         
@@ -54,16 +70,43 @@ class GameScene(Scene):
         self.all_sprites = pygame.sprite.Group()
         self.all_sprites.add(self.spaceship)
         
+        # Projectiles fired by bosses and shooters, drained once per frame
+        self.spawn_queue = SpawnQueue()
+        
+        # Recycled projectile instances
+        self.bullet_pool = SpritePool(Bullet, BULLET_POOL_SIZE)
+        self.projectile_pool = SpritePool(EnemyProjectile, ENEMY_PROJECTILE_POOL_SIZE)
+        
+        # Collision broadphase, rebuilt once per frame
+        self.collision_grid = SpatialHash()
+        
+        # Off-screen culling; bullets and enemy projectiles remove themselves
+        self.culler = Culler()
+        self.culler.track('asteroids', self.asteroids, below_screen)
+        self.culler.track('powerups', self.powerups, below_screen)
+        self.culler.track('chasers', self.chasers, below_screen)
+        self.culler.track('shooters', self.shooters, below_screen)
+        self.culler.track('bullets', self.bullets)
+        self.culler.track('enemy_projectiles', self.enemy_projectiles)
+        self.culler.track('bosses', self.bosses)
+        self.culler.track('missiles', self.missiles_group)
+        self.culler.track('explosions', self.explosions)
+        
         # Timers
-        self.asteroid_timer = pygame.time.get_ticks()
-        self.powerup_timer = pygame.time.get_ticks()
+        self.asteroid_timer = self.clock.get_ticks()
+        self.powerup_timer = self.clock.get_ticks()
+
+        self.game_over = False
+        
+        # Rendered frame times per level, filled in by Game
+        self.frame_stats = FrameStats(FRAME_BUDGET_MS)
 
         # Pause State
         self.paused = False
-        self.pause_start_time = 0
-        self.font_pause_sub = pygame.font.Font(None, int(SCREEN_HEIGHT * 0.04))  # ~36px at 900p
+        self.font_pause_sub = get_font(int(SCREEN_HEIGHT * 0.04))  # ~36px at 900p
 
     def process_input(self, events):
+        self.phases.mark('input')
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_p:
@@ -82,24 +125,31 @@ class GameScene(Scene):
                     if event.key == pygame.K_SPACE:
                         new_bullets = self.spaceship.shoot(self.assets['bullet_img'])
                         for bx, by, vx, vy, img in new_bullets:
-                            bullet = Bullet(bx, by, img, vx, vy)
+                            bullet = self.bullet_pool.acquire(bx, by, img, vx, vy)
                             self.bullets.add(bullet)
                             self.all_sprites.add(bullet)
                         if new_bullets:
                             self.spaceship.decrease_bullets()
+        self.phases.end()
 
     def update(self):
+        # Start-of-tick positions for render interpolation (also while paused, so nothing drifts)
+        for sprite in self.all_sprites:
+            sprite.snapshot()
+        
         if self.paused:
             return
 
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         
         # Update Background
+        self.phases.mark('background')
         self.background.update()
         
         # Spawn Asteroids
+        self.phases.mark('spawn')
         if current_time - self.asteroid_timer > self.asteroid_spawn_rate:
-            asteroid = Asteroid(random.choice(self.assets['asteroid_images']), self.asteroid_speed)
+            asteroid = Asteroid(self.rng.choice(self.assets['asteroid_images']), self.asteroid_speed, self.rng)
             self.asteroids.add(asteroid)
             self.all_sprites.add(asteroid)
             self.asteroid_timer = current_time
@@ -107,12 +157,12 @@ class GameScene(Scene):
         # Spawn Powerups
         if current_time - self.powerup_timer > 5000:
             # Determine type
-            roll = random.random()
+            roll = self.rng.random()
             if roll < MISSILE_POWERUP_CHANCE:
                 type = 'missile'
                 img = self.assets['missile_powerup_img'] if 'missile_powerup_img' in self.assets else self.assets['upgrade_powerup_img'] # Fallback if image missing
             else:
-                type = random.choice(['health', 'ammo', 'upgrade'])
+                type = self.rng.choice(['health', 'ammo', 'upgrade'])
                 if type == 'health':
                     img = self.assets['health_powerup_img']
                 elif type == 'ammo':
@@ -120,7 +170,7 @@ class GameScene(Scene):
                 else:
                     img = self.assets['upgrade_powerup_img']
                 
-            powerup = PowerUp(img, type)
+            powerup = PowerUp(img, type, self.rng)
             self.powerups.add(powerup)
             self.all_sprites.add(powerup)
             self.powerup_timer = current_time
@@ -129,7 +179,7 @@ class GameScene(Scene):
         if self.score >= self.next_boss_score:
              # Determine difficulty tier based on level/score
              # Higher levels increase chance of stronger bosses
-             difficulty_roll = random.random()
+             difficulty_roll = self.rng.random()
              
              if self.level <= 2:
                  # Early game: mostly weak bosses
@@ -158,9 +208,11 @@ class GameScene(Scene):
              
              # Spawn Boss with selected difficulty
              boss = Boss(SCREEN_WIDTH // 2, 50, self.assets['boss_img'], 
-                        self.assets['enemy_projectile_img'], difficulty_tier)
+                        self.assets['enemy_projectile_img'], difficulty_tier,
+                        self.spawn_queue, self.projectile_pool, self.clock, self.rng)
              self.bosses.add(boss)
              self.all_sprites.add(boss)
+             self.trace.instant('boss_spawn', {'tier': difficulty_tier, 'level': self.level})
              gap = max(BOSS_SPAWN_GAP_MIN, BOSS_SPAWN_GAP_INITIAL - (self.level * BOSS_SPAWN_GAP_DECREASE))
              self.next_boss_score += gap
 
@@ -168,22 +220,26 @@ class GameScene(Scene):
         if self.score >= CHASER_START_SCORE:
             # Spawn chance increases with score/level
             chance = CHASER_SPAWN_CHANCE_BASE + (self.level * CHASER_SPAWN_CHANCE_INC)
-            if random.random() < chance:
-                x = random.randint(0, SCREEN_WIDTH - CHASER_WIDTH)
+            if self.rng.random() < chance:
+                x = self.rng.randint(0, SCREEN_WIDTH - CHASER_WIDTH)
                 chaser = Chaser(x, -CHASER_HEIGHT, self.assets['chaser_img'], self.spaceship)
                 self.chasers.add(chaser)
                 self.all_sprites.add(chaser)
+                self.trace.instant('chaser_spawn')
 
         # Spawn Shooters
         if self.score >= SHOOTER_START_SCORE:
             chance = SHOOTER_SPAWN_CHANCE_BASE + (self.level * SHOOTER_SPAWN_CHANCE_INC)
-            if random.random() < chance:
-                x = random.randint(0, SCREEN_WIDTH - SHOOTER_WIDTH)
-                shooter = Shooter(x, -SHOOTER_HEIGHT, self.assets['shooter_img'], self.assets['enemy_projectile_img'])
+            if self.rng.random() < chance:
+                x = self.rng.randint(0, SCREEN_WIDTH - SHOOTER_WIDTH)
+                shooter = Shooter(x, -SHOOTER_HEIGHT, self.assets['shooter_img'], self.assets['enemy_projectile_img'],
+                                  self.spawn_queue, self.projectile_pool, self.clock)
                 self.shooters.add(shooter)
                 self.all_sprites.add(shooter)
+                self.trace.instant('shooter_spawn')
 
         # Update all sprites
+        self.phases.mark('entities')
         self.spaceship.update() # Handle input movement
         self.bullets.update()
         self.asteroids.update()
@@ -195,9 +251,18 @@ class GameScene(Scene):
         self.explosions.update()
         self.enemy_projectiles.update()
 
+        # Register projectiles fired this frame
+        for projectile in self.spawn_queue.drain():
+            self.enemy_projectiles.add(projectile)
+            self.all_sprites.add(projectile)
+
         # Check for missile explosions
         for missile in self.missiles_group:
             if missile.exploded:
+                self.trace.instant('missile_detonation', {
+                    'asteroids': len(self.asteroids), 'bosses': len(self.bosses), 'chasers': len(self.chasers),
+                    'shooters': len(self.shooters), 'projectiles': len(self.enemy_projectiles)
+                })
                 # Clear all enemies
                 for asteroid in self.asteroids:
                     asteroid.kill()
@@ -217,39 +282,26 @@ class GameScene(Scene):
                 self.assets['end_bomb_sound'].play()
                 
                 # Spawn Fullscreen Explosion (centered at viewport)
-                explosion = Explosion(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, self.assets['missile_explosion_frames'])
+                explosion = MissileExplosion(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
                 self.explosions.add(explosion)
                 self.all_sprites.add(explosion)
                 
                 missile.kill()
         
-        # Add new projectiles from bosses to groups
-        for boss in self.bosses:
-            for projectile in boss.projectiles:
-                if projectile not in self.enemy_projectiles:
-                    self.enemy_projectiles.add(projectile)
-                    self.all_sprites.add(projectile)
-            # Clear boss projectiles group to avoid re-adding (or just use group logic)
-            # Actually boss.projectiles is a group.
-            # We can just add them.
-            pass
-
-        # Add new projectiles from shooters
-        for shooter in self.shooters:
-            for projectile in shooter.projectiles:
-                if projectile not in self.enemy_projectiles:
-                    self.enemy_projectiles.add(projectile)
-                    self.all_sprites.add(projectile)
+        # Index everything that can collide this frame
+        self.phases.mark('collisions')
+        self.collision_grid.rebuild(self.bullets, self.asteroids, self.bosses, self.enemy_projectiles,
+                                    self.chasers, self.shooters, self.powerups)
 
         # Collisions: Bullet - Asteroid
-        hits = pygame.sprite.groupcollide(self.asteroids, self.bullets, True, True)
+        hits = self.collision_grid.groupcollide(self.asteroids, self.bullets, True, True)
         for hit in hits:
             self.assets['asteroid_hit_sound'].play()
             self.score += 10
             # self.spaceship.add_bullets(1) # Removed as per request
 
         # Collisions: Bullet - Boss
-        hits = pygame.sprite.groupcollide(self.bosses, self.bullets, False, True)
+        hits = self.collision_grid.groupcollide(self.bosses, self.bullets, False, True)
         for boss, bullets in hits.items():
             self.assets['asteroid_hit_sound'].play()
             for b in bullets:
@@ -259,7 +311,7 @@ class GameScene(Scene):
                     self.assets['end_bomb_sound'].play() # Reuse sound for boss death
 
         # Collisions: Bullet - Chaser
-        hits = pygame.sprite.groupcollide(self.chasers, self.bullets, False, True)
+        hits = self.collision_grid.groupcollide(self.chasers, self.bullets, False, True)
         for chaser, bullets in hits.items():
             self.assets['asteroid_hit_sound'].play()
             for b in bullets:
@@ -268,7 +320,7 @@ class GameScene(Scene):
                     self.score += CHASER_SCORE_VALUE
 
         # Collisions: Bullet - Shooter
-        hits = pygame.sprite.groupcollide(self.shooters, self.bullets, False, True)
+        hits = self.collision_grid.groupcollide(self.shooters, self.bullets, False, True)
         for shooter, bullets in hits.items():
             self.assets['asteroid_hit_sound'].play()
             for b in bullets:
@@ -277,7 +329,7 @@ class GameScene(Scene):
                     self.score += SHOOTER_SCORE_VALUE
 
         # Collisions: Spaceship - Asteroid
-        hits = pygame.sprite.spritecollide(self.spaceship, self.asteroids, False)
+        hits = self.collision_grid.spritecollide(self.spaceship, self.asteroids, False)
         for hit in hits:
             if self.spaceship.take_damage():
                 hit.kill()  # Remove asteroid only if damage was applied
@@ -285,20 +337,20 @@ class GameScene(Scene):
                 self.lives -= 1
                 self.spaceship.downgrade()
                 if self.lives == 0:
-                    self.game.state_manager.change_scene(GameOverScene(self.game, self.score))
+                    self.end_game()
 
         # Collisions: Spaceship - Boss
-        hits = pygame.sprite.spritecollide(self.spaceship, self.bosses, False)
+        hits = self.collision_grid.spritecollide(self.spaceship, self.bosses, False)
         for hit in hits:
             if self.spaceship.take_damage():
                 self.assets['crash_sound'].play()
                 self.lives -= 1
                 self.spaceship.downgrade()
                 if self.lives == 0:
-                    self.game.state_manager.change_scene(GameOverScene(self.game, self.score))
+                    self.end_game()
 
         # Collisions: Spaceship - Enemy Projectile
-        hits = pygame.sprite.spritecollide(self.spaceship, self.enemy_projectiles, False)
+        hits = self.collision_grid.spritecollide(self.spaceship, self.enemy_projectiles, False)
         for hit in hits:
             if self.spaceship.take_damage():
                 hit.kill()  # Remove projectile only if damage was applied
@@ -306,10 +358,10 @@ class GameScene(Scene):
                 self.lives -= 1
                 self.spaceship.downgrade()
                 if self.lives == 0:
-                    self.game.state_manager.change_scene(GameOverScene(self.game, self.score))
+                    self.end_game()
 
         # Collisions: Spaceship - Chaser
-        hits = pygame.sprite.spritecollide(self.spaceship, self.chasers, False)
+        hits = self.collision_grid.spritecollide(self.spaceship, self.chasers, False)
         for hit in hits:
             if self.spaceship.take_damage():
                 hit.kill()  # Remove chaser only if damage was applied
@@ -317,10 +369,10 @@ class GameScene(Scene):
                 self.lives -= 1
                 self.spaceship.downgrade()
                 if self.lives == 0:
-                    self.game.state_manager.change_scene(GameOverScene(self.game, self.score))
+                    self.end_game()
 
         # Collisions: Spaceship - Shooter
-        hits = pygame.sprite.spritecollide(self.spaceship, self.shooters, False)
+        hits = self.collision_grid.spritecollide(self.spaceship, self.shooters, False)
         for hit in hits:
             if self.spaceship.take_damage():
                 hit.kill()  # Remove shooter only if damage was applied
@@ -328,10 +380,10 @@ class GameScene(Scene):
                 self.lives -= 1
                 self.spaceship.downgrade()
                 if self.lives == 0:
-                    self.game.state_manager.change_scene(GameOverScene(self.game, self.score))
+                    self.end_game()
 
         # Collisions: Spaceship - PowerUp
-        hits = pygame.sprite.spritecollide(self.spaceship, self.powerups, True)
+        hits = self.collision_grid.spritecollide(self.spaceship, self.powerups, True)
         for hit in hits:
             if hit.type == 'health':
                 if self.lives < MAX_LIVES:
@@ -344,6 +396,7 @@ class GameScene(Scene):
                 self.spaceship.add_missiles(1)
 
         # Level Up / Difficulty Progression
+        self.phases.mark('progression')
         new_level = (self.score // LEVEL_SCORE_THRESHOLD) + 1
         if new_level > self.level:
             self.level = new_level
@@ -351,42 +404,59 @@ class GameScene(Scene):
             self.asteroid_speed = min(ASTEROID_SPEED_MAX, ASTEROID_SPEED_INITIAL + self.level)
             self.asteroid_spawn_rate = max(ASTEROID_SPAWN_RATE_MIN, int(ASTEROID_SPAWN_RATE_INITIAL * (DIFFICULTY_MULTIPLIER ** (self.level - 1))))
 
-        # Remove off-screen asteroids and increment score
-        for asteroid in self.asteroids:
-            if asteroid.rect.y > SCREEN_HEIGHT:
-                asteroid.kill()
-                self.score += 1
+        # Remove off-screen entities; each dodged asteroid is worth a point
+        self.phases.mark('culling')
+        culled = self.culler.cull()
+        self.score += culled.get('asteroids', 0)
+        self.phases.end()
+
+    def end_game(self):
+        self.game_over = True
+        frame_report = None
+        if self.frame_stats.frames:
+            frame_report = self.frame_stats.report(version=GAME_VERSION, seed=self.seed, score=self.score, level=self.level)
+            if FRAME_STATS_FILE:
+                append_history(FRAME_STATS_FILE, frame_report)
+        self.game.state_manager.change_scene(GameOverScene(self.game, self.score, frame_report))
 
     def render(self, screen):
         # Background
+        self.phases.mark('background_draw')
         self.background.draw(screen)
         
-        # Handle spaceship blinking during invincibility
-        # If spaceship is not visible (blinking), temporarily remove it from drawing
-        if not self.spaceship.visible:
-            # Draw all sprites except spaceship
-            for sprite in self.all_sprites:
-                if sprite != self.spaceship:
-                    screen.blit(sprite.image, sprite.rect)
-        else:
-            # Draw all sprites normally
-            self.all_sprites.draw(screen)
+        # Sprites, interpolated between the last two ticks
+        self.phases.mark('sprites')
+        self.draw_sprites(screen)
         
         # HUD
+        self.phases.mark('hud')
         self.hud.draw(screen, self.lives, MAX_LIVES, self.spaceship.available_bullets, MAX_BULLETS, self.score, self.spaceship.level, self.spaceship.missiles, MAX_MISSILES)
+        self.phases.end()
 
         if self.paused:
             self.draw_pause_screen(screen)
 
+    def draw_sprites(self, screen):
+        alpha = self.interpolation
+        batch = []
+        for sprite in self.all_sprites:
+            # Skip the spaceship while it blinks during invincibility
+            if sprite is self.spaceship and not self.spaceship.visible:
+                continue
+            if alpha < 1.0:
+                batch.append((sprite.image, sprite.interpolated_pos(alpha)))
+            else:
+                batch.append((sprite.image, sprite.rect))
+        screen.blits(batch, doreturn=False)
+
     def toggle_pause(self):
         self.paused = not self.paused
+        # Game time stands still while paused, so no timer needs adjusting
         if self.paused:
-            self.pause_start_time = pygame.time.get_ticks()
+            self.clock.pause()
             pygame.mixer.music.pause()
         else:
-            pause_duration = pygame.time.get_ticks() - self.pause_start_time
-            self.asteroid_timer += pause_duration
-            self.powerup_timer += pause_duration
+            self.clock.resume()
             pygame.mixer.music.unpause()
 
     def draw_pause_screen(self, screen):
@@ -406,6 +476,6 @@ class GameScene(Scene):
         pygame.draw.rect(screen, WHITE, (center_x + gap//2, center_y - bar_height//2 - icon_offset_y, bar_width, bar_height))
         
         # Text
-        text_surf = self.font_pause_sub.render("Press P to Unpause", True, WHITE)
+        text_surf = text_cache.render(self.font_pause_sub, "Press P to Unpause", True, WHITE)
         text_rect = text_surf.get_rect(center=(center_x, center_y + int(SCREEN_HEIGHT * 0.044)))
         screen.blit(text_surf, text_rect)
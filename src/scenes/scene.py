@@ -1,6 +1,15 @@
+from src.core.profiler import null_timer
+from src.core.trace import null_tracer
+
 class Scene:
     def __init__(self, game):
         self.game = game
+        # Render interpolation between the previous and current tick (0..1), set by Game
+        self.interpolation = 1.0
+        # Per-phase timings, when something is profiling
+        self.phases = null_timer
+        # Trace-event recorder for instant events (spawns, detonations)
+        self.trace = null_tracer
 
     def process_input(self, events):
         raise NotImplementedError
@@ -1,7 +1,8 @@
 import pygame
-import random
 from src.scenes.scene import Scene
 from src.utils.helpers import split_text
+from src.utils.text_cache import text_cache
+from src.utils.fonts import get_font
 from src.core.background import Background
 from src.config import *
 
@@ -9,11 +10,11 @@ class WelcomeScene(Scene):
     def __init__(self, game):
         super().__init__(game)
         self.assets = self.game.asset_manager.assets
-        self.font = pygame.font.SysFont(None, int(SCREEN_HEIGHT * 0.033))  # ~30px at 900p
-        self.title_font = pygame.font.SysFont(None, int(SCREEN_HEIGHT * 0.056))  # ~50px at 900p
+        self.font = get_font(int(SCREEN_HEIGHT * 0.033))  # ~30px at 900p
+        self.title_font = get_font(int(SCREEN_HEIGHT * 0.056))  # ~50px at 900p
         
         # Background
-        self.background = Background()
+        self.background = Background(self.game.clock, self.game.rng.cosmetic)
         
         self.space_facts = [
             "The Milky Way galaxy contains over 100 billion stars.",
@@ -52,12 +53,12 @@ class WelcomeScene(Scene):
             "The Sun's surface temperature is about 5,500 degrees Celsius.",
             "The Sun's core temperature is about 15 million degrees Celsius."
         ]
-        self.random_fact = random.choice(self.space_facts)
+        self.random_fact = self.game.rng.cosmetic.choice(self.space_facts)
         # Wrap text based on screen width (about 47.5% of screen width for text area)
         self.wrapped_fact_lines = split_text(self.random_fact, self.font, int(SCREEN_WIDTH * 0.475))
         
         self.blink = True
-        self.blink_timer = pygame.time.get_ticks()
+        self.blink_timer = self.game.clock.get_ticks()
 
     def process_input(self, events):
         for event in events:
@@ -70,9 +71,10 @@ class WelcomeScene(Scene):
         self.background.update()
         
         # Blinking text
-        if pygame.time.get_ticks() - self.blink_timer > 500:
+        current_time = self.game.clock.get_ticks()
+        if current_time - self.blink_timer > 500:
             self.blink = not self.blink
-            self.blink_timer = pygame.time.get_ticks()
+            self.blink_timer = current_time
 
     def render(self, screen):
         # Draw background with stars and meteors
@@ -84,7 +86,7 @@ class WelcomeScene(Scene):
         screen.blit(logo, (SCREEN_WIDTH // 2 - logo.get_width() // 2, logo_y))
 
         # Title - positioned at ~5.6% from top
-        title_text = self.title_font.render("Welcome to Spaceship Game!", True, WHITE)
+        title_text = text_cache.render(self.title_font, "Welcome to Spaceship Game!", True, WHITE)
         title_text_x = SCREEN_WIDTH // 2 - title_text.get_width() // 2
         title_y = int(SCREEN_HEIGHT * 0.056)  # ~50px at 900p
         screen.blit(title_text, (title_text_x, title_y))
@@ -99,13 +101,13 @@ class WelcomeScene(Scene):
 
         # Blink text - positioned above facts
         if self.blink:
-            enter_text = self.title_font.render("Press ENTER to Start", True, RED)
+            enter_text = text_cache.render(self.title_font, "Press ENTER to Start", True, RED)
             enter_text_x = SCREEN_WIDTH // 2 - enter_text.get_width() // 2
             enter_y = fact_start_y - enter_text.get_height() - int(SCREEN_HEIGHT * 0.02)
             screen.blit(enter_text, (enter_text_x, enter_y))
 
         # Fact - positioned at bottom
         for i, line in enumerate(self.wrapped_fact_lines):
-            fact_text = self.font.render(line, True, YELLOW)
+            fact_text = text_cache.render(self.font, line, True, YELLOW)
             fact_text_x = SCREEN_WIDTH // 2 - fact_text.get_width() // 2
             screen.blit(fact_text, (fact_text_x, fact_start_y + i * line_spacing))
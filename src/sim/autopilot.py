@@ -0,0 +1,168 @@
+"""
+Autopilot input provider.
+
+Plays GameScene through the same input path as a human: each tick it
+looks at the scene, then answers get_events() with the KEYDOWN presses
+(SPACE to fire, M for a missile) and get_pressed() with the held arrow
+keys. Used to drive headless runs into late-game load on their own:
+
+    python -m src.sim.autopilot --minutes 10 --seed 1
+"""
+
+import argparse
+import pygame
+from src.config import *
+from src.sim.input import IdleInput, KeyState
+
+# (dx, dy) for every arrow-key combination, standing still first
+MOVES = [(dx, dy) for dy in (0, 1, -1) for dx in (0, -1, 1)]
+
+def move_keys(dx, dy):
+    keys = []
+    if dx < 0:
+        keys.append(pygame.K_LEFT)
+    elif dx > 0:
+        keys.append(pygame.K_RIGHT)
+    if dy < 0:
+        keys.append(pygame.K_UP)
+    elif dy > 0:
+        keys.append(pygame.K_DOWN)
+    return KeyState(keys)
+
+class Autopilot(IdleInput):
+    """
+    Dodges, aims and collects powerups.
+
+    Dodging: every threat near the ship (enemy projectiles, asteroids,
+    chasers, shooters, bosses) is projected along its last-tick velocity
+    for `lookahead` ticks, and the arrow-key combination whose predicted
+    path collides least (soonest collisions weigh most) is held.
+    Among equally safe moves it steers toward a powerup or under the
+    nearest enemy. It fires when an enemy is lined up above the ship and
+    launches a missile when it is crowded.
+    """
+
+    def __init__(self, lookahead=24, sample_every=3, fire_interval=6, home_y=SCREEN_HEIGHT - 120):
+        super().__init__()
+        self.scene = None
+        self.lookahead = lookahead
+        self.sample_every = sample_every
+        self.fire_interval = fire_interval
+        self.home_y = home_y
+        self.last_fire = -fire_interval
+        self.tick = 0
+
+    def attach(self, scene):
+        self.scene = scene
+        self.keys = KeyState()
+        self.last_fire = -self.fire_interval
+        self.tick = 0
+
+    def get_events(self):
+        self.tick += 1
+        scene = self.scene
+        if scene is None or scene.paused:
+            return []
+
+        ship = scene.spaceship
+        threats = self.nearby_threats(scene, ship)
+        dx, dy = self.choose_move(ship, threats, self.target_x(scene, ship))
+        self.keys = move_keys(dx, dy)
+
+        events = []
+        if self.should_fire(scene, ship):
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+            self.last_fire = self.tick
+        if ship.missiles > 0 and self.crowded(scene):
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_m))
+        return events
+
+    def nearby_threats(self, scene, ship):
+        """(rect, vx, vy) of every threat within reach during the lookahead."""
+        reach = ship.rect.inflate(self.lookahead * (ship.speed + ASTEROID_SPEED_MAX) * 2,
+                                  self.lookahead * (ship.speed + ASTEROID_SPEED_MAX) * 2)
+        threats = []
+        for group in (scene.enemy_projectiles, scene.asteroids, scene.chasers, scene.shooters, scene.bosses):
+            for sprite in group:
+                if reach.colliderect(sprite.rect):
+                    px, py = sprite.prev_center
+                    threats.append((sprite.rect, sprite.rect.centerx - px, sprite.rect.centery - py))
+        return threats
+
+    def target_x(self, scene, ship):
+        """Horizontal position worth heading for: a powerup, else the nearest enemy."""
+        best = None
+        for powerup in scene.powerups:
+            if powerup.rect.bottom < ship.rect.bottom:
+                distance = abs(powerup.rect.centerx - ship.rect.centerx)
+                if best is None or distance < best[0]:
+                    best = (distance, powerup.rect.centerx)
+        if best is not None:
+            return best[1]
+        for group in (scene.bosses, scene.shooters, scene.chasers, scene.asteroids):
+            for enemy in group:
+                if enemy.rect.bottom < ship.rect.top:
+                    distance = abs(enemy.rect.centerx - ship.rect.centerx)
+                    if best is None or distance < best[0]:
+                        best = (distance, enemy.rect.centerx)
+            if best is not None:
+                return best[1]
+        return SCREEN_WIDTH // 2
+
+    def choose_move(self, ship, threats, target_x):
+        speed = ship.speed
+        steps = range(self.sample_every, self.lookahead + 1, self.sample_every)
+        # Predicted threat rects at each sampled step, shared by every move
+        predicted = [[rect.move(vx * step, vy * step) for rect, vx, vy in threats] for step in steps]
+
+        best_move, best_cost = (0, 0), None
+        for dx, dy in MOVES:
+            danger = 0.0
+            for step, rects in zip(steps, predicted):
+                x = min(max(ship.rect.x + dx * speed * step, 0), SCREEN_WIDTH - SPACESHIP_WIDTH)
+                y = min(max(ship.rect.y + dy * speed * step, 0), SCREEN_HEIGHT - SPACESHIP_HEIGHT)
+                hits = pygame.Rect(x, y, ship.rect.width, ship.rect.height).inflate(8, 8).collidelistall(rects)
+                if hits:
+                    danger += len(hits) * (self.lookahead - step + 1)
+            next_x = ship.rect.centerx + dx * speed
+            next_y = ship.rect.y + dy * speed
+            # Danger dominates; then get under the target and back to the bottom of the screen
+            cost = danger * 1000 + abs(target_x - next_x) + abs(self.home_y - next_y) * 0.5
+            if best_cost is None or cost < best_cost:
+                best_move, best_cost = (dx, dy), cost
+        return best_move
+
+    def should_fire(self, scene, ship):
+        if ship.available_bullets <= 0 or self.tick - self.last_fire < self.fire_interval:
+            return False
+        # A bullet climbs 10px a tick; aim where the enemy will be when it gets there
+        for group in (scene.bosses, scene.shooters, scene.chasers, scene.asteroids):
+            for enemy in group:
+                if enemy.rect.bottom >= ship.rect.top:
+                    continue
+                ticks_to_hit = (ship.rect.top - enemy.rect.bottom) / 10
+                px, _ = enemy.prev_center
+                lead_x = enemy.rect.centerx + (enemy.rect.centerx - px) * ticks_to_hit
+                if abs(lead_x - ship.rect.centerx) <= enemy.rect.width // 2:
+                    return True
+        return False
+
+    def crowded(self, scene):
+        return len(scene.bosses) >= 2 or len(scene.enemy_projectiles) >= 12
+
+def main(argv=None):
+    from src.sim.headless import HeadlessGame, print_report
+
+    parser = argparse.ArgumentParser(description="Let the autopilot play headless.")
+    parser.add_argument('--ticks', type=int, help="number of simulation ticks to run")
+    parser.add_argument('--minutes', type=float, default=5.0, help="simulated minutes to run (default: 5)")
+    parser.add_argument('--seed', type=int, help="random seed (default: a new one per run)")
+    args = parser.parse_args(argv)
+
+    max_ticks = args.ticks if args.ticks is not None else int(args.minutes * 60 * FPS)
+    stats = HeadlessGame(args.seed).run(max_ticks, Autopilot(), args.seed)
+    print_report(stats)
+    return stats
+
+if __name__ == "__main__":
+    main()
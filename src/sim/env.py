@@ -0,0 +1,311 @@
+"""
+GameScene as an environment for bots and agents.
+
+GameEnv wraps one headless game behind reset(seed) / step(action).
+Observations are NumPy arrays, not pygame objects:
+
+    entities  float32 (MAX_ENTITIES, 6)  kind, x, y, vx, vy, width per entity
+                                         (positions/sizes / screen size,
+                                         velocities in px per tick / 10);
+                                         zero rows are empty slots
+    stats     float32 (8,)               ship x, y, lives, bullets, missiles,
+                                         ship level, game level, paused
+    pixels    uint8 (h, w)               optional grayscale sprite render
+
+reset() and step() return fresh arrays the caller owns, so observations
+can be kept (e.g. appended to a trajectory) and stay valid after the next
+step or close().
+
+An action is an int in range(ACTIONS): move (index into MOVES) + 9 * fire
++ 18 * missile. It reaches the ship through the same held-key/KEYDOWN
+input path a human uses.
+
+VectorGameEnv steps N independent games at once, in this process or
+spread over worker processes that write observations straight into
+shared memory.
+"""
+
+import numpy as np
+import pygame
+import multiprocessing
+from multiprocessing import shared_memory
+from src.config import *
+from src.sim.headless import HeadlessGame
+from src.sim.input import IdleInput
+from src.sim.autopilot import MOVES, move_keys
+
+MAX_ENTITIES = 128
+ENTITY_FEATURES = 6
+STATS = 8
+ACTIONS = len(MOVES) * 4
+
+# Entity kind codes in the observation, in the order groups are packed
+KINDS = (
+    ('enemy_projectiles', 1),
+    ('asteroids', 2),
+    ('chasers', 3),
+    ('shooters', 4),
+    ('bosses', 5),
+    ('powerups', 6),
+    ('bullets', 7)
+)
+
+class ActionInput(IdleInput):
+    """Input provider holding the keys and presses of the latest action."""
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def set_action(self, action):
+        move, fire, missile = action % len(MOVES), (action // len(MOVES)) % 2, action // (len(MOVES) * 2)
+        self.keys = move_keys(*MOVES[move])
+        self.events = []
+        if fire:
+            self.events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        if missile:
+            self.events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_m))
+
+    def get_events(self):
+        # Presses apply to the first tick of an action only
+        events = self.events
+        self.events = []
+        return events
+
+class GameEnv:
+    """
+    One headless game. step() returns (observation, reward, done, info);
+    the reward is the score gained, done is game over or `max_ticks`
+    reached (info['truncated']). Each step runs `frame_skip` ticks.
+    """
+
+    def __init__(self, frame_skip=1, max_ticks=None, pixels=None):
+        self.game = HeadlessGame()
+        self.controls = ActionInput()
+        self.frame_skip = frame_skip
+        self.max_ticks = max_ticks
+        self.pixel_size = pixels
+        self.scene = None
+        self.ticks = 0
+
+        self.observation = {
+            'entities': np.zeros((MAX_ENTITIES, ENTITY_FEATURES), np.float32),
+            'stats': np.zeros(STATS, np.float32)
+        }
+        if pixels is not None:
+            self.canvas = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.small = pygame.Surface(pixels)
+            self.observation['pixels'] = np.zeros((pixels[1], pixels[0]), np.uint8)
+
+    def reset(self, seed=None):
+        self.restart(seed)
+        return copy_observation(self.observe())
+
+    def step(self, action):
+        reward, done, info = self.advance(action)
+        return copy_observation(self.observe()), reward, done, info
+
+    def restart(self, seed=None):
+        """Start a new game without building an observation."""
+        self.scene = self.game.new_scene(self.controls, seed)
+        self.ticks = 0
+
+    def advance(self, action):
+        """Run one step's ticks; returns (reward, done, info) without building an observation."""
+        scene = self.scene
+        self.controls.set_action(int(action))
+        start_score = scene.score
+        for _ in range(self.frame_skip):
+            self.game.tick()
+            self.ticks += 1
+            if scene.game_over:
+                break
+        truncated = self.max_ticks is not None and self.ticks >= self.max_ticks and not scene.game_over
+        info = {'score': scene.score, 'lives': scene.lives, 'level': scene.level, 'ticks': self.ticks,
+                'truncated': truncated}
+        return scene.score - start_score, scene.game_over or truncated, info
+
+    def observe(self):
+        """
+        Fill the observation arrays in place from the current scene and
+        return them. The arrays are reused by every call; reset() and step()
+        hand out copies.
+        """
+        scene = self.scene
+        rows = []
+        for group, kind in KINDS:
+            for sprite in getattr(scene, group):
+                rect = sprite.rect
+                px, py = sprite.prev_center
+                rows.append((kind, rect.x, rect.y, rect.centerx - px, rect.centery - py, rect.width))
+        entities = self.observation['entities']
+        entities.fill(0)
+        if rows:
+            rows = np.array(rows[:MAX_ENTITIES], np.float32)
+            rows[:, (1, 5)] /= SCREEN_WIDTH
+            rows[:, 2] /= SCREEN_HEIGHT
+            rows[:, 3:5] /= 10
+            entities[:len(rows)] = rows
+
+        ship = scene.spaceship
+        self.observation['stats'][:] = (
+            ship.rect.x / SCREEN_WIDTH, ship.rect.y / SCREEN_HEIGHT,
+            scene.lives / MAX_LIVES, ship.available_bullets / MAX_BULLETS, ship.missiles / MAX_MISSILES,
+            ship.level / SPACESHIP_LEVEL_MAX, scene.level, scene.paused
+        )
+
+        if self.pixel_size is not None:
+            self.render_pixels()
+        return self.observation
+
+    def render_pixels(self):
+        """Sprites only (no background or HUD), scaled down to grayscale."""
+        self.canvas.fill((0, 0, 0))
+        self.scene.draw_sprites(self.canvas)
+        pygame.transform.scale(self.canvas, self.pixel_size, self.small)
+        gray = pygame.transform.grayscale(self.small)
+        # surfarray is (x, y); observations are (row, column)
+        self.observation['pixels'][:] = pygame.surfarray.pixels_red(gray).T
+
+def copy_observation(observation):
+    return {name: array.copy() for name, array in observation.items()}
+
+def observation_spec(pixels=None):
+    """{name: (shape, dtype)} of a GameEnv observation."""
+    spec = {
+        'entities': ((MAX_ENTITIES, ENTITY_FEATURES), np.float32),
+        'stats': ((STATS,), np.float32)
+    }
+    if pixels is not None:
+        spec['pixels'] = ((pixels[1], pixels[0]), np.uint8)
+    return spec
+
+def _run_worker(conn, shm_names, total, start, count, env_kwargs):
+    """Worker process: owns envs [start, start + count) and their slice of the shared buffers."""
+    envs = [GameEnv(**env_kwargs) for _ in range(count)]
+    blocks = {name: shared_memory.SharedMemory(name=shm_name) for name, shm_name in shm_names.items()}
+    views = {name: np.ndarray((total,) + shape, dtype, buffer=blocks[name].buf)[start:start + count]
+             for name, (shape, dtype) in observation_spec(env_kwargs.get('pixels')).items()}
+    try:
+        while True:
+            command, data = conn.recv()
+            if command == 'reset':
+                for i, (env, seed) in enumerate(zip(envs, data)):
+                    env.restart(seed)
+                    _write(views, i, env.observe())
+                conn.send(None)
+            elif command == 'step':
+                conn.send(_step_envs(envs, data, views))
+            elif command == 'close':
+                break
+    finally:
+        del views
+        for block in blocks.values():
+            block.close()
+
+def _write(views, i, observation):
+    for name, array in observation.items():
+        views[name][i] = array
+
+def _step_envs(envs, actions, views):
+    """Step each env, auto-resetting finished games; returns (rewards, dones, infos)."""
+    rewards, dones, infos = [], [], []
+    for i, (env, action) in enumerate(zip(envs, actions)):
+        reward, done, info = env.advance(action)
+        if done:
+            env.restart()
+        _write(views, i, env.observe())
+        rewards.append(reward)
+        dones.append(done)
+        infos.append(info)
+    return rewards, dones, infos
+
+class VectorGameEnv:
+    """
+    N independent GameEnvs stepped together. Observations are batched
+    arrays with a leading N axis; a game that ends is reset straight away
+    (its final info is still returned for that step).
+
+    With `workers` the envs are split across that many processes, which
+    write observations into shared memory, so only actions, rewards and
+    infos cross the pipes. reset() and step() return copies of the shared
+    arrays, so close() (call it when done) never pulls memory out from
+    under an observation still in use.
+    """
+
+    def __init__(self, num_envs, workers=None, **env_kwargs):
+        self.num_envs = num_envs
+        self.spec = observation_spec(env_kwargs.get('pixels'))
+        self.workers = []
+        self.blocks = {}
+
+        if not workers:
+            self.envs = [GameEnv(**env_kwargs) for _ in range(num_envs)]
+            self.observation = {name: np.zeros((num_envs,) + shape, dtype)
+                                for name, (shape, dtype) in self.spec.items()}
+            return
+
+        self.envs = None
+        for name, (shape, dtype) in self.spec.items():
+            size = int(np.prod((num_envs,) + shape)) * np.dtype(dtype).itemsize
+            self.blocks[name] = shared_memory.SharedMemory(create=True, size=size)
+        self.observation = {name: np.ndarray((num_envs,) + shape, dtype, buffer=self.blocks[name].buf)
+                            for name, (shape, dtype) in self.spec.items()}
+
+        context = multiprocessing.get_context('spawn')
+        shm_names = {name: block.name for name, block in self.blocks.items()}
+        per_worker = -(-num_envs // workers)
+        for start in range(0, num_envs, per_worker):
+            count = min(per_worker, num_envs - start)
+            parent, child = context.Pipe()
+            process = context.Process(target=_run_worker, daemon=True,
+                                      args=(child, shm_names, num_envs, start, count, env_kwargs))
+            process.start()
+            child.close()
+            self.workers.append((parent, process, start, count))
+
+    def reset(self, seeds=None):
+        seeds = list(seeds) if seeds is not None else [None] * self.num_envs
+        if self.envs is not None:
+            for i, (env, seed) in enumerate(zip(self.envs, seeds)):
+                env.restart(seed)
+                _write(self.observation, i, env.observe())
+            return copy_observation(self.observation)
+        for conn, _, start, count in self.workers:
+            conn.send(('reset', seeds[start:start + count]))
+        for conn, _, _, _ in self.workers:
+            conn.recv()
+        return copy_observation(self.observation)
+
+    def step(self, actions):
+        """Returns (observations, rewards, dones, infos) for all envs."""
+        actions = [int(action) for action in actions]
+        if self.envs is not None:
+            rewards, dones, infos = _step_envs(self.envs, actions, self.observation)
+        else:
+            for conn, _, start, count in self.workers:
+                conn.send(('step', actions[start:start + count]))
+            rewards, dones, infos = [], [], []
+            for conn, _, _, _ in self.workers:
+                worker_rewards, worker_dones, worker_infos = conn.recv()
+                rewards += worker_rewards
+                dones += worker_dones
+                infos += worker_infos
+        return copy_observation(self.observation), np.array(rewards, np.float32), np.array(dones), infos
+
+    def close(self):
+        for conn, process, _, _ in self.workers:
+            conn.send(('close', None))
+        for conn, process, _, _ in self.workers:
+            process.join(5)
+            if process.is_alive():
+                # SIGKILL, since pygame swallows the SIGTERM from terminate()
+                process.kill()
+                process.join()
+            conn.close()
+        self.workers = []
+        self.observation = {}
+        for block in self.blocks.values():
+            block.close()
+            block.unlink()
+        self.blocks = {}
@@ -0,0 +1,142 @@
+"""
+Headless fast-forward mode.
+
+Runs GameScene without a window: SDL uses its dummy video/audio drivers,
+game time comes from a manual GameClock that advances 1/FPS seconds per
+tick, and update() is stepped back to back as fast as the CPU allows with
+rendering skipped entirely.
+
+    python -m src.sim.headless --minutes 10
+"""
+
+import os
+import time
+import argparse
+
+# Must be set before pygame initialises its video/audio subsystems
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from src.config import *
+from src.core.clock import GameClock
+from src.core.rng import RandomStreams
+from src.core.state_manager import StateManager
+from src.scenes.game_scene import GameScene
+from src.sim.input import IdleInput
+from src.utils.asset_manager import AssetManager
+
+def init_headless():
+    """Initialise pygame with a 1x1 dummy display (enough for surface ops)."""
+    if not pygame.get_init():
+        pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+class HeadlessGameScene(GameScene):
+    """GameScene that never draws and stops in place at game over."""
+
+    def end_game(self):
+        self.game_over = True
+
+    def render(self, screen):
+        pass
+
+class HeadlessGame:
+    """
+    Stand-in for Game in headless runs: same asset_manager/state_manager/clock
+    attributes the scenes use, no window, database or music.
+    """
+
+    headless = True
+
+    def __init__(self, seed=None):
+        init_headless()
+        self.clock = GameClock()
+        self.tick_ms = 1000 / FPS
+        # Own random streams, so several games in one process stay independent
+        self.rng = RandomStreams(seed)
+        # PhaseTimer handed to every new scene, if profiling
+        self.phases = None
+        self.asset_manager = AssetManager()
+        self.state_manager = StateManager(self)
+
+    def new_scene(self, controls=None, seed=None, start_time=0.0):
+        """
+        Start a fresh GameScene, driven by `controls` (default: no input).
+        The same seed, start time and inputs replay the same game.
+        """
+        self.clock = GameClock(start=start_time)
+        self.controls = controls or IdleInput()
+        scene = HeadlessGameScene(self, seed)
+        scene.spaceship.controls = self.controls
+        # Optional hook for providers that read the scene (e.g. Autopilot)
+        attach = getattr(self.controls, 'attach', None)
+        if attach is not None:
+            attach(scene)
+        if self.phases is not None:
+            scene.phases = self.phases
+        self.state_manager.change_scene(scene)
+        return scene
+
+    def tick(self):
+        """Advance the current scene by one simulation tick."""
+        scene = self.state_manager.current_scene
+        self.clock.step(self.tick_ms)
+        scene.process_input(self.controls.get_events())
+        scene.update()
+
+    def run(self, max_ticks, controls=None, seed=None, start_time=0.0):
+        """
+        Play a new game until game over or `max_ticks`; returns the run stats.
+        """
+        scene = self.new_scene(controls, seed, start_time)
+        start = time.perf_counter()
+        ticks = 0
+        while ticks < max_ticks and not scene.game_over:
+            self.tick()
+            ticks += 1
+        elapsed = time.perf_counter() - start
+
+        simulated = ticks / FPS
+        return {
+            'ticks': ticks,
+            'wall_time': elapsed,
+            'ticks_per_sec': ticks / elapsed if elapsed else 0.0,
+            'simulated_time': simulated,
+            'speedup': simulated / elapsed if elapsed else 0.0,
+            'score': scene.score,
+            'level': scene.level,
+            'lives': scene.lives,
+            'game_over': scene.game_over,
+            'seed': scene.seed
+        }
+
+def print_report(stats):
+    print("=" * 60)
+    print("HEADLESS RUN")
+    print("=" * 60)
+    print(f"Seed:            {stats['seed']}")
+    print(f"Ticks:           {stats['ticks']}")
+    print(f"Simulated time:  {stats['simulated_time']:.1f} s")
+    print(f"Wall time:       {stats['wall_time']:.2f} s")
+    print(f"Ticks/sec:       {stats['ticks_per_sec']:.0f}")
+    print(f"Speedup:         {stats['speedup']:.1f}x real time")
+    print(f"Final score:     {stats['score']} (level {stats['level']}, {stats['lives']} lives)")
+    print(f"Game over:       {stats['game_over']}")
+    print("=" * 60)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run GameScene headless as fast as possible.")
+    parser.add_argument('--ticks', type=int, help="number of simulation ticks to run")
+    parser.add_argument('--minutes', type=float, default=1.0, help="simulated minutes to run (default: 1)")
+    parser.add_argument('--seed', type=int, help="random seed (default: a new one per run)")
+    args = parser.parse_args(argv)
+
+    max_ticks = args.ticks if args.ticks is not None else int(args.minutes * 60 * FPS)
+    stats = HeadlessGame(args.seed).run(max_ticks)
+    print_report(stats)
+    return stats
+
+if __name__ == "__main__":
+    main()
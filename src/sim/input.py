@@ -0,0 +1,36 @@
+class KeyState:
+    """
+    Held keys in the shape of pygame.key.get_pressed(): indexing with a key
+    constant (e.g. keys[pygame.K_LEFT]) returns whether it is down.
+    """
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+    def __eq__(self, other):
+        return isinstance(other, KeyState) and self.pressed == other.pressed
+
+    def __hash__(self):
+        return hash(self.pressed)
+
+class IdleInput:
+    """
+    Input provider that never presses anything.
+
+    Input providers stand in for the keyboard in headless runs: get_events()
+    returns the events for the coming tick (what pygame.event.get() would
+    return) and get_pressed() the held keys during it. A provider may also
+    define attach(scene), called with each new scene it drives.
+    """
+
+    def __init__(self):
+        self.keys = KeyState()
+
+    def get_events(self):
+        return []
+
+    def get_pressed(self):
+        return self.keys
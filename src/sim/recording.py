@@ -0,0 +1,162 @@
+"""
+Compact binary recordings of per-tick GameScene input.
+
+A recording holds the seed and clock time the game started from, plus every
+change to the held movement keys (what Spaceship.update() reads) and every
+KEYDOWN that GameScene.process_input() acts on, each stamped with the tick
+it was applied before. Only changes are stored, as a varint tick delta and
+one byte, so a minute of play takes a few hundred bytes to a few KB.
+
+File layout (little endian):
+    header  magic b'STIR', version u8, fps u16, seed u64, start time f64 (ms), ticks u32
+    records varint ticks since previous record, u8 entry
+            entry high nibble 0: held keys changed, low nibble = key mask
+            entry high nibble n > 0: KEYDOWN of EVENT_KEYS[n - 1]
+"""
+
+import struct
+import pygame
+from src.config import *
+from src.sim.input import KeyState
+
+MAGIC = b'STIR'
+VERSION = 1
+HEADER = struct.Struct('<4sBHQdI')
+
+# Held keys, one bit each in the key mask
+HELD_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN)
+# KEYDOWN events GameScene.process_input() handles
+EVENT_KEYS = (pygame.K_p, pygame.K_m, pygame.K_SPACE)
+
+def key_mask(keys):
+    """Pack the held movement keys of a get_pressed()-style state into bits."""
+    mask = 0
+    for bit, key in enumerate(HELD_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+def mask_keys(mask):
+    return KeyState(key for bit, key in enumerate(HELD_KEYS) if mask & (1 << bit))
+
+def write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def read_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+class Recording:
+    """
+    Decoded input recording: `entries` is a list of (tick, entry) pairs in
+    tick order, using the same entry byte as the file format.
+    """
+
+    def __init__(self, seed, start_time=0.0, ticks=0, entries=None, fps=FPS):
+        self.seed = seed
+        self.start_time = start_time
+        self.ticks = ticks
+        self.entries = entries if entries is not None else []
+        self.fps = fps
+
+    def to_bytes(self):
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.fps, self.seed, self.start_time, self.ticks))
+        last_tick = 0
+        for tick, entry in self.entries:
+            write_varint(out, tick - last_tick)
+            out.append(entry)
+            last_tick = tick
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, fps, seed, start_time, ticks = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not an input recording")
+        if version != VERSION:
+            raise ValueError(f"Unsupported recording version {version}")
+        entries = []
+        tick = 0
+        pos = HEADER.size
+        while pos < len(data):
+            delta, pos = read_varint(data, pos)
+            tick += delta
+            entries.append((tick, data[pos]))
+            pos += 1
+        return cls(seed, start_time, ticks, entries, fps)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+class InputRecorder:
+    """
+    Builds a Recording from live input. Per frame the game loop calls
+    record_events() with the frame's events before processing them, and
+    per tick record_keys() with the held keys before update(), then
+    end_tick() after it.
+    """
+
+    def __init__(self, seed, start_time=0.0):
+        self.recording = Recording(seed, start_time)
+        self.tick = 0
+        self.mask = 0
+
+    def record_events(self, events):
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key in EVENT_KEYS:
+                code = EVENT_KEYS.index(event.key) + 1
+                self.recording.entries.append((self.tick, code << 4))
+
+    def record_keys(self, keys):
+        mask = key_mask(keys)
+        if mask != self.mask:
+            self.recording.entries.append((self.tick, mask))
+            self.mask = mask
+
+    def end_tick(self):
+        self.tick += 1
+        self.recording.ticks = self.tick
+
+class ReplayInput:
+    """
+    Input provider that plays a Recording back, one tick per get_events()
+    call (see IdleInput).
+    """
+
+    def __init__(self, recording):
+        self.recording = recording
+        self.keys = KeyState()
+        self.tick = 0
+        self._next = 0
+
+    def get_events(self):
+        events = []
+        entries = self.recording.entries
+        while self._next < len(entries) and entries[self._next][0] <= self.tick:
+            entry = entries[self._next][1]
+            if entry >> 4:
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=EVENT_KEYS[(entry >> 4) - 1]))
+            else:
+                self.keys = mask_keys(entry)
+            self._next += 1
+        self.tick += 1
+        return events
+
+    def get_pressed(self):
+        return self.keys
@@ -0,0 +1,147 @@
+"""
+Replay-corpus regression runner.
+
+Replays every recording in a directory headless, hashes the final game
+state and measures throughput, then compares both against a baseline JSON:
+
+    python -m src.sim.regression recordings/ --baseline baseline.json
+    python -m src.sim.regression recordings/ --baseline baseline.json --update
+
+A run fails when any final state differs from the baseline (the simulation
+changed behaviour) or when ticks/sec drops more than --threshold below it.
+Without an existing baseline (or with --update) the results are written as
+the new baseline.
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+from src.core.profiler import PhaseTimer
+from src.sim.headless import HeadlessGame
+from src.sim.recording import Recording
+from src.sim.replay import replay
+
+BASELINE_VERSION = 1
+
+def final_state(scene, stats):
+    """The parts of a finished game that must match exactly between runs."""
+    return {
+        'ticks': stats['ticks'],
+        'score': scene.score,
+        'level': scene.level,
+        'lives': scene.lives,
+        'game_over': scene.game_over,
+        'entities': scene.culler.live_counts()
+    }
+
+def state_hash(state):
+    encoded = json.dumps(state, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+def run_recording(game, recording, repeat=1):
+    """
+    Replay `recording` `repeat` times; returns its final state, hash, best
+    ticks/sec and the per-phase timings (ms per tick) of the fastest run.
+    """
+    best = None
+    for _ in range(repeat):
+        phases = PhaseTimer()
+        game.phases = phases
+        stats = replay(recording, game)
+        scene = game.state_manager.current_scene
+        if best is None or stats['ticks_per_sec'] > best['ticks_per_sec']:
+            state = final_state(scene, stats)
+            best = {
+                'state': state,
+                'state_hash': state_hash(state),
+                'ticks_per_sec': round(stats['ticks_per_sec'], 1),
+                'phases_ms': {name: round(ms, 4) for name, ms in phases.average_ms().items()}
+            }
+    game.phases = None
+    return best
+
+def run_corpus(directory, repeat=1):
+    """Results for every .stir recording in `directory`, keyed by file name."""
+    game = HeadlessGame()
+    results = {}
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.stir'):
+            recording = Recording.load(os.path.join(directory, name))
+            results[name] = run_recording(game, recording, repeat)
+    return results
+
+def compare(results, baseline, threshold):
+    """List of failure messages for `results` against `baseline` recordings."""
+    failures = []
+    for name, expected in baseline.items():
+        result = results.get(name)
+        if result is None:
+            failures.append(f"{name}: recording missing from corpus")
+            continue
+        if result['state_hash'] != expected['state_hash']:
+            failures.append(f"{name}: final state diverged ({expected['state']} -> {result['state']})")
+        floor = expected['ticks_per_sec'] * (1 - threshold)
+        if result['ticks_per_sec'] < floor:
+            failures.append(f"{name}: throughput regressed ({expected['ticks_per_sec']:.0f} -> "
+                            f"{result['ticks_per_sec']:.0f} ticks/sec, floor {floor:.0f})")
+    return failures
+
+def load_baseline(path):
+    with open(path) as f:
+        data = json.load(f)
+    if data.get('version') != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version {data.get('version')}")
+    return data['recordings']
+
+def save_baseline(path, results):
+    with open(path, 'w') as f:
+        json.dump({'version': BASELINE_VERSION, 'recordings': results}, f, indent=2, sort_keys=True)
+
+def print_results(results, baseline):
+    print("=" * 60)
+    print("REPLAY REGRESSION")
+    print("=" * 60)
+    for name, result in results.items():
+        expected = baseline.get(name) if baseline else None
+        change = ""
+        if expected:
+            change = f" ({(result['ticks_per_sec'] / expected['ticks_per_sec'] - 1) * 100:+.1f}%)"
+        print(f"{name}")
+        print(f"  state {result['state_hash']}  score {result['state']['score']}  ticks {result['state']['ticks']}")
+        print(f"  {result['ticks_per_sec']:.0f} ticks/sec{change}")
+        phases = ", ".join(f"{phase} {ms:.3f}" for phase, ms in result['phases_ms'].items())
+        print(f"  ms/tick: {phases}")
+    print("=" * 60)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recording corpus and check it against a baseline.")
+    parser.add_argument('corpus', help="directory of .stir recordings")
+    parser.add_argument('--baseline', default='replay_baseline.json', help="baseline JSON path")
+    parser.add_argument('--update', action='store_true', help="overwrite the baseline with this run")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="allowed ticks/sec drop as a fraction of the baseline (default: 0.2)")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per recording; the fastest counts (default: 3)")
+    args = parser.parse_args(argv)
+
+    results = run_corpus(args.corpus, args.repeat)
+    baseline = None
+    if os.path.exists(args.baseline) and not args.update:
+        baseline = load_baseline(args.baseline)
+    print_results(results, baseline)
+
+    if baseline is None:
+        save_baseline(args.baseline, results)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    failures = compare(results, baseline, args.threshold)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if not failures:
+        print(f"OK: {len(results)} recordings match {args.baseline}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+"""
+Replay a recorded game headless at maximum speed.
+
+    python -m src.sim.replay recordings/20250101-120000-1234.stir
+"""
+
+import argparse
+from src.sim.headless import HeadlessGame, print_report
+from src.sim.recording import Recording, ReplayInput
+
+def replay(recording, game=None):
+    """Play `recording` back headless; returns the run stats (see HeadlessGame.run)."""
+    game = game or HeadlessGame()
+    controls = ReplayInput(recording)
+    return game.run(recording.ticks, controls, recording.seed, recording.start_time)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay an input recording headless.")
+    parser.add_argument('path', help="recording file (.stir)")
+    args = parser.parse_args(argv)
+
+    recording = Recording.load(args.path)
+    stats = replay(recording)
+    print_report(stats)
+    return stats
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Difficulty sweep over config parameters.
+
+Fans headless autopilot games out over a multiprocessing pool, for every
+combination of the given parameter values and every seed, and writes
+survival time, score distribution and peak entity counts per combination
+to CSV:
+
+    python -m src.sim.sweep --param DIFFICULTY_MULTIPLIER=0.8,0.9 \\
+        --param BOSS_DIFFICULTY_TIERS.STRONG.projectile_count=4,6 --seeds 16 --out sweep.csv
+
+Parameters are config.py names; BOSS_DIFFICULTY_TIERS fields are addressed
+as BOSS_DIFFICULTY_TIERS.<tier>.<field>. Every run is independent, so the
+sweep scales with the number of worker processes.
+"""
+
+import os
+import sys
+import csv
+import ast
+import copy
+import time
+import argparse
+import itertools
+import multiprocessing
+from src import config
+from src.config import FPS
+from src.core.frame_stats import percentiles
+
+def apply_overrides(overrides, defaults=None):
+    """
+    Set config values for this process. Modules import config with
+    `from src.config import *`, so each loaded src module's copy is rebound
+    too; dotted names mutate the shared dict in place. With `defaults`
+    (from snapshot_defaults) everything else is restored first.
+    """
+    if defaults is not None:
+        for name, value in defaults.items():
+            _set_value(name, copy.deepcopy(value))
+    for name, value in overrides.items():
+        _set_value(name, value)
+
+def snapshot_defaults(names):
+    """Current values of the top-level config names behind `names`."""
+    return {name.split('.')[0]: copy.deepcopy(getattr(config, name.split('.')[0])) for name in names}
+
+def _get_value(name):
+    root, *path = name.split('.')
+    if not hasattr(config, root):
+        raise KeyError(f"Unknown config parameter {root}")
+    value = getattr(config, root)
+    for key in path:
+        value = value[key]
+    return value
+
+def _set_value(name, value):
+    root, *path = name.split('.')
+    if not hasattr(config, root):
+        raise KeyError(f"Unknown config parameter {root}")
+    if path:
+        target = getattr(config, root)
+        for key in path[:-1]:
+            target = target[key]
+        if path[-1] not in target:
+            raise KeyError(f"Unknown config parameter {name}")
+        target[path[-1]] = value
+        return
+    for module in list(sys.modules.values()):
+        if module is not None and getattr(module, '__name__', '').startswith('src') and hasattr(module, root):
+            setattr(module, root, value)
+
+def parameter_grid(params):
+    """Every combination of {name: [values]} as a list of {name: value}."""
+    names = list(params)
+    return [dict(zip(names, values)) for values in itertools.product(*(params[name] for name in names))]
+
+def parse_param(spec):
+    """'NAME=v1,v2' -> ('NAME', [v1, v2]), values as Python literals."""
+    name, _, values = spec.partition('=')
+    if not values:
+        raise argparse.ArgumentTypeError(f"Expected NAME=value[,value...], got {spec!r}")
+    parsed = ast.literal_eval(f"[{values}]")
+    return name.strip(), parsed
+
+# Worker state, set up once per process by _init_worker
+_worker = {}
+
+def _init_worker(max_ticks, names):
+    from src.sim.headless import HeadlessGame
+    _worker['game'] = HeadlessGame()
+    _worker['max_ticks'] = max_ticks
+    _worker['defaults'] = snapshot_defaults(names)
+
+def play(game, params, seed, max_ticks, defaults=None):
+    """One autopilot game under `params`; returns its survival, score and peak counts."""
+    from src.sim.autopilot import Autopilot
+
+    apply_overrides(params, defaults)
+    scene = game.new_scene(Autopilot(), seed)
+    peaks = dict.fromkeys(scene.culler.live_counts(), 0)
+    peak_total = 0
+    ticks = 0
+    while ticks < max_ticks and not scene.game_over:
+        game.tick()
+        ticks += 1
+        counts = scene.culler.live_counts()
+        total = 0
+        for name, count in counts.items():
+            total += count
+            if count > peaks[name]:
+                peaks[name] = count
+        if total > peak_total:
+            peak_total = total
+    return {
+        'seed': seed,
+        'survival': ticks / FPS,
+        'game_over': scene.game_over,
+        'score': scene.score,
+        'level': scene.level,
+        'peak_total': peak_total,
+        'peaks': peaks
+    }
+
+def _run_job(job):
+    index, params, seed = job
+    result = play(_worker['game'], params, seed, _worker['max_ticks'], _worker['defaults'])
+    return index, result
+
+def summarize(params, results):
+    """One CSV row for a parameter combination from its per-seed results."""
+    survival = [r['survival'] for r in results]
+    scores = [r['score'] for r in results]
+    score_p10, score_p50, score_p90 = percentiles(scores, (0.1, 0.5, 0.9))
+    row = dict(params)
+    row.update({
+        'runs': len(results),
+        'game_over_rate': sum(r['game_over'] for r in results) / len(results),
+        'survival_mean': sum(survival) / len(survival),
+        'survival_min': min(survival),
+        'survival_max': max(survival),
+        'score_mean': sum(scores) / len(scores),
+        'score_p10': score_p10,
+        'score_p50': score_p50,
+        'score_p90': score_p90,
+        'score_max': max(scores),
+        'level_mean': sum(r['level'] for r in results) / len(results),
+        'peak_total': max(r['peak_total'] for r in results)
+    })
+    for name in results[0]['peaks']:
+        row[f'peak_{name}'] = max(r['peaks'][name] for r in results)
+    return row
+
+def run_sweep(params, seeds, max_ticks, workers=None):
+    """
+    Play every parameter combination once per seed on `workers` processes;
+    returns one summary row per combination, in grid order.
+    """
+    grid = parameter_grid(params)
+    jobs = [(index, combo, seed) for index, combo in enumerate(grid) for seed in seeds]
+    results = [[] for _ in grid]
+
+    # Spawned workers start clean instead of inheriting this process's SDL state
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(workers, initializer=_init_worker, initargs=(max_ticks, list(params))) as pool:
+        for index, result in pool.imap_unordered(_run_job, jobs):
+            results[index].append(result)
+        # Let workers exit on their own: pygame catches the SIGTERM that terminate() sends
+        pool.close()
+        pool.join()
+
+    rows = []
+    for combo, combo_results in zip(grid, results):
+        combo_results.sort(key=lambda r: r['seed'])
+        rows.append(summarize(combo, combo_results))
+    return rows
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep config parameters with headless autopilot games.")
+    parser.add_argument('--param', action='append', type=parse_param, default=[], metavar='NAME=V1,V2',
+                        help="config parameter and the values to try (repeatable)")
+    parser.add_argument('--seeds', type=int, default=8, help="games per combination (default: 8)")
+    parser.add_argument('--seed-base', type=int, default=0, help="first seed (default: 0)")
+    parser.add_argument('--minutes', type=float, default=5.0, help="simulated minutes per game cap (default: 5)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="worker processes (default: all cores)")
+    parser.add_argument('--out', default='sweep.csv', help="CSV output path")
+    args = parser.parse_args(argv)
+
+    params = dict(args.param)
+    for name in params:
+        _get_value(name)  # Fail fast on unknown names
+    seeds = range(args.seed_base, args.seed_base + args.seeds)
+    max_ticks = int(args.minutes * 60 * FPS)
+
+    start = time.perf_counter()
+    rows = run_sweep(params, seeds, max_ticks, args.workers)
+    elapsed = time.perf_counter() - start
+    write_csv(args.out, rows)
+
+    games = len(rows) * len(seeds)
+    print("=" * 60)
+    print("DIFFICULTY SWEEP")
+    print("=" * 60)
+    print(f"Combinations:    {len(rows)}")
+    print(f"Games:           {games} on {args.workers} workers")
+    print(f"Wall time:       {elapsed:.1f} s ({games / elapsed:.2f} games/sec)")
+    print(f"Results:         {args.out}")
+    print("=" * 60)
+    return rows
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,13 @@
 import pygame
+from src.utils.text_cache import text_cache
+from src.utils.fonts import get_font
 
 class Button:
     def __init__(self, x, y, width, height, text, font_size=36, 
                  idle_color=(100, 100, 100), hover_color=(150, 150, 150), text_color=(255, 255, 255)):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
-        self.font = pygame.font.SysFont(None, font_size)
+        self.font = get_font(font_size)
         self.idle_color = idle_color
         self.hover_color = hover_color
         self.text_color = text_color
@@ -18,7 +20,7 @@ class Button:
         color = self.hover_color if self.is_hovered else self.idle_color
         pygame.draw.rect(screen, color, self.rect, border_radius=10)
 
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = text_cache.render(self.font, self.text, True, self.text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
 
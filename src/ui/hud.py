@@ -1,38 +1,72 @@
 import pygame
 from src.config import *
+from src.utils.text_cache import text_cache
+from src.utils.fonts import get_font
 
 class HUD:
+    """
+    Retained-mode HUD: the glass panels are rendered once per size, and
+    each bar (fill plus numeric text) and the score box are recomposed
+    only when their value changes. An unchanged HUD is a handful of blits.
+    """
+
     def __init__(self, asset_manager):
         self.assets = asset_manager.assets
-        self.font = pygame.font.SysFont(None, int(SCREEN_HEIGHT * 0.04))  # ~36px at 900p
+        self.font = get_font(int(SCREEN_HEIGHT * 0.04))  # ~36px at 900p
+        # (width, height) -> empty glass panel
+        self.panels = {}
+        # Bar position/style -> ((fill_percent, numeric_text), composed bar surface)
+        self.bars = {}
+        # (score, composed score box)
+        self.score_box = (None, None)
 
-    def draw_glass_bar(self, screen, x, y, width, height, fill_percent, color, label=None, numeric_text=None):
-        # Background (Glass)
-        bg_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        pygame.draw.rect(bg_surface, GLASS_BG, (0, 0, width, height), border_radius=10)
-        pygame.draw.rect(bg_surface, GLASS_BORDER, (0, 0, width, height), 2, border_radius=10)
-        screen.blit(bg_surface, (int(x), int(y)))
+    def glass_panel(self, width, height):
+        panel = self.panels.get((width, height))
+        if panel is None:
+            panel = pygame.Surface((width, height), pygame.SRCALPHA)
+            pygame.draw.rect(panel, GLASS_BG, (0, 0, width, height), border_radius=10)
+            pygame.draw.rect(panel, GLASS_BORDER, (0, 0, width, height), 2, border_radius=10)
+            self.panels[(width, height)] = panel
+        return panel
+
+    def render_bar(self, width, height, fill_percent, color, numeric_text):
+        bar = self.glass_panel(width, height).copy()
 
         # Fill
         if fill_percent > 0:
             fill_width = int((width - 10) * fill_percent)
-            fill_rect = pygame.Rect(int(x + 5), int(y + 5), fill_width, height - 10)
-            pygame.draw.rect(screen, color, fill_rect, border_radius=8)
+            pygame.draw.rect(bar, color, (5, 5, fill_width, height - 10), border_radius=8)
 
-        # Numeric text inside the bar
+        # Numeric text inside the bar, centered both horizontally and vertically
         if numeric_text:
+            # Values change all game and the bar itself is retained, so they skip the shared text cache
             numeric_surf = self.font.render(numeric_text, True, WHITE)
-            numeric_rect = numeric_surf.get_rect()
-            # Position text inside the bar, centered both horizontally and vertically
-            text_x = x + (width - numeric_rect.width) // 2
-            text_y = y + (height - numeric_rect.height) // 2
-            screen.blit(numeric_surf, (int(text_x), int(text_y)))
+            bar.blit(numeric_surf, ((width - numeric_surf.get_width()) // 2, (height - numeric_surf.get_height()) // 2))
+        return bar
+
+    def draw_glass_bar(self, screen, x, y, width, height, fill_percent, color, label=None, numeric_text=None):
+        key = (int(x), int(y), width, height, color)
+        state = (fill_percent, numeric_text)
+        cached_state, bar = self.bars.get(key, (None, None))
+        if bar is None or cached_state != state:
+            bar = self.render_bar(width, height, fill_percent, color, numeric_text)
+            self.bars[key] = (state, bar)
+        screen.blit(bar, (int(x), int(y)))
 
         # Label
         if label:
-            label_surf = self.font.render(label, True, WHITE)
+            label_surf = text_cache.render(self.font, label, True, WHITE)
             screen.blit(label_surf, (int(x + 10), int(y - 25)))
 
+    def render_score_box(self, score):
+        text_surf = self.font.render(f"Score: {score}", True, WHITE)
+        text_width = text_surf.get_width() + int(SCREEN_WIDTH * 0.025)  # 2.5% padding
+        score_height = int(SCREEN_HEIGHT * 0.056)  # ~50px at 900p
+        box = self.glass_panel(text_width, score_height).copy()
+        # Text starts half the padding in, vertically centered
+        box.blit(text_surf, (int(SCREEN_WIDTH * 0.0125), (score_height - text_surf.get_height()) // 2))
+        return box
+
     def draw(self, screen, lives, max_lives, available_bullets, max_bullets, score, level, missiles, max_missiles):
         # Bar dimensions based on screen size
         bar_width = int(SCREEN_WIDTH * 0.125)  # 12.5% of screen width (~200px at 1600px)
@@ -61,16 +95,10 @@ class HUD:
         self.draw_glass_bar(screen, missile_x, missile_y, bar_width, bar_height, missiles / max_missiles, MISSILE_COLOR, "Missiles (M)", missile_text)
 
         # Score (Top Right)
-        score_text = f"Score: {score}"
-        text_surf = self.font.render(score_text, True, WHITE)
-        text_width = text_surf.get_width() + int(SCREEN_WIDTH * 0.025)  # 2.5% padding
-        score_height = int(SCREEN_HEIGHT * 0.056)  # ~50px at 900p
-        
-        bg_surface = pygame.Surface((text_width, score_height), pygame.SRCALPHA)
-        pygame.draw.rect(bg_surface, GLASS_BG, (0, 0, text_width, score_height), border_radius=10)
-        pygame.draw.rect(bg_surface, GLASS_BORDER, (0, 0, text_width, score_height), 2, border_radius=10)
-        
-        score_x = SCREEN_WIDTH - text_width - margin
+        cached_score, box = self.score_box
+        if box is None or cached_score != score:
+            box = self.render_score_box(score)
+            self.score_box = (score, box)
+        score_x = SCREEN_WIDTH - box.get_width() - margin
         score_y = int(SCREEN_HEIGHT * 0.022)
-        screen.blit(bg_surface, (int(score_x), score_y))
-        screen.blit(text_surf, (int(SCREEN_WIDTH - text_width), int(score_y + (score_height - text_surf.get_height()) // 2)))
+        screen.blit(box, (int(score_x), score_y))
@@ -0,0 +1,96 @@
+import pygame
+from src.config import *
+from src.utils.fonts import get_font
+
+# Phases in display order; anything else a scene marks is listed after them
+PHASE_LABELS = (
+    ('input', 'Input'),
+    ('spawn', 'Spawn'),
+    ('entities', 'Entity updates'),
+    ('collisions', 'Collisions'),
+    ('progression', 'Progression'),
+    ('culling', 'Culling'),
+    ('background', 'Background.update'),
+    ('background_draw', 'Background.draw'),
+    ('sprites', 'Sprite draw'),
+    ('hud', 'HUD.draw'),
+    ('overlay', 'Profiler overlay'),
+    ('display', 'display.update')
+)
+
+class ProfilerOverlay:
+    """
+    Debug panel for a FrameProfiler: a rolling frame-time graph against the
+    1/FPS budget, mean per-phase milliseconds per frame, and the size of
+    every sprite group on the current scene. The text is re-rendered a few
+    times a second; only the graph is redrawn every frame.
+    """
+
+    def __init__(self, profiler, refresh_frames=15):
+        self.profiler = profiler
+        self.refresh_frames = refresh_frames
+        self.font = get_font(20)
+        self.line_height = self.font.get_linesize()
+        self.width = 300
+        self.graph_height = 80
+        self.padding = 8
+        self.budget_ms = 1000 / FPS
+        self.text = None
+        self.panel = None
+        self.frames_since_refresh = 0
+
+    def draw(self, screen, scene):
+        self.frames_since_refresh += 1
+        if self.text is None or self.frames_since_refresh >= self.refresh_frames:
+            self.text = self.render_text(scene)
+            self.frames_since_refresh = 0
+            height = self.graph_height + self.text.get_height() + self.padding * 3
+            if self.panel is None or self.panel.get_height() != height:
+                self.panel = pygame.Surface((self.width, height), pygame.SRCALPHA)
+                self.panel.fill(GLASS_BG)
+
+        x, y = self.padding, self.padding
+        screen.blit(self.panel, (x, y))
+        self.draw_graph(screen, pygame.Rect(x + self.padding, y + self.padding,
+                                            self.width - self.padding * 2, self.graph_height))
+        screen.blit(self.text, (x + self.padding, y + self.graph_height + self.padding * 2))
+
+    def draw_graph(self, screen, rect):
+        frame_times = self.profiler.frame_times
+        # Keep the budget line at half height unless a frame needs more room
+        scale_ms = max(self.budget_ms * 2, max(frame_times, default=0))
+        budget_y = rect.bottom - int(rect.height * self.budget_ms / scale_ms)
+        pygame.draw.line(screen, RED, (rect.left, budget_y), (rect.right, budget_y))
+        if len(frame_times) < 2:
+            return
+        step = rect.width / (frame_times.maxlen - 1)
+        start = frame_times.maxlen - len(frame_times)
+        points = [(rect.left + (start + i) * step, rect.bottom - rect.height * ms / scale_ms)
+                  for i, ms in enumerate(frame_times)]
+        pygame.draw.lines(screen, LEVEL_BAR_COLOR, False, points)
+
+    def render_text(self, scene):
+        lines = []
+        frame_times = self.profiler.frame_times
+        if frame_times:
+            mean = sum(frame_times) / len(frame_times)
+            over = sum(1 for ms in frame_times if ms > self.budget_ms)
+            lines.append((f"Frame {mean:.2f} ms  max {max(frame_times):.2f}", f"{over} over", YELLOW))
+
+        phases = self.profiler.recent_ms()
+        labels = dict(PHASE_LABELS)
+        names = [name for name, _ in PHASE_LABELS if name in phases]
+        names += [name for name in phases if name not in labels]
+        for name in names:
+            lines.append((labels.get(name, name), f"{phases[name]:.2f} ms", WHITE))
+
+        for name, group in vars(scene).items():
+            if isinstance(group, pygame.sprite.AbstractGroup):
+                lines.append((name, str(len(group)), LEVEL_BAR_COLOR))
+
+        text = pygame.Surface((self.width - self.padding * 2, len(lines) * self.line_height), pygame.SRCALPHA)
+        for i, (label, value, color) in enumerate(lines):
+            text.blit(self.font.render(label, True, color), (0, i * self.line_height))
+            value_surf = self.font.render(value, True, color)
+            text.blit(value_surf, (text.get_width() - value_surf.get_width(), i * self.line_height))
+        return text
@@ -0,0 +1,138 @@
+"""
+On-disk cache of the procedurally generated sprites.
+
+AssetManager draws every sprite with pygame.draw calls on each launch.
+The first launch stores their raw pixels here, and later launches map the
+file into memory and wrap the pixels in surfaces without copying or
+redrawing them.
+
+File layout (little endian):
+    header  magic b'STAC', version u8, index length u32
+    index   JSON: the assets layout (surfaces, lists and dicts of them)
+            and, per surface, its size, pixel format and byte range
+    pixels  raw surface buffers
+
+The file name carries a hash of everything the pixels depend on: the
+sprite dimensions and colors in config.py, the generator source code,
+the asset RNG seed and the pygame version. Any change misses the cache
+and regenerates, so stale files never need invalidating by hand.
+
+Without a fixed RNG_SEED the key uses no seed, so the randomized art (the
+asteroid variations) is pinned to whatever the first launch drew.
+"""
+
+import os
+import json
+import mmap
+import struct
+import hashlib
+import pygame
+from src import config
+
+MAGIC = b'STAC'
+VERSION = 1
+HEADER = struct.Struct('<4sBI')
+
+# Modules whose code draws the cached sprites
+GENERATOR_MODULES = ('src/utils/graphics.py', 'src/utils/asset_manager.py')
+
+def generator_inputs():
+    """The config values the generated pixels depend on: dimensions and colors."""
+    inputs = {}
+    for name in sorted(vars(config)):
+        value = getattr(config, name)
+        if name.endswith(('_WIDTH', '_HEIGHT')):
+            inputs[name] = value
+        elif isinstance(value, tuple) and len(value) in (3, 4) and all(isinstance(v, int) for v in value):
+            inputs[name] = value
+    return inputs
+
+def cache_key(seed=None):
+    digest = hashlib.sha256()
+    digest.update(f"{VERSION}|{pygame.version.ver}|{seed}|".encode())
+    digest.update(json.dumps(generator_inputs(), sort_keys=True).encode())
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    for module in GENERATOR_MODULES:
+        try:
+            with open(os.path.join(root, module), 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            # Frozen builds ship without sources; VERSION still changes with the format
+            digest.update(module.encode())
+    return digest.hexdigest()[:16]
+
+def cache_path(directory, seed=None):
+    return os.path.join(directory, f"assets-{cache_key(seed)}.bin")
+
+def save_assets(path, assets):
+    """
+    Write a dict of surfaces (optionally nested in lists and dicts) to
+    `path`. A surface listed twice is stored once and loads as one object.
+    """
+    surfaces = []
+    blobs = []
+    offsets = {}
+    offset = 0
+
+    def encode(value):
+        nonlocal offset
+        if isinstance(value, pygame.Surface):
+            if id(value) not in offsets:
+                mode = 'BGRA' if value.get_flags() & pygame.SRCALPHA else 'RGB'
+                data = pygame.image.tobytes(value, mode)
+                offsets[id(value)] = len(surfaces)
+                surfaces.append({'size': value.get_size(), 'mode': mode, 'offset': offset, 'length': len(data)})
+                blobs.append(data)
+                offset += len(data)
+            return {'surface': offsets[id(value)]}
+        if isinstance(value, list):
+            return {'list': [encode(item) for item in value]}
+        if isinstance(value, dict):
+            return {'dict': [[key, encode(item)] for key, item in value.items()]}
+        raise TypeError(f"Cannot cache {type(value).__name__} assets")
+
+    layout = {name: encode(value) for name, value in assets.items()}
+    index = json.dumps({'layout': layout, 'surfaces': surfaces}).encode()
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    # Write aside and rename, so a crash never leaves a half-written cache
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index)))
+        f.write(index)
+        for data in blobs:
+            f.write(data)
+    os.replace(temp_path, path)
+
+def load_assets(path):
+    """
+    Map a cache file written by save_assets() and return its assets, or
+    None if it is missing or unreadable. The surfaces share the mapped
+    pages (copy-on-write), so nothing is copied until a surface is drawn
+    on or converted.
+    """
+    try:
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        magic, version, index_length = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            return None
+        index = json.loads(bytes(buffer[HEADER.size:HEADER.size + index_length]))
+        pixels = memoryview(buffer)[HEADER.size + index_length:]
+        surfaces = [pygame.image.frombuffer(pixels[s['offset']:s['offset'] + s['length']], tuple(s['size']), s['mode'])
+                    for s in index['surfaces']]
+
+        def decode(entry):
+            if 'surface' in entry:
+                return surfaces[entry['surface']]
+            if 'list' in entry:
+                return [decode(item) for item in entry['list']]
+            return {key: decode(item) for key, item in entry['dict']}
+
+        return {name: decode(entry) for name, entry in index['layout'].items()}
+    except (struct.error, ValueError, KeyError, IndexError, TypeError, AttributeError, pygame.error):
+        return None
@@ -1,7 +1,10 @@
+import time
 import pygame
 from src.config import *
-from src.utils.helpers import resource_path
+from src.utils import asset_cache
+from src.utils.helpers import resource_path, convert_surface
 from src.utils.graphics import GraphicsGenerator
+from src.utils.fonts import get_font
 
 class AssetManager:
     _instance = None
@@ -10,6 +13,9 @@ class AssetManager:
         if cls._instance is None:
             cls._instance = super(AssetManager, cls).__new__(cls)
             cls._instance.assets = {}
+            cls._instance.converted = False
+            cls._instance.cache_hit = False
+            cls._instance.load_time = 0.0
             cls._instance.load_assets()
         return cls._instance
 
@@ -26,6 +32,65 @@ class AssetManager:
             self.assets['logo_img'] = pygame.Surface((400, 300))
             self.assets['logo_img'].fill(BLACK)
 
+        # Generated sprites, from the disk cache when an earlier launch left one
+        start = time.perf_counter()
+        self.load_sprites()
+        self.load_time = time.perf_counter() - start
+
+        # Backgrounds will be handled by Background class, but we can keep a placeholder or remove this.
+        # The plan says "Replace the static background image blitting with the Background class".
+        # So we don't need 'background_images' here anymore, or we can leave empty list.
+        self.assets['background_images'] = [] 
+
+        # Load sounds
+        pygame.mixer.init()
+        try:
+            self.assets['fire_sound'] = pygame.mixer.Sound(resource_path('fire.aiff'))
+            self.assets['asteroid_hit_sound'] = pygame.mixer.Sound(resource_path('asteroid_hit.wav'))
+            self.assets['crash_sound'] = pygame.mixer.Sound(resource_path('crash.wav'))
+            self.assets['end_bomb_sound'] = pygame.mixer.Sound(resource_path('end_bomb.wav'))
+            self.assets['missile_launch_sound'] = pygame.mixer.Sound(resource_path('missile.wav'))
+            self.music_path = resource_path('drive-breakbeat.mp3')
+        except:
+            print("Warning: Sound files not found. Running without sound.")
+            # Create dummy sounds to prevent crashes
+            dummy_sound = pygame.mixer.Sound(buffer=bytearray([0]*100))
+            self.assets['fire_sound'] = dummy_sound
+            self.assets['asteroid_hit_sound'] = dummy_sound
+            self.assets['crash_sound'] = dummy_sound
+            self.assets['end_bomb_sound'] = dummy_sound
+            self.assets['missile_launch_sound'] = dummy_sound
+            self.music_path = None
+
+        # Blit-ready copies, if the window already exists
+        self.convert_assets()
+
+    def load_sprites(self):
+        """
+        Load the generated sprites from ASSET_CACHE_DIR, or draw them and
+        store them there for the next launch. The cache file is named after
+        a hash of the config and generator code, so a change redraws.
+        Unseeded launches (RNG_SEED None) share one file, so they keep the
+        asteroid art the first of them drew.
+        """
+        path = asset_cache.cache_path(ASSET_CACHE_DIR, RNG_SEED) if ASSET_CACHE_DIR else None
+        sprites = asset_cache.load_assets(path) if path else None
+        self.cache_hit = sprites is not None
+        if sprites is not None:
+            self.assets.update(sprites)
+            return
+
+        loaded = set(self.assets)
+        self.generate_sprites()
+        if path:
+            sprites = {name: value for name, value in self.assets.items() if name not in loaded}
+            try:
+                asset_cache.save_assets(path, sprites)
+            except OSError as e:
+                print(f"Warning: Could not write the asset cache: {e}")
+
+    def generate_sprites(self):
+        """Draw every procedural sprite into the assets dict."""
         # Generate spaceship levels
         self.assets['spaceship_levels'] = {
             1: GraphicsGenerator.draw_spaceship(SPACESHIP_WIDTH, SPACESHIP_HEIGHT, 1),
@@ -42,11 +107,6 @@ class AssetManager:
             GraphicsGenerator.draw_asteroid(ASTEROID_WIDTH, ASTEROID_HEIGHT) for _ in range(5)
         ]
 
-        # Backgrounds will be handled by Background class, but we can keep a placeholder or remove this.
-        # The plan says "Replace the static background image blitting with the Background class".
-        # So we don't need 'background_images' here anymore, or we can leave empty list.
-        self.assets['background_images'] = [] 
-
         # Generate Bullet
         self.assets['bullet_img'] = GraphicsGenerator.draw_bullet(BULLET_WIDTH, BULLET_HEIGHT, 1)
         self.assets['bullet_levels'] = {
@@ -71,50 +131,7 @@ class AssetManager:
                 GraphicsGenerator.draw_explosion_frame(radius, color_core, color_outer)
             )
         
-        # Generate Fullscreen Missile Explosion Frames
-        self.assets['missile_explosion_frames'] = []
-        for i in range(15):
-            # Create a fullscreen surface
-            explosion_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            
-            # Calculate alpha for fade in/out effect
-            if i < 5:
-                # Fade in quickly
-                alpha = int((i / 5) * 180)
-            else:
-                # Fade out gradually
-                alpha = max(0, int(180 - ((i - 5) / 10) * 180))
-            
-            # Draw multiple expanding rings from center
-            center_x = SCREEN_WIDTH // 2
-            center_y = SCREEN_HEIGHT // 2
-            
-            # Create pulsing wave effect
-            for j in range(3):
-                ring_progress = (i + j * 3) / 18.0
-                if ring_progress <= 1.0:
-                    ring_radius = int(ring_progress * max(SCREEN_WIDTH, SCREEN_HEIGHT) * 1.5)
-                    ring_alpha = int(alpha * (1.0 - ring_progress))
-                    
-                    # Outer ring (orange)
-                    pygame.draw.circle(explosion_surface, (255, 150, 0, ring_alpha), 
-                                     (center_x, center_y), ring_radius, 
-                                     max(1, int(30 * (1.0 - ring_progress))))
-                    
-                    # Inner ring (bright yellow/white)
-                    if ring_radius > 20:
-                        pygame.draw.circle(explosion_surface, (255, 255, 200, ring_alpha), 
-                                         (center_x, center_y), ring_radius - 15, 
-                                         max(1, int(20 * (1.0 - ring_progress))))
-            
-            # Add flash overlay at the beginning
-            if i < 3:
-                flash_alpha = int((1.0 - i/3) * 100)
-                flash_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                flash_overlay.fill((255, 255, 255, flash_alpha))
-                explosion_surface.blit(flash_overlay, (0, 0))
-            
-            self.assets['missile_explosion_frames'].append(explosion_surface)
+        # The fullscreen missile explosion is drawn on demand by MissileExplosion
 
         # Generate Boss
         self.assets['boss_img'] = GraphicsGenerator.draw_boss(BOSS_WIDTH, BOSS_HEIGHT)
@@ -124,29 +141,36 @@ class AssetManager:
         self.assets['chaser_img'] = GraphicsGenerator.draw_chaser(CHASER_WIDTH, CHASER_HEIGHT)
         self.assets['shooter_img'] = GraphicsGenerator.draw_shooter(SHOOTER_WIDTH, SHOOTER_HEIGHT)
 
-        # Load sounds
-        pygame.mixer.init()
-        try:
-            self.assets['fire_sound'] = pygame.mixer.Sound(resource_path('fire.aiff'))
-            self.assets['asteroid_hit_sound'] = pygame.mixer.Sound(resource_path('asteroid_hit.wav'))
-            self.assets['crash_sound'] = pygame.mixer.Sound(resource_path('crash.wav'))
-            self.assets['end_bomb_sound'] = pygame.mixer.Sound(resource_path('end_bomb.wav'))
-            self.assets['missile_launch_sound'] = pygame.mixer.Sound(resource_path('missile.wav'))
-            self.music_path = resource_path('drive-breakbeat.mp3')
-        except:
-            print("Warning: Sound files not found. Running without sound.")
-            # Create dummy sounds to prevent crashes
-            dummy_sound = pygame.mixer.Sound(buffer=bytearray([0]*100))
-            self.assets['fire_sound'] = dummy_sound
-            self.assets['asteroid_hit_sound'] = dummy_sound
-            self.assets['crash_sound'] = dummy_sound
-            self.assets['end_bomb_sound'] = dummy_sound
-            self.assets['missile_launch_sound'] = dummy_sound
-            self.music_path = None
-
         # Create Power-up Assets
         self._create_powerup_assets()
 
+    def convert_assets(self):
+        """
+        Convert every generated surface to the display format, once. Does
+        nothing until the window exists, so call it again after set_mode()
+        if the assets were loaded first.
+        """
+        if self.converted or pygame.display.get_surface() is None:
+            return
+        # Surfaces listed under several names (e.g. spaceship_img) stay one object
+        converted = {}
+
+        def convert(value):
+            if isinstance(value, pygame.Surface):
+                if id(value) not in converted:
+                    converted[id(value)] = convert_surface(value)
+                return converted[id(value)]
+            if isinstance(value, list):
+                return [convert(item) for item in value]
+            if isinstance(value, dict):
+                return {key: convert(item) for key, item in value.items()}
+            return value
+
+        # In place, since scenes hold on to the assets dict itself
+        for name, value in self.assets.items():
+            self.assets[name] = convert(value)
+        self.converted = True
+
     def _create_powerup_assets(self):
         # Health Power-up (Red Cross)
         health_pu_surf = pygame.Surface((POWERUP_WIDTH, POWERUP_HEIGHT), pygame.SRCALPHA)
@@ -167,7 +191,7 @@ class AssetManager:
         missile_pu_surf = pygame.Surface((POWERUP_WIDTH, POWERUP_HEIGHT), pygame.SRCALPHA)
         pygame.draw.circle(missile_pu_surf, (50, 50, 100), (POWERUP_WIDTH // 2, POWERUP_HEIGHT // 2), POWERUP_WIDTH // 2)
         # Draw 'M'
-        font_pu = pygame.font.SysFont(None, 24)
+        font_pu = get_font(24)
         m_surf = font_pu.render("M", True, (255, 165, 0))
         missile_pu_surf.blit(m_surf, (POWERUP_WIDTH // 2 - m_surf.get_width()//2, POWERUP_HEIGHT // 2 - m_surf.get_height()//2))
         self.assets['missile_powerup_img'] = missile_pu_surf
@@ -0,0 +1,37 @@
+import pygame
+
+class FontRegistry:
+    """
+    Shared pygame Font instances by size.
+
+    Everything in the game uses the default font, which
+    pygame.font.SysFont(None, size) only resolves after scanning the
+    system fonts (fc-list on Linux) and then loads into a new Font on every
+    call. Here the default font is opened directly, once per size, and the
+    same instance is handed to every scene, button and HUD, so rebuilding
+    a scene (e.g. on replay) loads nothing and cached text stays valid.
+    """
+
+    def __init__(self):
+        self._fonts = {}
+        self.loads = 0
+
+    def get(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            if not self._fonts:
+                # Font objects die with pygame.quit(), which also forgets its
+                # quit callbacks, so register again with every first font
+                pygame.register_quit(self.clear)
+            font = self._fonts[size] = pygame.font.Font(None, size)
+            self.loads += 1
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+
+fonts = FontRegistry()
+
+def get_font(size):
+    """The shared default font at `size` pixels."""
+    return fonts.get(size)
@@ -1,7 +1,7 @@
 import pygame
-import random
 import math
 from src.config import *
+from src.core.rng import streams
 
 class GraphicsGenerator:
     @staticmethod
@@ -99,11 +99,12 @@ class GraphicsGenerator:
         return surface
 
     @staticmethod
-    def draw_asteroid(width, height):
+    def draw_asteroid(width, height, rng=None):
+        rng = rng or streams.assets
         surface = pygame.Surface((width, height), pygame.SRCALPHA)
         
         # Base color variations
-        gray_val = random.randint(100, 180)
+        gray_val = rng.randint(100, 180)
         base_color = (gray_val, gray_val, gray_val)
         shadow_color = (gray_val - 40, gray_val - 40, gray_val - 40)
         
@@ -111,12 +112,12 @@ class GraphicsGenerator:
         radius = min(width, height) // 2
         
         # Generate irregular polygon for asteroid shape
-        num_points = random.randint(8, 12)
+        num_points = rng.randint(8, 12)
         points = []
         for i in range(num_points):
             angle = (i / num_points) * 2 * math.pi
             # Vary radius slightly for irregularity
-            r = radius * random.uniform(0.8, 1.0)
+            r = radius * rng.uniform(0.8, 1.0)
             x = center_x + r * math.cos(angle)
             y = center_y + r * math.sin(angle)
             points.append((x, y))
@@ -125,11 +126,11 @@ class GraphicsGenerator:
         pygame.draw.polygon(surface, shadow_color, points, 2)
         
         # Add craters
-        num_craters = random.randint(2, 5)
+        num_craters = rng.randint(2, 5)
         for _ in range(num_craters):
-            crater_r = random.randint(3, 8)
-            crater_x = random.randint(center_x - radius // 2, center_x + radius // 2)
-            crater_y = random.randint(center_y - radius // 2, center_y + radius // 2)
+            crater_r = rng.randint(3, 8)
+            crater_x = rng.randint(center_x - radius // 2, center_x + radius // 2)
+            crater_y = rng.randint(center_y - radius // 2, center_y + radius // 2)
             pygame.draw.circle(surface, shadow_color, (crater_x, crater_y), crater_r)
             
         return surface
@@ -252,3 +253,54 @@ class GraphicsGenerator:
         pygame.draw.circle(surface, color_core, center, radius * 0.7)
         
         return surface
+
+    @staticmethod
+    def draw_ring_wave(surface, frame, frame_count, scale=1):
+        """
+        Draw one frame of the fullscreen missile shockwave onto `surface`.
+
+        `surface` covers the screen at 1/`scale` resolution; ring radii and
+        widths are given in screen pixels and scaled down to match.
+        """
+        surface.fill((0, 0, 0, 0))
+        width, height = surface.get_size()
+        fade_in_frames = frame_count // 3
+
+        # Calculate alpha for fade in/out effect
+        if frame < fade_in_frames:
+            # Fade in quickly
+            alpha = int((frame / fade_in_frames) * 180)
+        else:
+            # Fade out gradually
+            alpha = max(0, int(180 - ((frame - fade_in_frames) / (frame_count - fade_in_frames)) * 180))
+
+        # Draw multiple expanding rings from center
+        center = (width // 2, height // 2)
+        max_radius = max(SCREEN_WIDTH, SCREEN_HEIGHT) * 1.5
+
+        # Create pulsing wave effect
+        for j in range(3):
+            ring_progress = (frame + j * 3) / (frame_count + 3)
+            if ring_progress <= 1.0:
+                ring_radius = ring_progress * max_radius
+                ring_alpha = int(alpha * (1.0 - ring_progress))
+
+                # Outer ring (orange)
+                pygame.draw.circle(surface, (255, 150, 0, ring_alpha), center,
+                                   int(ring_radius / scale),
+                                   max(1, int(30 * (1.0 - ring_progress) / scale)))
+
+                # Inner ring (bright yellow/white)
+                if ring_radius > 20:
+                    pygame.draw.circle(surface, (255, 255, 200, ring_alpha), center,
+                                       int((ring_radius - 15) / scale),
+                                       max(1, int(20 * (1.0 - ring_progress) / scale)))
+
+        # Add flash overlay at the beginning
+        if frame < 3:
+            flash_alpha = int((1.0 - frame / 3) * 100)
+            flash_overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+            flash_overlay.fill((255, 255, 255, flash_alpha))
+            surface.blit(flash_overlay, (0, 0))
+
+        return surface
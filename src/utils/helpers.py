@@ -1,6 +1,7 @@
 import os
 import sys
 import pygame
+from functools import lru_cache
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -16,10 +17,27 @@ def resource_path(relative_path):
         
     return os.path.join(base_path, 'assets', relative_path)
 
+def convert_surface(surface):
+    """
+    Returns `surface` in the display's pixel format (convert_alpha() when it
+    has per-pixel alpha, convert() otherwise), so blitting it needs no
+    per-pixel format conversion. Returned as is while there is no display.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
 def split_text(text, font, max_width):
     """
     Splits the text into multiple lines based on the max width of the screen.
     """
+    return list(_split_text(text, font, max_width))
+
+@lru_cache(maxsize=256)
+def _split_text(text, font, max_width):
+    # Memoized per (text, font, width): measuring every word is the expensive part
     words = text.split(' ')
     lines = []
     current_line = ""
@@ -33,4 +51,4 @@ def split_text(text, font, max_width):
             current_line = word + " "
 
     lines.append(current_line)  # Add the last line
-    return lines
+    return tuple(lines)
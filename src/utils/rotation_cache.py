@@ -0,0 +1,62 @@
+from collections import OrderedDict
+import pygame
+from src.config import *
+
+class RotationCache:
+    """
+    Bounded LRU cache of rotated surfaces keyed by (surface id, angle bucket).
+
+    Angles are snapped to ROTATION_ANGLE_STEP degree buckets so sprites that
+    keep a steady heading reuse one rotated surface instead of calling
+    pygame.transform.rotate() every frame.
+    """
+
+    def __init__(self, max_entries=ROTATION_CACHE_SIZE, angle_step=ROTATION_ANGLE_STEP):
+        self.max_entries = max_entries
+        self.angle_step = angle_step
+        self.buckets = round(360 / angle_step)
+        # key -> (source surface, rotated surface); holding the source keeps its id() unique
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def bucket(self, angle):
+        """Quantize an angle in degrees to its bucket index."""
+        return round(angle / self.angle_step) % self.buckets
+
+    def get(self, surface, angle):
+        """Return `surface` rotated by `angle` degrees, rendering it on a miss."""
+        key = (id(surface), self.bucket(angle))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        rotated = pygame.transform.rotate(surface, key[1] * self.angle_step)
+        self._entries[key] = (surface, rotated)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return rotated
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+# Shared by missiles and the background meteor renderer
+rotation_cache = RotationCache()
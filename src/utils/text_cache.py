@@ -0,0 +1,61 @@
+from collections import OrderedDict
+from src.config import *
+
+class TextCache:
+    """
+    Process-wide LRU cache of rendered text keyed by (font, text, antialias,
+    color). Menus and HUD strings rarely change, so they are rasterized
+    once and blitted from here afterwards. Bounded by the pixel memory of
+    the cached surfaces rather than their number, since a title and a
+    digit differ in size by orders of magnitude.
+    """
+
+    def __init__(self, max_bytes=TEXT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        # key -> rendered surface; the key holds the font, so its identity stays unique
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color):
+        """Same as font.render(text, antialias, color), from the cache when possible."""
+        key = (font, text, antialias, tuple(color))
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._entries[key] = surface
+        self.bytes += surface.get_pitch() * surface.get_height()
+        # Always keep the newest entry, even if it alone is over budget
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= evicted.get_pitch() * evicted.get_height()
+            self.evictions += 1
+        return surface
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+# Shared by the scenes, buttons and HUD
+text_cache = TextCache()
@@ -0,0 +1,75 @@
+"""
+Benchmark for the on-disk cache of generated sprites.
+Starts fresh processes that build the AssetManager, cold (empty cache
+directory, so every sprite is drawn and the cache is written) and warm
+(the cache file from the cold run is mapped), and reports both.
+
+    python tests/bench_asset_cache.py            # 5 launches of each
+    python tests/bench_asset_cache.py --runs 10
+
+"sprites" is the time spent producing the generated sprites, "startup"
+the whole AssetManager() including the logo, sounds and conversion.
+"""
+
+import os
+import sys
+import json
+import tempfile
+import argparse
+import statistics
+import subprocess
+
+# Add parent directory to path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+LAUNCH = """
+import json, time
+import pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+import src.utils.asset_manager as asset_manager
+asset_manager.ASSET_CACHE_DIR = {cache_dir!r}
+start = time.perf_counter()
+manager = asset_manager.AssetManager()
+startup = time.perf_counter() - start
+print(json.dumps({{'hit': manager.cache_hit, 'sprites': manager.load_time, 'startup': startup}}))
+"""
+
+
+def launch(cache_dir):
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    result = subprocess.run([sys.executable, '-c', LAUNCH.format(cache_dir=cache_dir)], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5, help="launches of each kind (default: 5)")
+    args = parser.parse_args()
+
+    cold, warm = [], []
+    for _ in range(args.runs):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold.append(launch(cache_dir))
+            warm.append(launch(cache_dir))
+    assert not any(run['hit'] for run in cold) and all(run['hit'] for run in warm)
+
+    print("=" * 56)
+    print(f"ASSET CACHE BENCHMARK (median of {args.runs} launches)")
+    print("=" * 56)
+    print(f"{'Launch':<8} | {'sprites ms':>12} | {'startup ms':>12}")
+    print("-" * 56)
+    for name, runs in (('cold', cold), ('warm', warm)):
+        sprites = statistics.median(run['sprites'] for run in runs) * 1000
+        startup = statistics.median(run['startup'] for run in runs) * 1000
+        print(f"{name:<8} | {sprites:>12.2f} | {startup:>12.2f}")
+    print("-" * 56)
+    cold_ms = statistics.median(run['sprites'] for run in cold)
+    warm_ms = statistics.median(run['sprites'] for run in warm)
+    print(f"Sprites load {cold_ms / warm_ms:.1f}x faster from the cache")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark for display-format conversion of generated sprites.
+Blits every generated sprite type onto the display surface, first as
+GraphicsGenerator draws it and then after convert_surface(), and reports
+the time per blit and the speedup.
+
+    python tests/bench_blits.py            # display at the desktop depth
+    python tests/bench_blits.py --depth 16 # e.g. a 16-bit display
+
+The gain depends on how far the generated format is from the display's:
+none when they already match, large when every pixel has to be repacked.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import pygame
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.graphics import GraphicsGenerator
+from src.utils.helpers import convert_surface
+from src.config import *
+
+BLITS = 2000
+
+
+def sprite_types():
+    """(name, surface) for each generated sprite type, unconverted."""
+    return [
+        ('spaceship', GraphicsGenerator.draw_spaceship(SPACESHIP_WIDTH, SPACESHIP_HEIGHT, 3)),
+        ('asteroid', GraphicsGenerator.draw_asteroid(ASTEROID_WIDTH, ASTEROID_HEIGHT)),
+        ('bullet', GraphicsGenerator.draw_bullet(BULLET_WIDTH, BULLET_HEIGHT, 3)),
+        ('missile', GraphicsGenerator.draw_missile(20, 40)),
+        ('boss', GraphicsGenerator.draw_boss(BOSS_WIDTH, BOSS_HEIGHT)),
+        ('enemy projectile', GraphicsGenerator.draw_enemy_projectile(10, 10)),
+        ('chaser', GraphicsGenerator.draw_chaser(CHASER_WIDTH, CHASER_HEIGHT)),
+        ('shooter', GraphicsGenerator.draw_shooter(SHOOTER_WIDTH, SHOOTER_HEIGHT)),
+        ('explosion frame', GraphicsGenerator.draw_explosion_frame(70, (255, 255, 200, 155), (255, 100, 0, 155))),
+        ('star', GraphicsGenerator.draw_star(3, 200)),
+        ('nebula', nebula())
+    ]
+
+
+def nebula():
+    surface = pygame.Surface((300, 300), pygame.SRCALPHA)
+    pygame.draw.ellipse(surface, (30, 30, 80, 30), (0, 0, 300, 300))
+    return surface
+
+
+def us_per_blit(screen, surface):
+    positions = [((i * 37) % (SCREEN_WIDTH - surface.get_width()), (i * 53) % (SCREEN_HEIGHT - surface.get_height()))
+                 for i in range(BLITS)]
+    start = time.perf_counter()
+    for position in positions:
+        screen.blit(surface, position)
+    return (time.perf_counter() - start) * 1e6 / BLITS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--depth', type=int, default=0, help="display bit depth (default: desktop depth)")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), 0, args.depth)
+
+    print("=" * 64)
+    print(f"SPRITE BLIT BENCHMARK ({screen.get_bitsize()}-bit display, {BLITS} blits each)")
+    print("=" * 64)
+    print(f"{'Sprite':<18} | {'raw us':>8} | {'converted us':>12} | {'speedup':>8}")
+    print("-" * 64)
+    raw_total = converted_total = 0.0
+    for name, surface in sprite_types():
+        converted = convert_surface(surface)
+        raw = us_per_blit(screen, surface)
+        fast = us_per_blit(screen, converted)
+        raw_total += raw
+        converted_total += fast
+        print(f"{name:<18} | {raw:>8.2f} | {fast:>12.2f} | {raw / fast:>7.2f}x")
+    print("-" * 64)
+    print(f"{'all types':<18} | {raw_total:>8.2f} | {converted_total:>12.2f} | {raw_total / converted_total:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
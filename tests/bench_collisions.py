@@ -0,0 +1,80 @@
+"""
+Stress benchmark for bullet collisions.
+Run this to compare brute-force pygame.sprite.groupcollide() with the
+SpatialHash broadphase for 5,000 bullets against 2,000 enemies.
+"""
+
+import os
+import random
+import sys
+import time
+
+import pygame
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.spatial_hash import SpatialHash
+from src.entities.entity import Entity
+from src.config import *
+
+# Initialize pygame
+pygame.init()
+pygame.display.set_mode((1, 1))  # Minimal display
+
+BULLETS = 5000
+ENEMIES = 2000
+ROUNDS = 3
+
+
+def make_group(count, size, seed):
+    rng = random.Random(seed)
+    image = pygame.Surface(size)
+    group = pygame.sprite.Group()
+    for _ in range(count):
+        group.add(Entity(rng.randint(0, SCREEN_WIDTH - size[0]), rng.randint(0, SCREEN_HEIGHT - size[1]), image))
+    return group
+
+
+def brute_force():
+    enemies = make_group(ENEMIES, (ASTEROID_WIDTH, ASTEROID_HEIGHT), seed=1)
+    bullets = make_group(BULLETS, (BULLET_WIDTH, BULLET_HEIGHT), seed=2)
+    start = time.perf_counter()
+    hits = pygame.sprite.groupcollide(enemies, bullets, True, True)
+    return time.perf_counter() - start, hits
+
+
+def spatial_hash():
+    enemies = make_group(ENEMIES, (ASTEROID_WIDTH, ASTEROID_HEIGHT), seed=1)
+    bullets = make_group(BULLETS, (BULLET_WIDTH, BULLET_HEIGHT), seed=2)
+    grid = SpatialHash()
+    start = time.perf_counter()
+    grid.rebuild(bullets, enemies)
+    hits = grid.groupcollide(enemies, bullets, True, True)
+    return time.perf_counter() - start, hits
+
+
+def best_of(func):
+    results = [func() for _ in range(ROUNDS)]
+    return min(elapsed for elapsed, _ in results), results[0][1]
+
+
+print("=" * 60)
+print("COLLISION BROADPHASE STRESS BENCHMARK")
+print("=" * 60)
+print(f"{BULLETS} bullets vs {ENEMIES} enemies, cell size {COLLISION_CELL_SIZE}px, best of {ROUNDS}")
+print()
+
+brute_s, brute_hits = best_of(brute_force)
+grid_s, grid_hits = best_of(spatial_hash)
+
+brute_kills = sum(len(bullets) for bullets in brute_hits.values())
+grid_kills = sum(len(bullets) for bullets in grid_hits.values())
+
+print(f"  groupcollide (brute force): {brute_s * 1000:9.1f} ms  "
+      f"({len(brute_hits)} enemies hit, {brute_kills} bullets consumed)")
+print(f"  SpatialHash (incl. rebuild): {grid_s * 1000:8.1f} ms  "
+      f"({len(grid_hits)} enemies hit, {grid_kills} bullets consumed)")
+print()
+print(f"Speedup: {brute_s / grid_s:.1f}x")
+print("Results identical:", len(brute_hits) == len(grid_hits) and brute_kills == grid_kills)
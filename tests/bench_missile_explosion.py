@@ -0,0 +1,67 @@
+"""
+Benchmark for the fullscreen missile explosion.
+Run this to compare pre-rendering all 15 fullscreen frames at startup with
+the on-demand MissileExplosion effect (startup time and resident memory).
+"""
+
+import os
+import sys
+import time
+
+import pygame
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.entities.missile_explosion import MissileExplosion
+from src.utils.graphics import GraphicsGenerator
+from src.config import *
+
+# Initialize pygame
+pygame.init()
+pygame.display.set_mode((1, 1))  # Minimal display
+
+
+def surface_bytes(surface):
+    return surface.get_height() * surface.get_pitch()
+
+
+print("=" * 60)
+print("MISSILE EXPLOSION BENCHMARK")
+print("=" * 60)
+print()
+
+# Pre-rendered: every frame drawn fullscreen up front
+start = time.perf_counter()
+frames = []
+for i in range(MissileExplosion.FRAME_COUNT):
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    frames.append(GraphicsGenerator.draw_ring_wave(surface, i, MissileExplosion.FRAME_COUNT))
+prerender_ms = (time.perf_counter() - start) * 1000
+prerender_mb = sum(surface_bytes(frame) for frame in frames) / 2 ** 20
+del frames
+
+# On demand: nothing at startup, one reduced + one screen-sized surface while playing
+start = time.perf_counter()
+explosion = MissileExplosion(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+create_ms = (time.perf_counter() - start) * 1000
+active_mb = (surface_bytes(explosion.image) + surface_bytes(explosion.wave_surface)) / 2 ** 20
+
+ticks = 0
+start = time.perf_counter()
+while explosion.current_frame < MissileExplosion.FRAME_COUNT:
+    explosion.update()
+    ticks += 1
+play_ms = (time.perf_counter() - start) * 1000
+
+print("Pre-rendered frames (previous AssetManager behaviour):")
+print(f"  Startup cost:    {prerender_ms:8.1f} ms")
+print(f"  Resident memory: {prerender_mb:8.1f} MB (for the whole session)")
+print()
+print(f"On-demand MissileExplosion (1/{MISSILE_EXPLOSION_SCALE} resolution):")
+print(f"  Startup cost:    {0:8.1f} ms")
+print(f"  Resident memory: {0:8.1f} MB until a missile detonates")
+print(f"  Detonation cost: {create_ms:8.1f} ms to create, {play_ms / ticks:.2f} ms/tick over {ticks} ticks")
+print(f"  Active memory:   {active_mb:8.1f} MB while the effect plays")
+print()
+print(f"Memory reduction while active: {prerender_mb / active_mb:.1f}x")
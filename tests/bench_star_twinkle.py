@@ -0,0 +1,121 @@
+"""
+Benchmark for the background starfield.
+Run this to see how the per-frame star cost (update + draw) scales with star
+count, comparing the original per-star dict loop with the NumPy starfield.
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+import pygame
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.starfield import Starfield, TwinkleCache
+from src.utils.graphics import GraphicsGenerator
+from src.config import *
+
+# Initialize pygame
+pygame.init()
+pygame.display.set_mode((1, 1))  # Minimal display
+
+DENSITIES = [1 / 3, 1, 10 / 3, 10, 100 / 3]  # 100 to 10,000 stars
+FRAMES = 60
+
+
+def make_stars(count):
+    stars = []
+    for _ in range(count):
+        size = random.randint(1, 3)
+        brightness = random.randint(150, 255)
+        stars.append({
+            'x': random.randint(0, SCREEN_WIDTH),
+            'y': random.randint(0, SCREEN_HEIGHT),
+            'speed': 1.0,
+            'img': TwinkleCache.get(size, brightness),
+            'brightness': brightness,
+            'size': size,
+            'twinkle_timer': random.randint(0, 100),
+            'twinkle_speed': random.uniform(0.02, 0.08)
+        })
+    return stars
+
+
+def frame_uncached(stars, screen):
+    """The original frame: a freshly drawn surface and one blit per star."""
+    for star in stars:
+        star['y'] += star['speed']
+        if star['y'] > SCREEN_HEIGHT:
+            star['y'] = 0
+            star['x'] = random.randint(0, SCREEN_WIDTH)
+        star['twinkle_timer'] += star['twinkle_speed']
+        twinkle_brightness = int(star['brightness'] * (0.7 + 0.3 * math.sin(star['twinkle_timer'])))
+        star['img'] = GraphicsGenerator.draw_star(star['size'], twinkle_brightness)
+    for star in stars:
+        screen.blit(star['img'], (int(star['x']), int(star['y'])))
+
+
+def frame_cached(stars, screen):
+    """Per-star dict loop using the shared twinkle cache."""
+    for star in stars:
+        star['y'] += star['speed']
+        if star['y'] > SCREEN_HEIGHT:
+            star['y'] = 0
+            star['x'] = random.randint(0, SCREEN_WIDTH)
+        star['twinkle_timer'] += star['twinkle_speed']
+        twinkle_brightness = int(star['brightness'] * (0.7 + 0.3 * math.sin(star['twinkle_timer'])))
+        star['img'] = TwinkleCache.get(star['size'], twinkle_brightness)
+    for star in stars:
+        screen.blit(star['img'], (int(star['x']), int(star['y'])))
+
+
+def frame_starfield(starfield, screen):
+    """NumPy starfield: vectorized update and one batched blit per layer."""
+    starfield.update()
+    starfield.draw(screen)
+
+
+def time_per_frame(func):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        func()
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+
+print("=" * 72)
+print("BACKGROUND STARFIELD BENCHMARK (update + draw)")
+print("=" * 72)
+print()
+
+TwinkleCache.build()
+print(f"Twinkle cache: {len(TwinkleCache._sprites)} sprites "
+      f"({len(TwinkleCache.SIZES)} sizes x {TwinkleCache.LEVELS} brightness levels)")
+print()
+
+screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+print(f"{'Stars':>8} | {'uncached ms':>12} | {'cached ms':>10} | {'starfield ms':>13} | {'speedup':>8}")
+print("-" * 72)
+
+for density in DENSITIES:
+    starfield = Starfield(3, density)
+    count = len(starfield)
+
+    uncached_stars = make_stars(count)
+    uncached_ms = time_per_frame(lambda: frame_uncached(uncached_stars, screen))
+
+    cached_stars = make_stars(count)
+    cached_ms = time_per_frame(lambda: frame_cached(cached_stars, screen))
+
+    starfield_ms = time_per_frame(lambda: frame_starfield(starfield, screen))
+
+    print(f"{count:>8} | {uncached_ms:>12.3f} | {cached_ms:>10.3f} | {starfield_ms:>13.3f} | "
+          f"{uncached_ms / starfield_ms:>7.1f}x")
+
+print("-" * 72)
+print()
+print(f"Frame budget at {FPS} FPS: {1000 / FPS:.1f} ms")
@@ -0,0 +1,8 @@
+import pytest
+import src.utils.asset_manager as asset_manager
+
+@pytest.fixture(autouse=True)
+def no_asset_cache(monkeypatch):
+    """Tests never write the sprite cache, here or in spawned worker processes"""
+    monkeypatch.setattr(asset_manager, 'ASSET_CACHE_DIR', None)
+    monkeypatch.setenv('SPACE_TRAVEL_ASSET_CACHE', '')
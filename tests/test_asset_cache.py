@@ -0,0 +1,68 @@
+import json
+import pygame
+import src.utils.asset_manager as asset_manager
+from src import config
+from src.utils import asset_cache
+from src.utils.asset_manager import AssetManager
+from src.utils.graphics import GraphicsGenerator
+from src.config import *
+
+# Mock pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+def pixels(surface):
+    return pygame.image.tobytes(surface, 'RGBA' if surface.get_flags() & pygame.SRCALPHA else 'RGB')
+
+def test_round_trip_keeps_pixels_and_layout(tmp_path):
+    """Cached surfaces load with the same pixels, nesting and shared objects"""
+    ship = GraphicsGenerator.draw_spaceship(SPACESHIP_WIDTH, SPACESHIP_HEIGHT, 2)
+    opaque = pygame.Surface((7, 5))
+    opaque.fill(RED)
+    path = tmp_path / 'assets.bin'
+    asset_cache.save_assets(str(path), {'levels': {2: ship}, 'ship': ship, 'frames': [opaque, ship]})
+
+    loaded = asset_cache.load_assets(str(path))
+    assert loaded['ship'] is loaded['levels'][2] is loaded['frames'][1]
+    assert pixels(loaded['ship']) == pixels(ship)
+    assert loaded['ship'].get_flags() & pygame.SRCALPHA
+    assert pixels(loaded['frames'][0]) == pixels(opaque)
+    assert not loaded['frames'][0].get_flags() & pygame.SRCALPHA
+
+def test_missing_or_corrupt_cache_misses(tmp_path):
+    """A missing, empty, foreign or malformed file reads as no cache"""
+    assert asset_cache.load_assets(str(tmp_path / 'none.bin')) is None
+    (tmp_path / 'empty.bin').write_bytes(b'')
+    assert asset_cache.load_assets(str(tmp_path / 'empty.bin')) is None
+    (tmp_path / 'foreign.bin').write_bytes(b'PNG\x00' * 8)
+    assert asset_cache.load_assets(str(tmp_path / 'foreign.bin')) is None
+    index = json.dumps({'layout': {'ship': {'surface': 3}}, 'surfaces': []}).encode()
+    (tmp_path / 'layout.bin').write_bytes(asset_cache.HEADER.pack(asset_cache.MAGIC, asset_cache.VERSION, len(index)) + index)
+    assert asset_cache.load_assets(str(tmp_path / 'layout.bin')) is None
+
+def test_key_follows_dimensions_and_seed(monkeypatch):
+    """Changing a sprite dimension or the asset seed selects another cache file"""
+    key = asset_cache.cache_key()
+    assert asset_cache.cache_key() == key
+    assert asset_cache.cache_key(seed=7) != key
+    monkeypatch.setattr(config, 'BOSS_WIDTH', BOSS_WIDTH + 1)
+    assert asset_cache.cache_key() != key
+
+def test_asset_manager_writes_then_maps_cache(tmp_path, monkeypatch):
+    """The first load draws and stores the sprites, the next one maps them"""
+    monkeypatch.setattr(asset_manager, 'ASSET_CACHE_DIR', str(tmp_path))
+
+    def load():
+        manager = object.__new__(AssetManager)
+        manager.assets = {}
+        manager.load_sprites()
+        return manager
+
+    cold = load()
+    warm = load()
+    assert not cold.cache_hit and warm.cache_hit
+    assert len(list(tmp_path.iterdir())) == 1
+    assert warm.assets.keys() == cold.assets.keys()
+    assert warm.assets['spaceship_img'] is warm.assets['spaceship_levels'][1]
+    assert pixels(warm.assets['boss_img']) == pixels(cold.assets['boss_img'])
+    assert [pixels(s) for s in warm.assets['asteroid_images']] == [pixels(s) for s in cold.assets['asteroid_images']]
@@ -0,0 +1,32 @@
+import pygame
+from src.sim.headless import HeadlessGame
+from src.sim.autopilot import Autopilot
+from src.entities.enemy_projectile import EnemyProjectile
+from src.config import *
+
+# Mock pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+def test_autopilot_dodges_incoming_projectile():
+    """The autopilot steps aside from a projectile falling onto the ship"""
+    game = HeadlessGame()
+    autopilot = Autopilot()
+    scene = game.new_scene(autopilot, seed=5)
+    ship = scene.spaceship
+    projectile = EnemyProjectile(ship.rect.centerx - 5, ship.rect.top - 60, pygame.Surface((10, 10)))
+    projectile.prev_center = (projectile.rect.centerx, projectile.rect.centery - BOSS_PROJECTILE_SPEED)
+    scene.enemy_projectiles.add(projectile)
+
+    autopilot.get_events()
+
+    assert autopilot.get_pressed()[pygame.K_LEFT] or autopilot.get_pressed()[pygame.K_RIGHT]
+
+def test_autopilot_outlives_idle_ship():
+    """With the same seed the autopilot scores more than a ship left alone"""
+    game = HeadlessGame()
+    idle = game.run(FPS * 60, seed=2)
+    piloted = game.run(FPS * 60, Autopilot(), seed=2)
+
+    assert piloted['score'] > idle['score']
+    assert piloted['ticks'] >= idle['ticks']
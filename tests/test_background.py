@@ -0,0 +1,55 @@
+import pygame
+import numpy as np
+from src.core.background import Background
+from src.core.starfield import Starfield, TwinkleCache
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Mock pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+def test_twinkle_cache_quantizes_brightness():
+    """Nearby brightness values share one cached sprite"""
+    assert TwinkleCache.get(2, 200) is TwinkleCache.get(2, 201)
+    assert TwinkleCache.get(2, 0) is not TwinkleCache.get(2, 255)
+    assert TwinkleCache.quantize(0) == 0
+    assert TwinkleCache.quantize(255) == TwinkleCache.LEVELS - 1
+
+def test_star_update_uses_cached_sprites():
+    """Twinkling stars only index sprites from the shared cache"""
+    background = Background()
+
+    for _ in range(5):
+        background.update()
+
+    for layer in background.stars.layers:
+        assert layer.sprite_index.min() >= 0
+        assert layer.sprite_index.max() < len(TwinkleCache.table())
+
+def test_twinkle_cache_shared_between_backgrounds():
+    """All backgrounds draw from the same cache table"""
+    Background()
+    sprites = TwinkleCache._sprites
+    Background()
+    assert TwinkleCache._sprites is sprites
+
+def test_starfield_density():
+    """Star count scales with density, keeping 50/100/150 per layer at 1.0"""
+    assert [layer.count for layer in Starfield(3, 1.0).layers] == [50, 100, 150]
+    assert len(Starfield(3, 4.0)) == 1200
+
+def test_starfield_wraps_stars():
+    """Stars leaving the bottom reappear at the top"""
+    starfield = Starfield(1, 1.0)
+    layer = starfield.layers[0]
+    layer.y[:] = SCREEN_HEIGHT
+    starfield.update()
+    assert np.all(layer.y == 0)
+    assert np.all((layer.x >= 0) & (layer.x <= SCREEN_WIDTH))
+
+def test_starfield_draw():
+    """Batched draw renders stars onto the target surface"""
+    starfield = Starfield(3, 1.0)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    starfield.draw(screen)
+    assert pygame.transform.average_color(screen) != (0, 0, 0, 255)
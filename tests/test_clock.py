@@ -0,0 +1,79 @@
+import pygame
+from src.core.clock import GameClock
+from src.entities.boss import Boss
+from src.entities.shooter import Shooter
+from src.sim.headless import HeadlessGame
+from src.config import *
+
+# Mock pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+class FakeTime:
+    def __init__(self):
+        self.now = 1000
+
+    def __call__(self):
+        return self.now
+
+def test_manual_clock_steps():
+    """A manual clock only moves when stepped"""
+    clock = GameClock()
+    assert clock.get_ticks() == 0
+    clock.step(250)
+    clock.step(250)
+    assert clock.get_ticks() == 500
+    assert clock.tick_count == 2
+
+def test_paused_manual_clock_stands_still():
+    """Steps are ignored while paused"""
+    clock = GameClock()
+    clock.step(100)
+    clock.pause()
+    clock.step(100)
+    assert clock.get_ticks() == 100
+    clock.resume()
+    clock.step(100)
+    assert clock.get_ticks() == 200
+
+def test_real_time_clock_excludes_pauses():
+    """A real-time clock doesn't count time spent paused"""
+    fake_time = FakeTime()
+    clock = GameClock(fake_time)
+    fake_time.now = 1500
+    clock.pause()
+    fake_time.now = 9500
+    assert clock.get_ticks() == 1500
+    clock.resume()
+    fake_time.now = 10000
+    assert clock.get_ticks() == 2000
+
+def test_pause_holds_every_timer():
+    """Spawn, shot and invincibility timers all resume where they left off after a pause"""
+    game = HeadlessGame()
+    scene = game.new_scene()
+    assets = scene.assets
+    boss = Boss(SCREEN_WIDTH // 2, 50, assets['boss_img'], assets['enemy_projectile_img'], 'MEDIUM',
+                scene.spawn_queue, scene.projectile_pool, scene.clock, scene.rng)
+    shooter = Shooter(100, 100, assets['shooter_img'], assets['enemy_projectile_img'],
+                      scene.spawn_queue, scene.projectile_pool, scene.clock)
+    scene.bosses.add(boss)
+    scene.shooters.add(shooter)
+    scene.all_sprites.add(boss, shooter)
+    scene.spaceship.take_damage()
+    for _ in range(30):
+        game.tick()
+
+    def elapsed():
+        now = game.clock.get_ticks()
+        return (now - scene.asteroid_timer, now - scene.powerup_timer, now - boss.last_shot_time,
+                now - shooter.last_shot_time, now - scene.spaceship.invincibility_start_time)
+    before = elapsed()
+
+    scene.toggle_pause()
+    for _ in range(FPS * 10):
+        game.tick()
+    scene.toggle_pause()
+
+    assert elapsed() == before
+    assert scene.spaceship.is_invincible
@@ -1,5 +1,6 @@
 import pygame
 import pytest
+from src.entities.entity import Entity
 from src.entities.spaceship import Spaceship
 from src.entities.asteroid import Asteroid
 from src.entities.bullet import Bullet
@@ -139,3 +140,41 @@ def test_boss_movement():
     
     # Boss should have moved
     assert boss.rect.x != initial_x
+
+def test_missile_explosion_plays_and_ends():
+    """Missile shockwave renders on demand and removes itself after its last frame"""
+    from src.entities.missile_explosion import MissileExplosion
+    explosion = MissileExplosion(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+    group = pygame.sprite.Group(explosion)
+
+    assert explosion.image.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
+    assert explosion.rect.center == (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+
+    for _ in range(int(MissileExplosion.FRAME_COUNT / explosion.animation_speed) - 1):
+        group.update()
+    assert explosion.alive()
+
+    group.update()
+    assert not explosion.alive()
+
+def test_entity_render_interpolation():
+    """Entities are drawn between their previous and current tick positions"""
+    image = pygame.Surface((BULLET_WIDTH, BULLET_HEIGHT))
+    bullet = Bullet(100, 100, image, vx=0, vy=-10)
+
+    bullet.snapshot()
+    bullet.update()
+
+    assert bullet.interpolated_pos(0.0) == (100, 100)
+    assert bullet.interpolated_pos(0.5) == (100, 95)
+    assert bullet.interpolated_pos(1.0) == (100, 90)
+
+def test_interpolation_follows_center_through_resize():
+    """A sprite rebuilt around its center at a new size is drawn around that center"""
+    entity = Entity(45, 45, pygame.Surface((10, 10)))
+    entity.snapshot()
+    entity.image = pygame.Surface((20, 20))
+    entity.rect = entity.image.get_rect(center=entity.rect.center)
+
+    assert entity.interpolated_pos(0.5) == (40, 40)
+    assert entity.interpolated_pos(1.0) == entity.rect.topleft
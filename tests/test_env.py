@@ -0,0 +1,70 @@
+import numpy as np
+import pygame
+from src.sim.env import GameEnv, VectorGameEnv, MAX_ENTITIES, ENTITY_FEATURES, STATS, ACTIONS
+from src.sim.autopilot import MOVES
+from src.config import *
+
+# Mock pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+def test_env_observations_are_arrays():
+    """reset/step return fixed-shape NumPy observations"""
+    env = GameEnv(pixels=(80, 45))
+    observation = env.reset(3)
+
+    assert observation['entities'].shape == (MAX_ENTITIES, ENTITY_FEATURES)
+    assert observation['stats'].shape == (STATS,)
+    assert observation['pixels'].shape == (45, 80)
+
+    for _ in range(FPS * 3):
+        observation, reward, done, info = env.step(0)
+    assert (observation['entities'][:, 0] == 2).any()  # Asteroids have spawned
+    assert observation['pixels'].any()
+
+def test_env_action_moves_ship():
+    """Actions drive the ship through the input path"""
+    env = GameEnv()
+    observation = env.reset(3)
+    start_x = observation['stats'][0]
+
+    observation, reward, done, info = env.step(MOVES.index((-1, 0)))
+
+    assert observation['stats'][0] < start_x
+
+def test_vector_env_matches_across_processes():
+    """Worker processes with shared memory step exactly like in-process envs"""
+    actions = np.random.default_rng(0).integers(ACTIONS, size=(60, 4))
+    results = []
+    for workers in (None, 2):
+        envs = VectorGameEnv(4, workers=workers, frame_skip=2)
+        try:
+            envs.reset(range(4))
+            total = np.zeros(4)
+            for step_actions in actions:
+                observation, rewards, dones, infos = envs.step(step_actions)
+                total += rewards
+            results.append((observation['entities'].copy(), observation['stats'].copy(), total))
+        finally:
+            envs.close()
+
+    for local, remote in zip(results[0], results[1]):
+        assert np.array_equal(local, remote)
+
+def test_observations_outlive_later_steps_and_close():
+    """Returned observations are the caller's: later steps and close() leave them intact"""
+    env = GameEnv()
+    first = env.reset(3)
+    kept = first['stats'].copy()
+    env.step(MOVES.index((-1, 0)))
+    assert np.array_equal(first['stats'], kept)
+
+    envs = VectorGameEnv(2, workers=1)
+    try:
+        envs.reset([1, 2])
+        observation = envs.step([0, 0])[0]
+        kept = observation['stats'].copy()
+        envs.step([MOVES.index((-1, 0))] * 2)
+    finally:
+        envs.close()
+    assert np.array_equal(observation['stats'], kept)
@@ -0,0 +1,55 @@
+import pygame
+from unittest.mock import MagicMock
+import src.scenes.game_scene as game_scene
+from src.core.frame_stats import FrameStats, load_history, percentiles
+from src.scenes.game_scene import GameScene
+from src.scenes.game_over_scene import GameOverScene
+from src.sim.headless import HeadlessGame
+from src.config import *
+
+# Mock pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+def test_report_percentiles_and_levels():
+    """The report covers the whole game and each level separately"""
+    stats = FrameStats(budget_ms=16.0)
+    for ms in range(1, 101):
+        stats.record(float(ms), 1)
+    for _ in range(10):
+        stats.record(40.0, 2)
+
+    report = stats.report(score=5)
+    assert report['score'] == 5
+    assert report['frames'] == 110
+    assert report['max'] == 100.0
+    assert report['over_budget'] == 84 + 10
+    assert report['levels']['1']['p50'] == 50.0
+    assert report['levels']['1']['p95'] == 95.0
+    assert report['levels']['1']['p99'] == 99.0
+    assert report['levels']['2'] == {'frames': 10, 'p50': 40.0, 'p95': 40.0, 'p99': 40.0, 'max': 40.0, 'over_budget': 10}
+
+def test_small_sample_percentiles_below_max():
+    """Nearest-rank percentiles of a short level do not collapse to its max"""
+    p50, p95, p99 = percentiles([float(ms) for ms in range(1, 21)], (0.5, 0.95, 0.99))
+    assert (p50, p95, p99) == (10.0, 19.0, 20.0)
+
+def test_game_over_appends_history(tmp_path, monkeypatch):
+    """Ending a game files its frame report and hands it to GameOverScene"""
+    path = tmp_path / 'frame_stats.jsonl'
+    monkeypatch.setattr(game_scene, 'FRAME_STATS_FILE', str(path))
+    game = HeadlessGame(seed=4)
+    game.db_manager = MagicMock()
+    game.db_manager.load_top_scores.return_value = []
+    scene = game.new_scene(seed=4)
+    for ms in (10.0, 12.0, 30.0):
+        scene.frame_stats.record(ms, scene.level)
+
+    GameScene.end_game(scene)
+    history = load_history(path)
+    assert len(history) == 1
+    assert history[0]['seed'] == 4
+    assert history[0]['frames'] == 3
+    assert history[0]['over_budget'] == 1
+    assert isinstance(game.state_manager.current_scene, GameOverScene)
+    assert game.state_manager.current_scene.frame_report == history[0]
@@ -2,7 +2,10 @@ import pygame
 import pytest
 from unittest.mock import MagicMock, Mock
 from src.scenes.game_scene import GameScene
-from src.config import BOSS_SPAWN_SCORE_INITIAL, BOSS_SPAWN_GAP_INITIAL, BOSS_SPAWN_GAP_DECREASE, BOSS_SPAWN_GAP_MIN, LEVEL_SCORE_THRESHOLD
+from src.entities.entity import Entity
+from src.core.clock import GameClock
+from src.core.rng import RandomStreams
+from src.config import SHOOTER_START_SCORE, BOSS_SPAWN_SCORE_INITIAL, BOSS_SPAWN_GAP_INITIAL, BOSS_SPAWN_GAP_DECREASE, BOSS_SPAWN_GAP_MIN, LEVEL_SCORE_THRESHOLD
 
 # Mock pygame
 pygame.init()
@@ -13,6 +16,8 @@ class MockGame:
     def __init__(self):
         self.asset_manager = MagicMock()
         self.state_manager = MagicMock()
+        self.clock = GameClock(pygame.time.get_ticks)
+        self.rng = RandomStreams()
         
         # Create mock assets
         mock_surface = pygame.Surface((50, 50))
@@ -400,3 +405,104 @@ def test_spaceship_speed_progression():
         if i < 5:
             scene.spaceship.upgrade()
 
+
+def test_offscreen_entities_are_culled():
+    """Asteroids, powerups, chasers and shooters are removed after leaving the screen"""
+    from src.config import SCREEN_HEIGHT
+    from src.entities.asteroid import Asteroid
+    from src.entities.powerup import PowerUp
+    from src.entities.chaser import Chaser
+    from src.entities.shooter import Shooter
+    game = MockGame()
+    scene = GameScene(game)
+    image = game.asset_manager.assets['chaser_img']
+
+    entities = [
+        (Asteroid(image, 5), scene.asteroids),
+        (PowerUp(image, 'ammo'), scene.powerups),
+        (Chaser(0, 0, image, scene.spaceship), scene.chasers),
+        (Shooter(0, 0, image, image), scene.shooters),
+    ]
+    for entity, group in entities:
+        entity.rect.top = SCREEN_HEIGHT + 1
+        group.add(entity)
+        scene.all_sprites.add(entity)
+
+    scene.culler.cull()
+
+    for entity, group in entities:
+        assert not entity.alive()
+    counts = scene.culler.live_counts()
+    assert counts['asteroids'] == counts['powerups'] == counts['chasers'] == counts['shooters'] == 0
+    assert scene.culler.stats()['culled']['powerups'] == 1
+
+def test_dodged_asteroid_scores_point():
+    """An asteroid leaving the bottom of the screen is culled and scores one point"""
+    from src.config import SCREEN_HEIGHT
+    from src.entities.asteroid import Asteroid
+    game = MockGame()
+    scene = GameScene(game)
+    asteroid = Asteroid(game.asset_manager.assets['asteroid_images'][0], 5)
+    asteroid.rect.x = 0
+    asteroid.rect.y = SCREEN_HEIGHT
+    scene.asteroids.add(asteroid)
+    scene.all_sprites.add(asteroid)
+
+    scene.update()
+
+    assert not asteroid.alive()
+    assert scene.score == 1
+
+def test_boss_projectiles_move_once_per_frame():
+    """Boss projectiles are registered through the spawn queue and advance once per update"""
+    from src.config import BOSS_PROJECTILE_SPEED
+    game = MockGame()
+    scene = GameScene(game)
+
+    scene.score = BOSS_SPAWN_SCORE_INITIAL
+    scene.update()
+    boss = list(scene.bosses)[0]
+    boss.shoot()
+    assert len(scene.spawn_queue) == boss.projectile_count
+
+    scene.update()
+    assert len(scene.spawn_queue) == 0
+    assert len(scene.enemy_projectiles) == boss.projectile_count
+    projectile = list(scene.enemy_projectiles)[0]
+    assert projectile in scene.all_sprites
+
+    start_y = projectile.rect.y
+    scene.update()
+    assert projectile.rect.y == start_y + BOSS_PROJECTILE_SPEED
+
+def test_render_interpolates_sprites():
+    """Sprites are drawn halfway between their last two tick centers at interpolation 0.5"""
+    game = MockGame()
+    scene = GameScene(game)
+    screen = pygame.Surface((800, 600))
+    image = pygame.Surface((10, 10))
+    image.fill((255, 0, 0))
+    sprite = Entity(0, 0, image)
+    sprite.rect.center = (200, 300)
+    sprite.prev_center = (100, 300)
+    scene.all_sprites.empty()
+    scene.all_sprites.add(sprite)
+
+    scene.interpolation = 0.5
+    scene.render(screen)
+
+    assert screen.get_at((150, 300)) == (255, 0, 0)
+    assert screen.get_at((100, 300)) != (255, 0, 0)
+    assert screen.get_at((200, 300)) != (255, 0, 0)
+
+def test_shooter_spawns_late_game():
+    """Shooters spawn once the score passes SHOOTER_START_SCORE"""
+    game = MockGame()
+    scene = GameScene(game)
+    scene.score = SHOOTER_START_SCORE
+    scene.next_boss_score = SHOOTER_START_SCORE * 10
+    scene.rng.random = lambda: 0.0  # Every spawn roll succeeds
+
+    scene.update()
+
+    assert len(scene.shooters) == 1
@@ -0,0 +1,99 @@
+import pygame
+from src.sim.headless import HeadlessGame
+from src.sim.input import IdleInput, KeyState
+from src.config import *
+
+# Mock pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+class HoldKeys(IdleInput):
+    def __init__(self, *keys):
+        self.keys = KeyState(keys)
+
+def test_headless_clock_advances_per_tick():
+    """Game time advances exactly one tick per update, independent of wall time"""
+    game = HeadlessGame()
+    start = game.clock.get_ticks()
+    stats = game.run(FPS)
+
+    assert stats['ticks'] == FPS
+    assert game.clock.get_ticks() - start == 1000
+    assert stats['simulated_time'] == 1.0
+
+def test_headless_run_stops_at_game_over():
+    """The run ends at game over instead of switching to GameOverScene"""
+    game = HeadlessGame()
+    scene = game.new_scene()
+    scene.lives = 1
+    scene.end_game()
+
+    assert scene.game_over
+    assert game.state_manager.current_scene is scene
+
+def test_headless_controls_drive_spaceship():
+    """Held keys from the input provider move the spaceship"""
+    game = HeadlessGame()
+    scene = game.new_scene(HoldKeys(pygame.K_LEFT))
+    start_x = scene.spaceship.rect.x
+    game.tick()
+
+    assert scene.spaceship.rect.x == start_x - scene.spaceship.speed
+
+class FireEverySecond(IdleInput):
+    """Holds right and taps space once per simulated second"""
+    def __init__(self):
+        self.keys = KeyState([pygame.K_RIGHT])
+        self.tick = 0
+
+    def get_events(self):
+        self.tick += 1
+        if self.tick % FPS == 0:
+            return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)]
+        return []
+
+def entity_counts(scene):
+    return (len(scene.asteroids), len(scene.bullets), len(scene.powerups), len(scene.enemy_projectiles))
+
+def test_same_seed_same_game():
+    """The same seed and inputs replay the same game"""
+    game = HeadlessGame()
+    results = []
+    for _ in range(2):
+        stats = game.run(FPS * 30, FireEverySecond(), seed=1234)
+        scene = game.state_manager.current_scene
+        results.append((stats['score'], stats['lives'], stats['ticks'], entity_counts(scene)))
+
+    assert results[0] == results[1]
+
+def test_cosmetic_draws_do_not_shift_gameplay():
+    """Extra cosmetic randomness leaves gameplay untouched"""
+    game = HeadlessGame()
+    scene = game.new_scene(seed=99)
+    for _ in range(FPS * 5):
+        game.tick()
+    expected = [(a.rect.x, a.rect.y) for a in scene.asteroids]
+
+    scene = game.new_scene(seed=99)
+    for _ in range(FPS * 5):
+        game.rng.cosmetic.random()
+        game.tick()
+
+    assert [(a.rect.x, a.rect.y) for a in scene.asteroids] == expected
+
+def test_games_in_one_process_stay_independent():
+    """Interleaving two headless games does not change either one"""
+    solo = HeadlessGame()
+    solo.new_scene(FireEverySecond(), seed=7)
+    for _ in range(FPS * 10):
+        solo.tick()
+    expected = entity_counts(solo.state_manager.current_scene)
+
+    first, second = HeadlessGame(), HeadlessGame()
+    first.new_scene(FireEverySecond(), seed=7)
+    second.new_scene(FireEverySecond(), seed=8)
+    for _ in range(FPS * 10):
+        first.tick()
+        second.tick()
+
+    assert entity_counts(first.state_manager.current_scene) == expected
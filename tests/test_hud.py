@@ -7,6 +7,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.ui.hud import HUD
 from src.utils.asset_manager import AssetManager
+from src.utils.text_cache import text_cache
 from src.config import *
 
 
@@ -69,7 +70,48 @@ def test_numeric_text_display():
     pygame.quit()
 
 
+def test_hud_recomposes_only_changed_values():
+    """Unchanged bars and score are reused; a changed value re-renders only its bar"""
+    pygame.init()
+    
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    hud = HUD(AssetManager())
+    hud.draw(screen, 3, 5, 12, 20, 150, 2, 1, 3)
+    bars = dict(hud.bars)
+    score_box = hud.score_box
+    
+    hud.draw(screen, 3, 5, 12, 20, 150, 2, 1, 3)
+    assert all(hud.bars[key][1] is bar for key, (_, bar) in bars.items())
+    assert hud.score_box is score_box
+    
+    # Spend one bullet
+    hud.draw(screen, 3, 5, 11, 20, 150, 2, 1, 3)
+    changed = [key for key, (_, bar) in bars.items() if hud.bars[key][1] is not bar]
+    assert len(changed) == 1
+    assert hud.bars[changed[0]][0] == (11 / 20, "11/20")
+    assert hud.score_box is score_box
+    
+    pygame.quit()
+
+def test_hud_values_skip_text_cache():
+    """Changing scores and counts are not added to the shared text cache"""
+    pygame.init()
+    
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    hud = HUD(AssetManager())
+    hud.draw(screen, 3, 5, 12, 20, 150, 2, 1, 3)
+    entries = text_cache.stats()['entries']
+    
+    for score in range(160, 200, 10):
+        hud.draw(screen, 3, 5, 11, 20, score, 2, 1, 3)
+    assert text_cache.stats()['entries'] == entries
+    
+    pygame.quit()
+
+
 if __name__ == "__main__":
     test_hud_rendering()
     test_numeric_text_display()
+    test_hud_recomposes_only_changed_values()
+    test_hud_values_skip_text_cache()
     print("\n✅ All HUD tests passed!")
@@ -0,0 +1,68 @@
+import pygame
+from src.core.pool import SpritePool
+from src.entities.bullet import Bullet
+from src.entities.enemy_projectile import EnemyProjectile
+from src.entities.boss import Boss
+from src.config import *
+
+# Mock pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+def test_killed_bullet_is_reused():
+    """A killed bullet is handed out again, re-initialised for its new shot"""
+    pool = SpritePool(Bullet, 4)
+    image = pygame.Surface((BULLET_WIDTH, BULLET_HEIGHT))
+    group = pygame.sprite.Group()
+
+    bullet = pool.acquire(100, 200, image, 0, -10)
+    group.add(bullet)
+    bullet.kill()
+    assert len(pool) == 1
+
+    reused = pool.acquire(300, 400, image, 5, -8.5)
+    assert reused is bullet
+    assert (reused.rect.x, reused.rect.y) == (300, 400)
+    assert (reused.vx, reused.vy) == (5, -8.5)
+    assert pool.stats()['hits'] == 1
+    assert pool.stats()['misses'] == 1
+
+def test_double_kill_releases_once():
+    """Killing a pooled sprite twice doesn't hand it out twice"""
+    pool = SpritePool(Bullet, 4)
+    image = pygame.Surface((BULLET_WIDTH, BULLET_HEIGHT))
+
+    bullet = pool.acquire(0, 0, image)
+    bullet.kill()
+    bullet.kill()
+
+    assert len(pool) == 1
+    assert pool.acquire(0, 0, image) is not pool.acquire(0, 0, image)
+
+def test_pool_cap():
+    """Idle sprites beyond the cap are dropped"""
+    pool = SpritePool(Bullet, 2)
+    image = pygame.Surface((BULLET_WIDTH, BULLET_HEIGHT))
+
+    bullets = [pool.acquire(0, 0, image) for _ in range(3)]
+    for bullet in bullets:
+        bullet.kill()
+
+    assert len(pool) == 2
+    assert pool.stats()['dropped'] == 1
+
+def test_boss_fires_pooled_projectiles():
+    """Boss projectiles come from the pool when one is provided"""
+    pool = SpritePool(EnemyProjectile, 16)
+    boss_image = pygame.Surface((BOSS_WIDTH, BOSS_HEIGHT))
+    projectile_image = pygame.Surface((10, 10))
+    boss = Boss(100, 100, boss_image, projectile_image, 'MEDIUM', projectile_pool=pool)
+
+    boss.shoot()
+    first_volley = list(boss.projectiles)
+    for projectile in first_volley:
+        projectile.kill()
+    boss.shoot()
+
+    assert set(boss.projectiles) == set(first_volley)
+    assert pool.stats()['hits'] == boss.projectile_count
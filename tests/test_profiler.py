@@ -0,0 +1,40 @@
+import pygame
+from src.core.profiler import FrameProfiler
+from src.sim.headless import HeadlessGame
+from src.ui.profiler_overlay import ProfilerOverlay
+from src.config import *
+
+# Mock pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+def test_frame_profiler_rolls_frames():
+    """Each frame files its phase times and the window keeps the newest frames"""
+    profiler = FrameProfiler(history=3)
+    for frame in range(5):
+        profiler.mark('update')
+        profiler.mark('draw')
+        profiler.end_frame(10.0 + frame)
+    assert list(profiler.frame_times) == [12.0, 13.0, 14.0]
+    assert len(profiler.frame_phases) == 3
+    assert set(profiler.recent_ms()) == {'update', 'draw'}
+    # Nothing carries over into the next frame
+    assert profiler.totals == {}
+
+def test_overlay_draws_scene_phases_and_groups():
+    """The overlay lists every phase the scene marked and its sprite groups"""
+    game = HeadlessGame(seed=1)
+    profiler = FrameProfiler()
+    game.phases = profiler
+    scene = game.new_scene(seed=1)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    for _ in range(30):
+        game.tick()
+        profiler.end_frame(16.0)
+
+    assert {'input', 'spawn', 'entities', 'collisions', 'background'} <= set(profiler.recent_ms())
+    overlay = ProfilerOverlay(profiler)
+    overlay.draw(screen, scene)
+    groups = [name for name, value in vars(scene).items() if isinstance(value, pygame.sprite.AbstractGroup)]
+    # A header, one line per phase and one per group
+    assert overlay.text.get_height() == (1 + len(profiler.recent_ms()) + len(groups)) * overlay.line_height
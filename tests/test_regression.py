@@ -0,0 +1,47 @@
+import pygame
+from src.sim.recording import Recording
+from src.sim.regression import main, load_baseline, save_baseline
+from src.config import *
+
+# Mock pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+def write_corpus(directory):
+    """Two short games: one idle, one strafing right and firing"""
+    Recording(1, 0.0, FPS * 5).save(directory / 'idle.stir')
+    entries = [(0, 0x02)] + [(tick, 0x30) for tick in range(0, FPS * 5, FPS // 2)]
+    Recording(2, 0.0, FPS * 5, entries).save(directory / 'strafe.stir')
+
+def test_regression_passes_against_own_baseline(tmp_path):
+    """A fresh baseline followed by an unchanged run passes"""
+    write_corpus(tmp_path)
+    baseline = tmp_path / 'baseline.json'
+
+    assert main([str(tmp_path), '--baseline', str(baseline), '--repeat', '1']) == 0
+    assert set(load_baseline(baseline)) == {'idle.stir', 'strafe.stir'}
+    assert main([str(tmp_path), '--baseline', str(baseline), '--repeat', '1', '--threshold', '0.9']) == 0
+
+def test_regression_fails_on_divergence(tmp_path):
+    """A different final state fails the run"""
+    write_corpus(tmp_path)
+    baseline = tmp_path / 'baseline.json'
+    main([str(tmp_path), '--baseline', str(baseline), '--repeat', '1'])
+
+    recordings = load_baseline(baseline)
+    recordings['strafe.stir']['state_hash'] = '0' * 16
+    save_baseline(baseline, recordings)
+
+    assert main([str(tmp_path), '--baseline', str(baseline), '--repeat', '1', '--threshold', '0.9']) == 1
+
+def test_regression_fails_on_slowdown(tmp_path):
+    """Throughput below the threshold fails the run"""
+    write_corpus(tmp_path)
+    baseline = tmp_path / 'baseline.json'
+    main([str(tmp_path), '--baseline', str(baseline), '--repeat', '1'])
+
+    recordings = load_baseline(baseline)
+    recordings['idle.stir']['ticks_per_sec'] *= 10
+    save_baseline(baseline, recordings)
+
+    assert main([str(tmp_path), '--baseline', str(baseline), '--repeat', '1']) == 1
@@ -0,0 +1,57 @@
+import pygame
+from src.utils.rotation_cache import RotationCache, rotation_cache
+from src.entities.missile import Missile
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Mock pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+def test_rotation_cache_hits_same_bucket():
+    """Angles within one bucket reuse the same rotated surface"""
+    cache = RotationCache(max_entries=8, angle_step=2)
+    surface = pygame.Surface((20, 40))
+
+    first = cache.get(surface, 45.2)
+    second = cache.get(surface, 45.8)
+
+    assert first is second
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+def test_rotation_cache_wraps_full_turn():
+    """0 and 360 degrees share a bucket"""
+    cache = RotationCache(max_entries=8, angle_step=2)
+    assert cache.bucket(0) == cache.bucket(360)
+    assert cache.bucket(-90) == cache.bucket(270)
+
+def test_rotation_cache_lru_eviction():
+    """Least recently used rotations are evicted past the size bound"""
+    cache = RotationCache(max_entries=2, angle_step=2)
+    surface = pygame.Surface((20, 40))
+
+    cache.get(surface, 0)
+    cache.get(surface, 90)
+    cache.get(surface, 0)  # Refresh 0 degrees
+    cache.get(surface, 180)  # Evicts 90 degrees
+
+    stats = cache.stats()
+    assert stats['entries'] == 2
+    assert stats['evictions'] == 1
+
+    cache.get(surface, 0)
+    assert cache.hits == 2
+    cache.get(surface, 90)
+    assert cache.misses == 4
+
+def test_missile_rotation_steady_state():
+    """A missile flying a straight line stops rotating after its first frame"""
+    rotation_cache.clear()
+    image = pygame.Surface((20, 40), pygame.SRCALPHA)
+    missile = Missile(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50, image)
+
+    for _ in range(10):
+        missile.update()
+
+    assert rotation_cache.misses == 1
+    assert rotation_cache.hits == 9
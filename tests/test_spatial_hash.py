@@ -0,0 +1,60 @@
+import random
+import pygame
+from src.core.spatial_hash import SpatialHash
+from src.entities.entity import Entity
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Mock pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+def make_group(count, size, seed):
+    rng = random.Random(seed)
+    image = pygame.Surface(size)
+    group = pygame.sprite.Group()
+    for _ in range(count):
+        group.add(Entity(rng.randint(-20, SCREEN_WIDTH), rng.randint(-20, SCREEN_HEIGHT), image))
+    return group
+
+def test_query_matches_brute_force():
+    """Grid queries return exactly the overlapping sprites, in group order"""
+    targets = make_group(300, (50, 50), seed=1)
+    grid = SpatialHash(cell_size=64)
+    grid.rebuild(targets)
+
+    probe = Entity(400, 300, pygame.Surface((120, 90)))
+    assert grid.spritecollide(probe, targets, False) == pygame.sprite.spritecollide(probe, targets, False)
+
+def test_groupcollide_matches_pygame_kill_semantics():
+    """Bullets are consumed by the first target hit, like pygame.sprite.groupcollide"""
+    expected_targets = make_group(200, (50, 50), seed=2)
+    expected_bullets = make_group(600, (5, 10), seed=3)
+    expected = pygame.sprite.groupcollide(expected_targets, expected_bullets, True, True)
+
+    targets = make_group(200, (50, 50), seed=2)
+    bullets = make_group(600, (5, 10), seed=3)
+    grid = SpatialHash(cell_size=64)
+    grid.rebuild(bullets, targets)
+    actual = grid.groupcollide(targets, bullets, True, True)
+
+    def positions(hits):
+        return [(t.rect.topleft, [b.rect.topleft for b in bs]) for t, bs in hits.items()]
+
+    assert positions(actual) == positions(expected)
+    assert len(targets) == len(expected_targets)
+    assert len(bullets) == len(expected_bullets)
+
+def test_query_filters_by_group():
+    """Sprites indexed from other groups are ignored"""
+    image = pygame.Surface((10, 10))
+    asteroids = pygame.sprite.Group(Entity(100, 100, image))
+    powerups = pygame.sprite.Group(Entity(100, 100, image))
+    grid = SpatialHash()
+    grid.rebuild(asteroids, powerups)
+
+    probe = Entity(95, 95, image)
+    assert grid.spritecollide(probe, asteroids, False) == asteroids.sprites()
+    expected = powerups.sprites()
+    assert grid.spritecollide(probe, powerups, True) == expected
+    assert len(powerups) == 0
+    assert grid.spritecollide(probe, powerups, False) == []
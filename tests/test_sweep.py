@@ -0,0 +1,48 @@
+import pygame
+import src.scenes.game_scene as game_scene
+from src import config
+from src.sim.sweep import apply_overrides, snapshot_defaults, parameter_grid, parse_param, run_sweep, summarize, write_csv
+from src.config import *
+
+# Mock pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+def test_overrides_reach_star_imports():
+    """Overrides rebind every module's copy and defaults restore them"""
+    names = ['DIFFICULTY_MULTIPLIER', 'BOSS_DIFFICULTY_TIERS.STRONG.projectile_count']
+    defaults = snapshot_defaults(names)
+    try:
+        apply_overrides({'DIFFICULTY_MULTIPLIER': 0.5, 'BOSS_DIFFICULTY_TIERS.STRONG.projectile_count': 9})
+        assert game_scene.DIFFICULTY_MULTIPLIER == 0.5
+        assert game_scene.BOSS_DIFFICULTY_TIERS['STRONG']['projectile_count'] == 9
+    finally:
+        apply_overrides({}, defaults)
+
+    assert game_scene.DIFFICULTY_MULTIPLIER == config.DIFFICULTY_MULTIPLIER == 0.9
+    assert config.BOSS_DIFFICULTY_TIERS['STRONG']['projectile_count'] == 4
+
+def test_parameter_grid():
+    """The grid covers every combination of the given values"""
+    params = dict([parse_param('ASTEROID_SPAWN_RATE_MIN=200,300'), parse_param('BOSS_SPAWN_GAP_MIN=100,150,200')])
+    grid = parameter_grid(params)
+
+    assert len(grid) == 6
+    assert {'ASTEROID_SPAWN_RATE_MIN': 300, 'BOSS_SPAWN_GAP_MIN': 150} in grid
+
+def test_summary_score_percentiles():
+    """Score percentiles in a sweep row are nearest-rank over the seeds"""
+    results = [{'survival': 1.0, 'score': score, 'game_over': False, 'level': 1, 'peak_total': 0, 'peaks': {}}
+               for score in range(1, 11)]
+    row = summarize({}, results)
+    assert (row['score_p10'], row['score_p50'], row['score_p90']) == (1, 5, 9)
+
+def test_sweep_writes_one_row_per_combination(tmp_path):
+    """A small sweep across two workers aggregates every seed per combination"""
+    rows = run_sweep({'ASTEROID_SPAWN_RATE_INITIAL': [500, 1500]}, range(2), FPS * 2, workers=2)
+    write_csv(tmp_path / 'sweep.csv', rows)
+
+    assert [row['ASTEROID_SPAWN_RATE_INITIAL'] for row in rows] == [500, 1500]
+    assert all(row['runs'] == 2 for row in rows)
+    assert rows[0]['peak_asteroids'] >= rows[1]['peak_asteroids']
+    assert len((tmp_path / 'sweep.csv').read_text().splitlines()) == 3
@@ -0,0 +1,47 @@
+import pygame
+from src.utils.text_cache import TextCache
+from src.utils.helpers import split_text, _split_text
+
+# Mock pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+def test_text_cache_reuses_rendered_text():
+    """The same font, text, antialias and color render once"""
+    cache = TextCache()
+    font = pygame.font.Font(None, 30)
+
+    first = cache.render(font, "Game Over!", True, (255, 0, 0))
+    second = cache.render(font, "Game Over!", True, [255, 0, 0])
+    other_color = cache.render(font, "Game Over!", True, (255, 255, 255))
+
+    assert first is second
+    assert other_color is not first
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+def test_text_cache_evicts_by_memory():
+    """Least recently used text is evicted once the byte budget is exceeded"""
+    font = pygame.font.Font(None, 30)
+    size = font.render("1000", True, (255, 255, 255))
+    cache = TextCache(max_bytes=size.get_pitch() * size.get_height() * 2)
+
+    cache.render(font, "1000", True, (255, 255, 255))
+    cache.render(font, "2000", True, (255, 255, 255))
+    cache.render(font, "1000", True, (255, 255, 255))  # Refresh 1000
+    cache.render(font, "3000", True, (255, 255, 255))
+
+    assert cache.evictions == 1
+    assert cache.bytes <= cache.max_bytes
+    cache.render(font, "1000", True, (255, 255, 255))
+    assert cache.hits == 2
+
+def test_split_text_is_memoized():
+    """Repeated wraps come from the cache as equal, independent lists"""
+    font = pygame.font.Font(None, 30)
+    first = split_text("The Moon is slowly moving away from Earth.", font, 200)
+    first.append("mutated")
+    hits = _split_text.cache_info().hits
+    second = split_text("The Moon is slowly moving away from Earth.", font, 200)
+    assert _split_text.cache_info().hits == hits + 1
+    assert second == first[:-1]
@@ -0,0 +1,38 @@
+import json
+import pygame
+from src.core.trace import Tracer
+from src.sim.headless import HeadlessGame
+from src.sim.autopilot import Autopilot
+from src.config import *
+
+# Mock pygame
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+def test_trace_is_valid_json_with_balanced_spans(tmp_path):
+    """A traced game writes loadable trace events whose spans all close"""
+    path = tmp_path / 'trace.json'
+    tracer = Tracer(str(path), flush_every=64)
+    game = HeadlessGame(seed=2)
+    game.state_manager.trace = tracer
+    game.phases = tracer
+    scene = game.new_scene(Autopilot(), seed=2)
+    scene.score = CHASER_START_SCORE
+    for _ in range(120):
+        tracer.push('HeadlessGameScene.update')
+        game.tick()
+        tracer.pop()
+    tracer.close()
+
+    events = json.loads(path.read_text())
+    depth = 0
+    for event in events:
+        if event['ph'] == 'B':
+            depth += 1
+        elif event['ph'] == 'E':
+            depth -= 1
+            assert depth >= 0
+    assert depth == 0
+    names = {event.get('name') for event in events if event['ph'] == 'i'}
+    assert {'scene_change', 'boss_spawn', 'chaser_spawn'} <= names
+    assert any(event['ph'] == 'B' and event.get('cat') == 'phase' and event['name'] == 'collisions' for event in events)
@@ -1,5 +1,6 @@
 import pygame
-from src.utils.helpers import split_text
+from src.utils.helpers import split_text, convert_surface
+from src.utils.fonts import get_font
 
 def test_split_text():
     pygame.font.init()
@@ -9,3 +10,27 @@ def test_split_text():
     lines = split_text(text, font, 100)
     assert isinstance(lines, list)
     assert len(lines) > 1
+
+def test_font_registry_shares_fonts():
+    """One Font per size, reloaded after every pygame.quit()"""
+    pygame.init()
+    font = get_font(30)
+    assert get_font(30) is font
+    assert get_font(31) is not font
+    for _ in range(2):
+        pygame.quit()
+        pygame.init()
+        reloaded = get_font(30)
+        assert reloaded is not font
+        assert reloaded.render("Score", True, (255, 255, 255)).get_width() > 0
+        font = reloaded
+
+def test_convert_surface_matches_display():
+    """Alpha surfaces keep per-pixel alpha, opaque ones take the display format"""
+    pygame.init()
+    screen = pygame.display.set_mode((1, 1))
+    alpha = convert_surface(pygame.Surface((4, 4), pygame.SRCALPHA))
+    opaque = convert_surface(pygame.Surface((4, 4), 0, 16))
+    assert alpha.get_flags() & pygame.SRCALPHA
+    assert opaque.get_bitsize() == screen.get_bitsize()
+    assert opaque.get_masks() == screen.get_masks()